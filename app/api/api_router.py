@@ -1,6 +1,14 @@
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import Response
 from api.v1.router import v1_router
 from core.common.api_models import APIResponse
+from core.security.password_hasher import password_hasher
+from core.security.token_cache import token_cache
+from core.cache.response_cache import response_cache
+from core.common.compression import compression_stats
+from core.cache.timeline_cache import timeline_cache
+from database.database import engine, replica_router
+from utils.metrics import PROMETHEUS_CONTENT_TYPE, CollectedMetric, registry, stats_metrics
 
 routers = APIRouter(prefix="/api")
 
@@ -17,6 +25,95 @@ async def health():
         data="Server health is now good."
     )
 
+@routers.get(
+    "/health/password-hasher",
+    tags=["System"]
+)
+async def password_hasher_health():
+    return APIResponse(
+        success=True,
+        message="Password hasher stats are fetched",
+        data=password_hasher.stats()
+    )
+
+@routers.get(
+    "/health/token-cache",
+    tags=["System"]
+)
+async def token_cache_health():
+    return APIResponse(
+        success=True,
+        message="Token cache stats are fetched",
+        data=token_cache.stats()
+    )
+
+@routers.get(
+    "/health/cache",
+    tags=["System"]
+)
+async def response_cache_health():
+    return APIResponse(
+        success=True,
+        message="Response cache stats are fetched",
+        data=response_cache.stats()
+    )
+
+@routers.get(
+    "/health/db",
+    tags=["System"]
+)
+async def db_pool_health():
+    return APIResponse(
+        success=True,
+        message="Database pool stats are fetched",
+        data={"primary": engine.pool.stats(), **replica_router.stats()}
+    )
+
+@routers.get(
+    "/health/compression",
+    tags=["System"]
+)
+async def compression_health():
+    return APIResponse(
+        success=True,
+        message="Compression stats are fetched",
+        data=compression_stats.stats()
+    )
+
+@registry.collector
+def _component_metrics():
+    # Mevcut stats() sözlükleri scrape anında okunur; sıcak yola ek maliyet yok.
+    metrics = [
+        *stats_metrics("response_cache", "Response cache", response_cache.stats()),
+        *stats_metrics("timeline_cache", "Feed timeline cache", timeline_cache.stats()),
+        *stats_metrics("token_cache", "JWT token cache", token_cache.stats()),
+        *stats_metrics("password_hasher", "Password hasher", password_hasher.stats()),
+        *stats_metrics("db_pool", "DB connection pool", engine.pool.stats(), engine="primary")
+    ]
+    replicas = replica_router.stats()
+    metrics += stats_metrics("replica_router", "Replica router", replicas)
+    for replica in replicas["replicas"]:
+        metrics += stats_metrics("replica", "Read replica", replica, replica=replica["name"])
+        metrics += stats_metrics("db_pool", "DB connection pool", replica["pool"], engine=replica["name"])
+
+    compression = compression_stats.stats()
+    metrics += stats_metrics("compression", "Response compression", compression)
+    for encoding, values in compression["encodings"].items():
+        metrics += stats_metrics("compression", "Response compression", values, encoding=encoding)
+    available = CollectedMetric("compression_codec_available", "Compression codecs usable for negotiation")
+    for encoding in compression["available"]:
+        available.add(1, encoding=encoding)
+    metrics.append(available)
+    return metrics
+
+@routers.get(
+    "/metrics",
+    tags=["System"],
+    include_in_schema=False
+)
+async def metrics():
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 def setup_routers(app: FastAPI):
     for r in versioned_routers:
         routers.include_router(router=r)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
-from api.v1.routers import auth, user, post
+from api.v1.routers import auth, user, post, comment, admin
 
 v1_router = APIRouter(prefix="/v1")
 
 v1_router.include_router(router=auth.router)
 v1_router.include_router(router=user.router)
-v1_router.include_router(router=post.router)
\ No newline at end of file
+v1_router.include_router(router=post.router)
+v1_router.include_router(router=comment.router)
+v1_router.include_router(router=admin.router)
\ No newline at end of file
@@ -0,0 +1,45 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.common.compression import compress
+from core.common.data_formats import MEDIA_TYPES, iter_text_file
+from core.enums.permission import UserRole
+from core.security.auth import required_roles
+from controllers.import_controller import import_controller
+from services.export_service import ExportService, stream_export
+from validators.admin_models import ExportKind, ImportKind
+
+from database.database import get_db
+
+router = APIRouter(
+    prefix="/Admin",
+    tags=["Admin"],
+    dependencies=[required_roles(UserRole.ADMIN)]
+)
+
+@router.post("/import/{kind}")
+async def import_data(
+    kind: ImportKind,
+    request: Request,
+    format: Optional[str] = Query(default=None, pattern="^(ndjson|csv)$"),
+    _db: AsyncSession = Depends(get_db)
+):
+    report = await import_controller.with_service(_db).import_stream(
+        kind, request.stream(), request.headers.get("content-type"), format
+    )
+    return StreamingResponse(iter_text_file(report), media_type=MEDIA_TYPES["ndjson"])
+
+@router.get("/export/{kind}")
+@compress(level=1)
+async def export_data(
+    kind: ExportKind,
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+    columns: Optional[str] = Query(default=None, description="Comma separated column projection")
+):
+    selected = ExportService.resolve_columns(kind, columns)
+    return StreamingResponse(
+        stream_export(kind, format, selected),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{kind.value}.{format}"'}
+    )
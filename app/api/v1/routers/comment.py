@@ -0,0 +1,29 @@
+from typing import Optional
+from uuid import UUID
+from fastapi import Depends, Query
+from core.common.base_router import BaseRouter
+from sqlalchemy.ext.asyncio import AsyncSession
+from controllers.comment_controller import comment_controller as ctrl
+
+from database.database import get_read_db
+
+router = BaseRouter(prefix="/Comment", tags=["Comment"])
+
+@router.get("/post/{post_id}")
+async def get_thread(
+    post_id: UUID,
+    size: int = Query(default=20, le=100),
+    reply_size: int = Query(default=3, ge=1, le=50),
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_thread(post_id, size, reply_size, cursor)
+
+@router.get("/{comment_id}/replies")
+async def get_replies(
+    comment_id: UUID,
+    size: int = Query(default=20, le=100),
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_replies(comment_id, size, cursor)
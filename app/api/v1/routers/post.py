@@ -1,31 +1,68 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from typing import List, Optional
+from uuid import UUID
+from fastapi import Depends, Query
+from core.common.base_router import BaseRouter
 from sqlalchemy.ext.asyncio import AsyncSession
-from core.security.auth import get_current_user
+from core.security.auth import get_current_user, get_optional_user
+from core.cache.response_cache import CachedRoute, cache_response
 from validators.auth_models import JwtPayload
 from validators.post_models import PostRequest
 from controllers.post_controller import post_controller as ctrl
 
-from database.database import get_db
+from database.database import AsyncSessionLocal, get_db, get_read_db
 
-router = APIRouter(prefix="/Post", tags=["Post"])
+router = BaseRouter(prefix="/Post", tags=["Post"], route_class=CachedRoute)
+
+def _is_first_page(request) -> bool:
+    return not request.query_params.get("cursor") and request.query_params.get("offset", "0") == "0"
+
+def _post_list_tags(request, body) -> List[str]:
+    return ["posts"] + [f"post:{p['id']}" for p in body.get("data") or []]
+
+async def _post_version(request) -> Optional[str]:
+    try:
+        post_id = UUID(request.path_params["post_id"])
+    except ValueError:
+        return None
+    async with AsyncSessionLocal() as db:
+        return await ctrl.with_service(db).get_post_version(post_id)
 
 @router.get("")
+@cache_response(tags=_post_list_tags, when=_is_first_page, cache_control="public, max-age=0, s-maxage=30")
 async def get_all_posts(
     size: int = Query(default=50, le=100),
     offset: int = Query(default=0),
     tags: List[str] =  Query(default=[]),
     search: str = Query(default="", max_length=255),
-    _db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(default=None),
+    _claims: Optional[JwtPayload] = Depends(get_optional_user),
+    _db: AsyncSession = Depends(get_read_db)
 ):
-    return await ctrl.with_service(_db).get_all_posts(size, offset, tags, search)
+    viewer_id = _claims.user_id if _claims else None
+    return await ctrl.with_service(_db).get_all_posts(size, offset, tags, search, cursor, viewer_id)
+
+@router.get("/feed")
+async def get_feed(
+    size: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None),
+    _claims: JwtPayload = Depends(get_current_user),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_feed(_claims, size, cursor)
 
 @router.get("/{post_id}")
+@cache_response(
+    tags=lambda request, body: [f"post:{request.path_params['post_id']}"],
+    version=_post_version,
+    cache_control="public, max-age=0, s-maxage=300"
+)
 async def get_post(
-    post_id: str,
-    _db: AsyncSession = Depends(get_db)
+    post_id: UUID,
+    _claims: Optional[JwtPayload] = Depends(get_optional_user),
+    _db: AsyncSession = Depends(get_read_db)
 ):
-    return await ctrl.with_service(_db).get_post(post_id)
+    viewer_id = _claims.user_id if _claims else None
+    return await ctrl.with_service(_db).get_post(post_id, viewer_id)
 
 @router.post("")
 async def create_post(
@@ -37,7 +74,7 @@ async def create_post(
 
 @router.patch("/{post_id}")
 async def update_post(
-    post_id: str,
+    post_id: UUID,
     req: PostRequest,
     _claims: JwtPayload = Depends(get_current_user),
     _db: AsyncSession = Depends(get_db)
@@ -46,7 +83,7 @@ async def update_post(
 
 @router.delete("/{post_id}")
 async def delete_post(
-    post_id: str,
+    post_id: UUID,
     _claims: JwtPayload = Depends(get_current_user),
     _db: AsyncSession = Depends(get_db)
 ):
@@ -54,9 +91,9 @@ async def delete_post(
 
 @router.patch("/{post_id}/upvote")
 async def upvote_post(
-    post_id: str,
+    post_id: UUID,
     _claims: JwtPayload = Depends(get_current_user),
     _db: AsyncSession = Depends(get_db)
 ):
-    return await ctrl.with_service(_db).upvote_post(post_id, _claims.username)
+    return await ctrl.with_service(_db).upvote_post(post_id, _claims.user_id)
 
@@ -1,26 +1,34 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from fastapi import Depends, Query
+from core.common.base_router import BaseRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 from validators.auth_models import JwtPayload
 from core.enums.permission import UserRole
 from core.security.auth import get_current_user, required_roles
-from database.database import get_db
+from core.cache.response_cache import CachedRoute, cache_response
+from database.database import AsyncSessionLocal, get_db, get_read_db
 from controllers.user_controller import user_controller as ctrl
 from validators.user_models import (
     UpdateUserRequest
 )
 
-router = APIRouter(prefix="/User", tags=["User"])
+router = BaseRouter(prefix="/User", tags=["User"], route_class=CachedRoute)
+
+async def _user_version(request) -> Optional[str]:
+    async with AsyncSessionLocal() as db:
+        return await ctrl.with_service(db).get_user_version(request.path_params["username"])
 
 @router.get("")
 async def get_all_users(
     size: int = Query(default=50, le=100),
     offset: int = Query(default=0),
-    _db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
 ):
-    return await ctrl.with_service(_db).get_all_users(size, offset)
+    return await ctrl.with_service(_db).get_all_users(size, offset, cursor)
 
 @router.get("/me")
-async def get_me(_claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_db)):
+async def get_me(_claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_read_db)):
     return await ctrl.with_service(_db).get_user(_claims.username)
 
 @router.patch("/me")
@@ -28,7 +36,13 @@ async def get_me(payload: UpdateUserRequest, _claims: JwtPayload = Depends(get_c
     return await ctrl.with_service(_db).update_user(_claims.username, payload)
 
 @router.get("/{username}")
-async def get_user(username: str, _db: AsyncSession = Depends(get_db)):
+@cache_response(
+    tags=lambda request, body: [f"user:{request.path_params['username']}"],
+    vary_auth=False,
+    version=_user_version,
+    cache_control="public, max-age=0, s-maxage=300"
+)
+async def get_user(username: str, _db: AsyncSession = Depends(get_read_db)):
     return await ctrl.with_service(_db).get_user(username)
 
 @router.patch(
@@ -39,29 +53,44 @@ async def update_user(username: str, payload: UpdateUserRequest, _db: AsyncSessi
     return await ctrl.with_service(_db).update_user(username, payload)
 
 @router.get("/followers/{username}")
-async def get_followed_users(username: str, _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).get_followers(username)
+async def get_followers(
+    username: str,
+    size: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_followers(username, size, cursor)
 
 @router.get("/followed-users/{username}")
-async def get_followed_users(username: str, _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).get_followed_users(username)
+async def get_followed_users(
+    username: str,
+    size: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_followed_users(username, size, cursor)
 
 @router.patch("/followed-users/{target}")
 async def follow_user(target: str, _claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).follow_user(_claims.username, target)
+    return await ctrl.with_service(_db).follow_user(target, _claims)
 
 @router.delete("/followed-users/{target}")
 async def unfollow_user(target: str, _claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).unfollow_user(_claims.username, target)
+    return await ctrl.with_service(_db).unfollow_user(target, _claims)
 
 @router.get("/followed-tags/{username}")
-async def get_followed_users(username: str, _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).get_followed_tags(username)
+async def get_followed_tags(
+    username: str,
+    size: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None),
+    _db: AsyncSession = Depends(get_read_db)
+):
+    return await ctrl.with_service(_db).get_followed_tags(username, size, cursor)
 
 @router.patch("/followed-tags/{target}")
 async def follow_tag(target: str, _claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).follow_tag(_claims.username, target)
+    return await ctrl.with_service(_db).follow_tag(_claims.user_id, target)
 
 @router.delete("/followed-tags/{target}")
 async def unfollow_tag(target: str, _claims: JwtPayload = Depends(get_current_user), _db: AsyncSession = Depends(get_db)):
-    return await ctrl.with_service(_db).unfollow_user(_claims.username, target)
\ No newline at end of file
+    return await ctrl.with_service(_db).unfollow_tag(_claims.user_id, target)
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+GET /Post/feed ilk sayfa gecikmesi, takip edilen kaynak sayısına göre.
+
+Her seviye için bir izleyici ve onun takip ettiği `sources` kullanıcı, her biri
+`--posts-per-source` gönderiyle üretilir. `PostService.get_feed` iki durumda
+ölçülür: "cold" her turdan önce izleyicinin zaman çizelgesini önbellekten
+düşürür (feed_keys sorgusu dahil), "warm" önbellekten sayfalar. Üretilen
+satırlar seviye sonunda silinir.
+
+    cd app && python -m benchmarks.feed_latency --sources 10,1000,10000 --size 20 --rounds 200
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.report import Table, percentile
+from benchmarks.seed import cleanup, new_prefix, seed_follows, seed_posts, seed_users
+from core.cache.timeline_cache import timeline_cache
+from database.database import AsyncSessionLocal, engine
+from services.post_service import PostService
+from validators.auth_models import JwtPayload
+
+
+async def measure(claims: JwtPayload, size: int, rounds: int, cold: bool) -> dict:
+    latencies = []
+    items = 0
+    for _ in range(rounds):
+        if cold:
+            timeline_cache.invalidate(claims.user_id)
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            response = await PostService(db).get_feed(claims, size)
+            latencies.append(time.perf_counter() - started)
+        items = len(response.data)
+    return {
+        "items": items,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000
+    }
+
+
+async def run_level(sources: int, posts_per_source: int, size: int, rounds: int) -> dict:
+    prefix = new_prefix(f"feed{sources}")
+    async with AsyncSessionLocal() as db:
+        (viewer_id,) = await seed_users(db, prefix + "v", 1)
+        await seed_users(db, prefix + "s", sources)
+        await seed_posts(db, prefix + "s", posts_per_source)
+        await seed_follows(db, prefix + "s", viewer_id, followers_of=False)
+        await db.commit()
+
+    now = datetime.now(timezone.utc)
+    claims = JwtPayload(
+        user_id=viewer_id,
+        username=f"{prefix}v1",
+        iat=now,
+        exp=now + timedelta(hours=1),
+        jti=uuid.uuid4()
+    )
+    try:
+        # Isınma: bağlantı ve hazırlanmış ifadeler ölçüme girmesin.
+        await measure(claims, size, 3, cold=True)
+        return {
+            "cold": await measure(claims, size, rounds, cold=True),
+            "warm": await measure(claims, size, rounds, cold=False)
+        }
+    finally:
+        timeline_cache.invalidate(viewer_id)
+        async with AsyncSessionLocal() as db:
+            await cleanup(db, prefix)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure home feed latency against the number of followed sources.")
+    parser.add_argument("--sources", default="10,1000,10000")
+    parser.add_argument("--posts-per-source", type=int, default=2)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    table = Table([("sources", 8), ("cache", 6)], ["items", "p50_ms", "p99_ms"])
+    table.header()
+    for sources in (int(v) for v in args.sources.split(",")):
+        result = await run_level(sources, args.posts_per_source, args.size, args.rounds)
+        for mode, row in result.items():
+            table.row([sources, mode], row)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
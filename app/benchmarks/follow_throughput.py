@@ -0,0 +1,83 @@
+"""
+Takip / takipten çıkma throughput'u, hedefin mevcut takipçi sayısına göre.
+
+Her seviye için bir hedef kullanıcı ve onu takip eden `level` kullanıcı
+üretilir; ardından `--ops` farklı kullanıcı hedefi `--concurrency` eşzamanlı
+oturumla takip eder ve takipten çıkar. Her işlem, uygulamadaki gibi tek
+transaction'da bağlantı satırı + iki sayaç güncellemesidir. Üretilen satırlar
+seviye sonunda silinir.
+
+    cd app && python -m benchmarks.follow_throughput --levels 10,1000,10000,100000 --ops 1000 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.report import Table, percentile
+from benchmarks.seed import cleanup, new_prefix, seed_follows, seed_users
+from database.database import AsyncSessionLocal, engine
+from repositories.user_repository import UserRepository
+
+
+async def run_ops(op, actor_ids, target_id, concurrency: int) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+    changed = 0
+
+    async def one(actor_id):
+        nonlocal changed
+        async with gate:
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                if await op(UserRepository(db), actor_id, target_id):
+                    changed += 1
+                await db.commit()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(a) for a in actor_ids))
+    elapsed = time.perf_counter() - started
+    return {
+        "changed": changed,
+        "ops_s": len(actor_ids) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000
+    }
+
+
+async def run_level(level: int, ops: int, concurrency: int) -> dict:
+    prefix = new_prefix(f"follow{level}")
+    async with AsyncSessionLocal() as db:
+        (target_id,) = await seed_users(db, prefix + "t", 1)
+        await seed_users(db, prefix + "f", level)
+        await seed_follows(db, prefix + "f", target_id)
+        actor_ids = await seed_users(db, prefix + "a", ops)
+        await db.commit()
+
+    try:
+        follow = await run_ops(UserRepository.append_followers, actor_ids, target_id, concurrency)
+        unfollow = await run_ops(UserRepository.pop_followers, actor_ids, target_id, concurrency)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await cleanup(db, prefix)
+    return {"follow": follow, "unfollow": unfollow}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure follow/unfollow throughput against existing follower counts.")
+    parser.add_argument("--levels", default="10,1000,10000,100000")
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    table = Table([("followers", 10), ("op", 9)], ["changed", "ops_s", "p50_ms", "p99_ms"])
+    table.header()
+    for level in (int(v) for v in args.levels.split(",")):
+        result = await run_level(level, args.ops, args.concurrency)
+        for op, row in result.items():
+            table.row([level, op], row)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
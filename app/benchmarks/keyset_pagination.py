@@ -0,0 +1,98 @@
+"""
+Kullanıcı listesinde OFFSET ile keyset sayfalamanın derin sayfalardaki maliyeti.
+
+Her sayfa numarası için aynı sayfa iki yoldan okunur: `list_rows` (OFFSET) ve
+`list_rows_page` (önceki sayfanın son (created_at, id) anahtarından cursor).
+Tabloda yeterli kullanıcı yoksa eksik kadarı öneklenmiş satırlarla üretilir
+ve sonunda silinir. Çıktı: sayfa başına ortalama/p99 gecikme.
+
+    cd app && python -m benchmarks.keyset_pagination --size 20 --pages 1,100,10000 --rounds 50
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import func, select
+
+from benchmarks.report import Table, percentile
+from benchmarks.seed import cleanup, new_prefix, seed_users
+from core.common.cursor import encode_cursor
+from database.database import AsyncSessionLocal, engine
+from database.models.user import User
+from repositories.user_repository import UserRepository
+
+
+async def cursor_for_page(page: int, size: int):
+    # Ölçüm dışı: sayfanın hemen öncesindeki satırdan cursor, istemcinin elindeki gibi.
+    if page <= 1:
+        return None
+    async with AsyncSessionLocal() as db:
+        res = await db.execute(
+            select(User.created_at, User.id)
+            .order_by(User.created_at.desc(), User.id.desc())
+            .offset((page - 1) * size - 1)
+            .limit(1)
+        )
+        return encode_cursor(*res.one())
+
+
+async def measure(fn, rounds: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        await fn(db)
+
+    latencies = []
+    for _ in range(rounds):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            rows = await fn(db)
+            latencies.append(time.perf_counter() - started)
+    return {
+        "rows": len(rows),
+        "avg_ms": sum(latencies) / len(latencies) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare OFFSET and keyset pagination on deep pages.")
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--pages", default="1,100,10000")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Do not delete seeded users afterwards.")
+    args = parser.parse_args()
+    pages = [int(p) for p in args.pages.split(",")]
+
+    prefix = new_prefix("keyset")
+    async with AsyncSessionLocal() as db:
+        existing = (await db.execute(select(func.count()).select_from(User))).scalar_one()
+        missing = max(pages) * args.size - existing
+        if missing > 0:
+            print(f"seeding {missing} users ({prefix}*)")
+            await seed_users(db, prefix, missing)
+            await db.commit()
+
+    try:
+        table = Table([("page", 8), ("mode", 8)], ["rows", "avg_ms", "p99_ms"])
+        table.header()
+        for page in pages:
+            cursor = await cursor_for_page(page, args.size)
+            offset = (page - 1) * args.size
+
+            async def by_offset(db):
+                return await UserRepository(db).list_rows(size=args.size, offset=offset)
+
+            async def by_keyset(db):
+                rows, _ = await UserRepository(db).list_rows_page(size=args.size, cursor=cursor)
+                return rows
+
+            for mode, fn in (("offset", by_offset), ("keyset", by_keyset)):
+                table.row([page, mode], await measure(fn, args.rounds))
+    finally:
+        if not args.keep:
+            async with AsyncSessionLocal() as db:
+                await cleanup(db, prefix)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+Liste sayfaları için tam ORM varlıkları ile kolon projeksiyonunun karşılaştırması.
+
+Her tur yeni bir oturumda bir sayfa okur ve yanıt sözlüklerini kurar.
+"orm": `select(User)` / `select(Post)` + ilişkiler (identity map, instance state,
+hashed_password ve içerik dahil). "rows": repository'nin projeksiyon sorguları.
+Çıktı: tur başına ortalama/p99 gecikme ve tracemalloc ile ölçülen tepe bellek.
+
+    cd app && python -m benchmarks.list_reads --size 100 --rounds 200
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload, undefer
+
+from benchmarks.report import Table, percentile
+from database.database import AsyncSessionLocal, engine
+from database.models.post import Post
+from database.models.user import User
+from repositories.post_repository import PostRepository
+from repositories.user_repository import UserRepository
+from services.post_service import PostService
+from services.user_service import UserService
+
+
+async def users_orm(db, size: int):
+    res = await db.execute(select(User).order_by(User.created_at.desc(), User.id.desc()).limit(size))
+    return [UserService._serialize(u) for u in res.scalars().all()]
+
+
+async def users_rows(db, size: int):
+    rows, _ = await UserRepository(db).list_rows_page(size)
+    return [UserService._serialize(r) for r in rows]
+
+
+async def posts_orm(db, size: int):
+    q = (
+        select(Post)
+        .options(joinedload(Post.creator), selectinload(Post.tags), undefer(Post.content))
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(size)
+    )
+    res = await db.execute(q)
+    return [PostService._serialize(p) for p in res.unique().scalars().all()]
+
+
+async def posts_rows(db, size: int):
+    repo = PostRepository(db)
+    rows, _ = await repo.list_summaries_page(size)
+    tags = await repo.fetch_tags_for([r.id for r in rows])
+    return [PostService._serialize_summary(r, tags.get(r.id, [])) for r in rows]
+
+
+async def measure(fn, size: int, rounds: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        await fn(db, size)
+
+    latencies = []
+    for _ in range(rounds):
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            await fn(db, size)
+            latencies.append(time.perf_counter() - started)
+
+    # Bellek ayrı bir turda ölçülür; tracemalloc gecikmeyi bozmasın.
+    tracemalloc.start()
+    async with AsyncSessionLocal() as db:
+        items = await fn(db, size)
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "items": len(items),
+        "avg_ms": sum(latencies) / len(latencies) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_kib": peak / 1024
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare ORM entity and column-projection list reads.")
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    cases = [
+        ("users/orm", users_orm),
+        ("users/rows", users_rows),
+        ("posts/orm", posts_orm),
+        ("posts/rows", posts_rows)
+    ]
+    table = Table([("case", 12)], ["items", "avg_ms", "p99_ms", "peak_kib"])
+    table.header()
+    for name, fn in cases:
+        table.row([name], await measure(fn, args.size, args.rounds))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
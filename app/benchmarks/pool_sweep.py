@@ -0,0 +1,92 @@
+"""
+Bağlantı havuzu boyutu × eşzamanlılık taraması.
+
+Her (pool_size, concurrency) çifti için ayrı bir engine açılır ve `--requests`
+adet sahte istek, her biri bir bağlantı alıp `--query-ms` süren bir sorgu
+çalıştırarak gönderilir. Çıktı: throughput, gecikme yüzdelikleri, havuz
+bekleme süresi ve timeout sayısı.
+
+    cd app && python -m benchmarks.pool_sweep --pool-sizes 5,10,20 --concurrency 10,50,200
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.report import Table, percentile
+from database.database import ASYNC_DATABASE_URL
+from database.pool import MonitoredQueuePool
+from utils.config import DB_POOL_TIMEOUT, DB_STATEMENT_CACHE_SIZE
+
+
+async def run_case(pool_size: int, max_overflow: int, concurrency: int, requests: int, query_ms: float) -> dict:
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        poolclass=MonitoredQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=False,
+        connect_args={
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE
+        }
+    )
+    stmt = text("SELECT pg_sleep(:s)")
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one():
+        nonlocal failures
+        async with gate:
+            started = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(stmt, {"s": query_ms / 1000})
+            except exc.TimeoutError:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    pool = engine.pool.stats()
+    await engine.dispose()
+    return {
+        "pool_size": pool_size,
+        "concurrency": concurrency,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "wait_avg_ms": pool["wait_time_avg"] * 1000,
+        "wait_max_ms": pool["wait_time_max"] * 1000,
+        "peak": pool["peak_checked_out"],
+        "timeouts": failures
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Sweep DB pool sizes against request concurrency.")
+    parser.add_argument("--pool-sizes", default="5,10,20,40")
+    parser.add_argument("--concurrency", default="10,50,100,200")
+    parser.add_argument("--max-overflow", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--query-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    table = Table([], [
+        "pool_size", "concurrency", "rps", "p50_ms", "p99_ms", "wait_avg_ms", "wait_max_ms", "peak", "timeouts"
+    ], width=12)
+    table.header()
+    for pool_size in (int(p) for p in args.pool_sizes.split(",")):
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            table.row([], await run_case(pool_size, args.max_overflow, concurrency, args.requests, args.query_ms))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
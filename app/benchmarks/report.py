@@ -0,0 +1,35 @@
+"""
+Benchmark betikleri için ortak ölçüm ve tablo çıktısı yardımcıları.
+"""
+from typing import Mapping, Sequence, Tuple
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct), len(values) - 1)]
+
+
+class Table:
+    """
+    Fixed-width result table: leading key columns followed by metric columns.
+    Floats are printed with two decimals, everything else as is.
+    """
+
+    def __init__(self, keys: Sequence[Tuple[str, int]], columns: Sequence[str], width: int = 10):
+        self.keys = keys
+        self.columns = columns
+        self.width = width
+
+    def _line(self, keys: Sequence, cells: Sequence[str]) -> str:
+        return " ".join([f"{k:>{w}}" for k, (_, w) in zip(keys, self.keys)] + list(cells))
+
+    def header(self):
+        print(self._line([name for name, _ in self.keys], [f"{c:>{self.width}}" for c in self.columns]))
+
+    def row(self, keys: Sequence, values: Mapping):
+        print(self._line(keys, [
+            f"{values[c]:>{self.width}.2f}" if isinstance(values[c], float) else f"{values[c]:>{self.width}}"
+            for c in self.columns
+        ]))
@@ -0,0 +1,110 @@
+"""
+Benchmark'lar için toplu veri üretimi.
+
+Satırlar generate_series ile tek ifadede yazılır ve kullanıcı adı / başlık
+önekiyle işaretlenir; `cleanup` yalnızca o öneğe ait satırları ve onlara
+bağlı takip, oy ve etiket kayıtlarını siler. Postgres 13+ (gen_random_uuid).
+"""
+import uuid
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.enums.permission import UserRole
+
+
+def new_prefix(name: str) -> str:
+    return f"bench_{name}_{uuid.uuid4().hex[:6]}_"
+
+
+def _like(prefix: str) -> str:
+    # Önekteki "_" LIKE'ta joker karakterdir.
+    return prefix.replace("\\", "\\\\").replace("_", "\\_").replace("%", "\\%") + "%"
+
+
+async def seed_users(db: AsyncSession, prefix: str, n: int, start: int = 1) -> List[UUID]:
+    """`n` kullanıcı; created_at milisaniye aralıklarla geriye gider, sıralama kararlı olur."""
+    if n <= 0:
+        return []
+    res = await db.execute(
+        text("""
+            INSERT INTO users (
+                id, username, email, hashed_password, first_name, last_name, roles,
+                created_at, followers_count, following_count, posts_count
+            )
+            SELECT gen_random_uuid(), :prefix || g, :prefix || g || '@bench.local', '!',
+                   'Bench', 'User', ARRAY[CAST(:role AS varchar)],
+                   now() - g * interval '1 millisecond', 0, 0, 0
+            FROM generate_series(CAST(:start AS int), CAST(:stop AS int)) AS g
+            ORDER BY g
+            RETURNING id
+        """),
+        {"prefix": prefix, "role": UserRole.DEFAULT.name, "start": start, "stop": start + n - 1}
+    )
+    return list(res.scalars().all())
+
+
+async def seed_posts(db: AsyncSession, prefix: str, per_user: int) -> int:
+    """Öneğe ait her kullanıcıya `per_user` gönderi; posts_count da güncellenir."""
+    res = await db.execute(
+        text("""
+            INSERT INTO posts (id, title, content, upvotes, created_at, creator_id)
+            SELECT gen_random_uuid(), :prefix || 'post_' || g, 'Benchmark post ' || g || ' by ' || u.username,
+                   0, now() - (g * 1000 + u.n) * interval '1 millisecond', u.id
+            FROM (
+                SELECT id, username, row_number() OVER (ORDER BY id) AS n
+                FROM users WHERE username LIKE :pattern
+            ) AS u
+            CROSS JOIN generate_series(1, CAST(:per_user AS int)) AS g
+        """),
+        {"prefix": prefix, "pattern": _like(prefix), "per_user": per_user}
+    )
+    await db.execute(
+        text("UPDATE users SET posts_count = posts_count + :per_user WHERE username LIKE :pattern"),
+        {"per_user": per_user, "pattern": _like(prefix)}
+    )
+    return res.rowcount
+
+
+async def seed_follows(db: AsyncSession, prefix: str, target_id: UUID, followers_of: bool = True) -> int:
+    """Öneğe ait tüm kullanıcılar `target_id`'yi takip eder (ya da tersi); sayaçlar da güncellenir."""
+    owner, related = ("user_id", "creator_id") if followers_of else ("creator_id", "user_id")
+    res = await db.execute(
+        text(f"""
+            INSERT INTO user_followed_users ({owner}, {related})
+            SELECT id, CAST(:target AS uuid) FROM users
+            WHERE username LIKE :pattern AND id <> CAST(:target AS uuid)
+            ON CONFLICT DO NOTHING
+        """),
+        {"target": target_id, "pattern": _like(prefix)}
+    )
+    target_counter, other_counter = (
+        ("followers_count", "following_count") if followers_of else ("following_count", "followers_count")
+    )
+    await db.execute(
+        text(f"UPDATE users SET {target_counter} = {target_counter} + :n WHERE id = :target"),
+        {"n": res.rowcount, "target": target_id}
+    )
+    await db.execute(
+        text(f"UPDATE users SET {other_counter} = {other_counter} + 1 WHERE username LIKE :pattern AND id <> :target"),
+        {"pattern": _like(prefix), "target": target_id}
+    )
+    return res.rowcount
+
+
+async def cleanup(db: AsyncSession, prefix: str):
+    pattern = {"pattern": _like(prefix)}
+    users = "SELECT id FROM users WHERE username LIKE :pattern"
+    posts = f"SELECT id FROM posts WHERE creator_id IN ({users}) OR title LIKE :pattern"
+    for stmt in (
+        f"DELETE FROM user_upvoted_posts WHERE user_id IN ({users}) OR post_id IN ({posts})",
+        f"DELETE FROM post_tags WHERE post_id IN ({posts})",
+        f"DELETE FROM posts WHERE id IN ({posts})",
+        f"DELETE FROM user_followed_users WHERE user_id IN ({users}) OR creator_id IN ({users})",
+        f"DELETE FROM user_followed_tags WHERE user_id IN ({users})",
+        "DELETE FROM users WHERE username LIKE :pattern"
+    ):
+        await db.execute(text(stmt), pattern)
+    await db.commit()
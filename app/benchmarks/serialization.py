@@ -0,0 +1,115 @@
+"""
+100 öğelik kullanıcı ve gönderi sayfaları için yanıt serileştirme karşılaştırması.
+
+"legacy": öğe başına model kurulur, FastAPI'nin response_model yolu gibi
+yeniden doğrulanır ve jsonable_encoder + json.dumps ile yazılır.
+"fast": satırlar doğrudan sözlüğe çevrilir ve `APIJSONResponse` ile byte'a
+dökülür. Veritabanı gerekmez; satırlar sahte nesnelerdir.
+
+    cd app && python -m benchmarks.serialization --items 100 --rounds 2000
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from core.common.api_models import APIResponse
+from core.common.serialization import APIJSONResponse
+from services.post_service import PostService
+from services.user_service import UserService
+from validators.post_models import PostResponse
+from validators.user_models import UserResponse
+
+
+def _users(n: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            first_name="Ada",
+            last_name="Lovelace",
+            roles=["DEFAULT"],
+            followers_count=i,
+            following_count=i * 2,
+            posts_count=i % 7,
+            created_at=now
+        )
+        for i in range(n)
+    ]
+
+
+def _posts(n: int) -> list:
+    now = datetime.now(timezone.utc)
+    creator = SimpleNamespace(username="ada", first_name="Ada", last_name="Lovelace")
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            title=f"Post {i}",
+            content="lorem ipsum dolor sit amet " * 20,
+            upvotes=i,
+            creator_id=uuid.uuid4(),
+            creator=creator,
+            tags=[SimpleNamespace(tag="python"), SimpleNamespace(tag="fastapi")],
+            created_at=now
+        )
+        for i in range(n)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(model) -> TypeAdapter:
+    # FastAPI de route başına response alanını bir kez kurar; ölçüme kurulum dahil edilmez.
+    return TypeAdapter(APIResponse[List[model]])
+
+
+def _legacy(model, rows, serialize) -> bytes:
+    # Eski yol: model başına kurulum, response_model doğrulaması, jsonable_encoder.
+    items = [model(**serialize(r)) for r in rows]
+    response = APIResponse(success=True, message="ok", data=items)
+    validated = _response_adapter(model).validate_python(response, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode("utf-8")
+
+
+def _fast(rows, serialize) -> bytes:
+    return APIJSONResponse(APIResponse(success=True, message="ok", data=[serialize(r) for r in rows])).body
+
+
+def _measure(fn, rounds: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare legacy and fast-path response serialization.")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    cases = [
+        ("users", UserResponse, _users(args.items), UserService._serialize),
+        ("posts", PostResponse, _posts(args.items), PostService._serialize)
+    ]
+    print(f"{'page':>8} {'legacy_us':>12} {'fast_us':>12} {'speedup':>10} {'bytes':>10}")
+    for name, model, rows, serialize in cases:
+        assert json.loads(_legacy(model, rows, serialize)) == json.loads(_fast(rows, serialize))
+        legacy = _measure(lambda: _legacy(model, rows, serialize), args.rounds)
+        fast = _measure(lambda: _fast(rows, serialize), args.rounds)
+        print(
+            f"{name:>8} {legacy * 1e6:>12.1f} {fast * 1e6:>12.1f} "
+            f"{legacy / fast:>9.2f}x {len(_fast(rows, serialize)):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+`get_current_user` başına token doğrulama maliyeti, token önbelleği olmadan ve ile.
+
+`--tokens` farklı erişim token'ı üretilir ve istekler bunlar arasında döner;
+her çağrı yeni bir istek gibi boş `request.state` ile yapılır.
+"uncached": önbellek kapalı (JWT_CACHE_SIZE=0), her istek imza doğrular.
+"cached": önbellek tüm token'ları tutar, ısındıktan sonra her istek isabet.
+"churn": önbellek token sayısının yarısı; LRU sürekli düşürür, her istek
+doğrulama + ekleme maliyeti öder (en kötü durum). Veritabanı gerekmez.
+
+    cd app && python -m benchmarks.token_verification --tokens 1000 --requests 100000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from benchmarks.report import Table, percentile
+from core.security.auth import get_current_user
+from core.security.crypto import create_jwt
+from core.security.token_cache import token_cache
+from validators.auth_models import JwtPayload
+
+
+def _tokens(n: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=create_jwt(JwtPayload(
+                user_id=uuid.uuid4(),
+                username=f"bench_{i}",
+                iat=now,
+                exp=now + timedelta(hours=1),
+                jti=uuid.uuid4()
+            ))
+        )
+        for i in range(n)
+    ]
+
+
+async def measure(credentials: list, requests: int, cache_size: int) -> dict:
+    token_cache.clear()
+    token_cache.max_size = cache_size
+    for c in credentials:
+        await get_current_user(SimpleNamespace(state=SimpleNamespace()), c)
+    hits, misses = token_cache.hits, token_cache.misses
+
+    latencies = []
+    for i in range(requests):
+        c = credentials[i % len(credentials)]
+        request = SimpleNamespace(state=SimpleNamespace())
+        started = time.perf_counter()
+        await get_current_user(request, c)
+        latencies.append(time.perf_counter() - started)
+
+    lookups = token_cache.hits - hits + token_cache.misses - misses
+    return {
+        "avg_us": sum(latencies) / len(latencies) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "hit_ratio": (token_cache.hits - hits) / lookups if lookups else 0.0
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare access-token verification with and without the token cache.")
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100000)
+    args = parser.parse_args()
+
+    credentials = _tokens(args.tokens)
+    configured = token_cache.max_size
+    cases = [
+        ("uncached", 0),
+        ("cached", max(args.tokens, 1)),
+        ("churn", max(args.tokens // 2, 1))
+    ]
+    table = Table([("case", 9)], ["avg_us", "p99_us", "hit_ratio"])
+    try:
+        table.header()
+        for name, size in cases:
+            table.row([name], await measure(credentials, args.requests, size))
+    finally:
+        token_cache.clear()
+        token_cache.max_size = configured
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+Tek bir gönderiye eşzamanlı oy yükü: `--upvoters` farklı kullanıcı aynı anda oy verir.
+
+"buffered": uygulamanın yolu, `PostService.upvote_post` (bağlantı satırı hemen
+yazılır, sayaç `upvote_buffer` ile toplu güncellenir). "direct": aynı
+transaction'da `UPDATE posts SET upvotes = upvotes + 1`; her oy gönderi
+satırının kilidini sırayla bekler. Her istek kendi oturumunu açar, havuz
+uygulamanınkidir (DB_POOL_*). Sonda sayacın oy sayısına eşit olduğu doğrulanır.
+
+    cd app && python -m benchmarks.upvote_load --upvoters 1000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import exc, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from benchmarks.report import Table, percentile
+from benchmarks.seed import cleanup, new_prefix, seed_posts, seed_users
+from database.database import AsyncSessionLocal, engine
+from database.models.post import Post
+from database.models.user import user_upvoted_posts
+from services.post_service import PostService
+from services.upvote_buffer import upvote_buffer
+
+
+async def buffered(db, post_id, user_id):
+    await PostService(db).upvote_post(post_id, user_id)
+
+
+async def direct(db, post_id, user_id):
+    res = await db.execute(
+        insert(user_upvoted_posts)
+        .values(user_id=user_id, post_id=post_id)
+        .on_conflict_do_nothing()
+        .returning(user_upvoted_posts.c.post_id)
+    )
+    if res.first() is not None:
+        await db.execute(update(Post).where(Post.id == post_id).values(upvotes=Post.upvotes + 1))
+    await db.commit()
+
+
+async def run_case(vote, post_id, user_ids) -> dict:
+    latencies = []
+    timeouts = 0
+    ready = asyncio.Event()
+
+    async def one(user_id):
+        nonlocal timeouts
+        await ready.wait()
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                await vote(db, post_id, user_id)
+        except exc.TimeoutError:
+            timeouts += 1
+            return
+        latencies.append(time.perf_counter() - started)
+
+    tasks = [asyncio.create_task(one(u)) for u in user_ids]
+    # Tüm görevler kurulduktan sonra aynı anda başlar.
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    ready.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    flush_started = time.perf_counter()
+    await upvote_buffer.flush()
+    flush_ms = (time.perf_counter() - flush_started) * 1000
+    async with AsyncSessionLocal() as db:
+        upvotes = (await db.execute(select(Post.upvotes).where(Post.id == post_id))).scalar_one()
+
+    return {
+        "votes": len(latencies),
+        "timeouts": timeouts,
+        "counter": upvotes,
+        "votes_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "flush_ms": flush_ms
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load one post with concurrent upvotes.")
+    parser.add_argument("--upvoters", type=int, default=1000)
+    args = parser.parse_args()
+
+    prefix = new_prefix("upvote")
+    async with AsyncSessionLocal() as db:
+        (creator_id,) = await seed_users(db, prefix + "c", 1)
+        await seed_posts(db, prefix + "c", 2)
+        user_ids = await seed_users(db, prefix + "u", args.upvoters)
+        post_ids = (await db.execute(select(Post.id).where(Post.creator_id == creator_id))).scalars().all()
+        await db.commit()
+
+    table = Table([("mode", 9)], ["votes", "timeouts", "counter", "votes_s", "p50_ms", "p99_ms", "flush_ms"], width=9)
+    try:
+        table.header()
+        for (name, vote), post_id in zip((("buffered", buffered), ("direct", direct)), post_ids):
+            row = await run_case(vote, post_id, user_ids)
+            table.row([name], row)
+            if row["counter"] != row["votes"]:
+                print(f"{name:>9} counter mismatch: {row['counter']} != {row['votes']}")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await cleanup(db, prefix)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+"""
+Toplu içe aktarma (users, tags, posts) için komut satırı aracı.
+
+    cd app && python -m cli.import_data users ./users.ndjson
+    cd app && python -m cli.import_data posts ./posts.csv --report errors.ndjson
+
+Biçim dosya uzantısından çıkarılır (.csv → CSV, diğerleri NDJSON); rapor
+varsayılan olarak stdout'a yazılır. CSV'de `tags` sütunu `;` ile ayrılır.
+"""
+import argparse
+import asyncio
+import sys
+
+from core.common.data_formats import FORMATS, iter_file_chunks, iter_records
+from core.security.password_hasher import password_hasher
+from database.database import AsyncSessionLocal
+from services.import_service import ImportService
+from validators.admin_models import ImportKind
+
+
+async def run(kind: ImportKind, path: str, fmt: str, report_path: str | None) -> dict:
+    out = open(report_path, "w", encoding="utf-8") if report_path else sys.stdout
+    try:
+        records = iter_records(iter_file_chunks(path), fmt, list_fields=("tags",))
+        async with AsyncSessionLocal() as db:
+            return await ImportService(db).import_records(kind, records, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        password_hasher.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users, tags or posts from NDJSON or CSV.")
+    parser.add_argument("kind", choices=[k.value for k in ImportKind])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=FORMATS)
+    parser.add_argument("--report", help="Write the per-row error report here instead of stdout.")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    totals = asyncio.run(run(ImportKind(args.kind), args.path, fmt, args.report))
+    sys.exit(1 if totals["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from core.common.base_controller import BaseController
+from services.comment_service import CommentService
+
+class CommentController(BaseController[CommentService]):
+    def __init__(self):
+        super().__init__(CommentService)
+
+comment_controller = CommentController()
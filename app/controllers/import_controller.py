@@ -0,0 +1,8 @@
+from core.common.base_controller import BaseController
+from services.import_service import ImportService
+
+class ImportController(BaseController[ImportService]):
+    def __init__(self):
+        super().__init__(ImportService)
+
+import_controller = ImportController()
@@ -0,0 +1,220 @@
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class CacheBackend:
+    """Byte-value store with per-entry TTL and tag based invalidation."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()):
+        raise NotImplementedError
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        raise NotImplementedError
+
+    async def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU; entries expire after their TTL or when evicted by size."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()):
+        if self.max_entries <= 0:
+            return
+        self._drop(key)
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+                removed += 1
+        return removed
+
+    async def clear(self):
+        self._entries.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "tags": len(self._tags)
+        }
+
+
+class _LocalPipeline:
+    """Queues commands like a redis.asyncio pipeline and runs them on `execute()`."""
+
+    def __init__(self, store: "LocalKeyValueStore"):
+        self._store = store
+        self._commands: List[Tuple[Callable, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._store, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        # Tek iş parçacığında await arasında başka komut araya girmez; sıra korunur.
+        return [await method(*args, **kwargs) for method, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._commands = []
+
+
+class LocalKeyValueStore:
+    """Minimal in-memory stand-in for the subset of the redis.asyncio client we use."""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[Optional[float], object]] = {}
+
+    def _alive(self, key: str):
+        item = self._values.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._values[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = self._alive(key)
+        return value if isinstance(value, bytes) else None
+
+    async def set(self, key: str, value: bytes, ex: Optional[float] = None):
+        self._values[key] = (time.monotonic() + ex if ex else None, value)
+
+    async def sadd(self, key: str, *members: str) -> int:
+        current = self._alive(key)
+        if not isinstance(current, set):
+            current = set()
+            self._values[key] = (None, current)
+        before = len(current)
+        current.update(members)
+        return len(current) - before
+
+    async def smembers(self, key: str) -> Set[bytes]:
+        current = self._alive(key)
+        return {m.encode() for m in current} if isinstance(current, set) else set()
+
+    async def expire(self, key: str, seconds: float) -> bool:
+        value = self._alive(key)
+        if value is None:
+            return False
+        self._values[key] = (time.monotonic() + seconds, value)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._values.pop(key, None) is not None)
+
+    async def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> AsyncIterator[str]:
+        for key in list(self._values):
+            if (match is None or fnmatchcase(key, match)) and self._alive(key) is not None:
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> _LocalPipeline:
+        return _LocalPipeline(self)
+
+
+class KeyValueCacheBackend(CacheBackend):
+    """Shared cache on an external key-value store (redis or `LocalKeyValueStore`).
+
+    Each tag is a set of cache keys that lives as long as the newest entry it
+    references, so stale tag sets clean themselves up. The store may be shared
+    with other data; only keys under `prefix` are ever touched.
+    """
+
+    CLEAR_BATCH = 500
+
+    def __init__(self, client, prefix: str = "gazipass:"):
+        self.client = client
+        self.prefix = prefix
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()):
+        seconds = max(int(ttl), 1)
+        # Gövde ve etiket kayıtları tek gidiş-dönüşte ve birlikte yazılır.
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self.prefix + key, value, ex=seconds)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, self.prefix + key)
+                pipe.expire(tag_key, seconds)
+            await pipe.execute()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys: List[str] = [
+                k.decode() if isinstance(k, bytes) else k
+                for k in await self.client.smembers(tag_key)
+            ]
+            if keys:
+                removed += await self.client.delete(*keys)
+            await self.client.delete(tag_key)
+        return removed
+
+    async def clear(self):
+        batch = []
+        async for key in self.client.scan_iter(match=self.prefix + "*", count=self.CLEAR_BATCH):
+            batch.append(key)
+            if len(batch) >= self.CLEAR_BATCH:
+                await self.client.delete(*batch)
+                batch = []
+        if batch:
+            await self.client.delete(*batch)
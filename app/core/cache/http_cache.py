@@ -0,0 +1,27 @@
+import hashlib
+from typing import Dict, Optional
+
+from fastapi import Response, status
+
+
+def weak_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def body_etag(body: bytes) -> str:
+    return f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    # If-None-Match zayıf karşılaştırma kullanır (RFC 9110 13.1.2): W/ öneki yok sayılır.
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(c.strip().removeprefix("W/") == target for c in if_none_match.split(","))
+
+
+def not_modified(etag: str, headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": etag})
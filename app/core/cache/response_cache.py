@@ -0,0 +1,339 @@
+import hashlib
+import json
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from core.cache.http_cache import body_etag, etag_matches, not_modified, weak_etag
+from core.common.compression import add_vary, compress_body, compression_stats, negotiate, policy_for
+from core.security.auth import verify_request_token
+from core.cache.backends import (
+    CacheBackend,
+    KeyValueCacheBackend,
+    LocalKeyValueStore,
+    MemoryCacheBackend
+)
+from utils.config import (
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL,
+    REDIS_URL
+)
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
+
+
+def _create_backend(kind: str) -> CacheBackend:
+    if kind == "redis":
+        if redis_asyncio is None:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis için 'redis' paketi kurulu olmalı.")
+        return KeyValueCacheBackend(redis_asyncio.from_url(REDIS_URL))
+    if kind == "local-kv":
+        return KeyValueCacheBackend(LocalKeyValueStore())
+    return MemoryCacheBackend(RESPONSE_CACHE_MAX_ENTRIES)
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    tags: List[str]
+    # Sıkıştırılmış varyantlarda kodlama ve sıkıştırılmamış gövde boyutu.
+    encoding: Optional[str] = None
+    size: int = 0
+
+    def pack(self) -> bytes:
+        # Backend'ler yalnızca bytes saklar; ETag ve etiketler gövdenin önünde tek satır JSON.
+        meta = {"etag": self.etag, "tags": self.tags}
+        if self.encoding:
+            meta.update(encoding=self.encoding, size=self.size)
+        head = json.dumps(meta, separators=(",", ":"))
+        return head.encode() + b"\n" + self.body
+
+    @classmethod
+    def unpack(cls, raw: bytes) -> "CachedResponse":
+        head, _, body = raw.partition(b"\n")
+        meta = json.loads(head)
+        return cls(body, meta["etag"], meta["tags"], meta.get("encoding"), meta.get("size", 0))
+
+
+class ResponseCache:
+    """Caches rendered JSON bodies of GET endpoints and invalidates them by tag.
+
+    Every invalidation takes the next `generation` and records it per tag. A
+    miss remembers the generation it started at and stores its body only if
+    none of the entry's tags were invalidated since, so a write elsewhere does
+    not block unrelated misses.
+    """
+
+    # Bu kadar etiketten sonra tablo sıfırlanır; sıfırlama bir clear() gibi sayılır.
+    MAX_TRACKED_TAGS = 10000
+
+    def __init__(self, backend: CacheBackend, backend_name: str, ttl: float):
+        self.backend = backend
+        self.backend_name = backend_name
+        self.ttl = ttl
+        self.generation = 0
+        self._tag_generations: Dict[str, int] = {}
+        self._cleared_at = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+        self.errors = 0
+        self.lookup_time_total = 0.0
+        self.lookup_time_max = 0.0
+
+    @staticmethod
+    def scope_for(request: Request, vary_auth: bool = True) -> str:
+        auth = request.headers.get("authorization")
+        if vary_auth and auth:
+            return hashlib.sha256(auth.encode()).hexdigest()
+        return "public"
+
+    @staticmethod
+    def key_for(request: Request, scope: str) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        raw = f"{request.method}|{request.url.path}|{query}|{scope}"
+        return "resp:" + hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get(self, key: str, etag: Optional[str] = None) -> Optional[CachedResponse]:
+        """Returns the cached entry; with `etag` given, an entry of another version is a miss."""
+        started = time.perf_counter()
+        try:
+            raw = await self.backend.get(key)
+        except Exception:
+            # Cache erişilemezse isteği veritabanından karşıla.
+            self.errors += 1
+            raw = None
+
+        entry = CachedResponse.unpack(raw) if raw is not None else None
+        if entry is not None and etag is not None and entry.etag != etag:
+            entry = None
+
+        elapsed = time.perf_counter() - started
+        self.lookup_time_total += elapsed
+        self.lookup_time_max = max(self.lookup_time_max, elapsed)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse, ttl: Optional[float] = None):
+        if (ttl or self.ttl) <= 0:
+            return
+        try:
+            await self.backend.set(key, entry.pack(), ttl or self.ttl, entry.tags)
+            self.stores += 1
+        except Exception:
+            self.errors += 1
+
+    def is_current(self, tags: Iterable[str], generation: int) -> bool:
+        """True if nothing the entry depends on was invalidated after `generation`."""
+        if self._cleared_at > generation:
+            return False
+        return all(self._tag_generations.get(tag, 0) <= generation for tag in tags)
+
+    async def invalidate(self, *tags: str):
+        self.generation += 1
+        if len(self._tag_generations) + len(tags) > self.MAX_TRACKED_TAGS:
+            self._tag_generations.clear()
+            self._cleared_at = self.generation
+        for tag in tags:
+            self._tag_generations[tag] = self.generation
+        try:
+            self.invalidations += await self.backend.invalidate_tags(tags)
+        except Exception:
+            self.errors += 1
+
+    async def clear(self):
+        self.generation += 1
+        self._tag_generations.clear()
+        self._cleared_at = self.generation
+        await self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend_name,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "lookup_time_avg": self.lookup_time_total / lookups if lookups else 0.0,
+            "lookup_time_max": self.lookup_time_max,
+            **self.backend.stats()
+        }
+
+
+response_cache = ResponseCache(
+    backend=_create_backend(RESPONSE_CACHE_BACKEND),
+    backend_name=RESPONSE_CACHE_BACKEND,
+    ttl=RESPONSE_CACHE_TTL
+)
+
+
+class CachePolicy:
+    def __init__(
+        self,
+        ttl: Optional[float],
+        tags: Optional[Callable[[Request, dict], List[str]]],
+        when: Optional[Callable[[Request], bool]],
+        vary_auth: bool,
+        version: Optional[Callable[[Request], Awaitable[Optional[str]]]],
+        cache_control: Optional[str]
+    ):
+        self.ttl = ttl
+        self.tags = tags
+        self.when = when
+        self.vary_auth = vary_auth
+        self.version = version
+        self.cache_control = cache_control
+
+    def headers_for(self, scope: str) -> dict:
+        headers = {}
+        if self.vary_auth:
+            headers["Vary"] = "Authorization"
+        if self.cache_control:
+            # Kimliğe göre değişen yanıtlar CDN'de paylaşılmaz; istemci ETag ile doğrular.
+            headers["Cache-Control"] = self.cache_control if scope == "public" else "private, no-cache"
+        return headers
+
+
+def cache_response(
+    ttl: Optional[float] = None,
+    tags: Optional[Callable[[Request, dict], List[str]]] = None,
+    when: Optional[Callable[[Request], bool]] = None,
+    vary_auth: bool = True,
+    version: Optional[Callable[[Request], Awaitable[Optional[str]]]] = None,
+    cache_control: Optional[str] = None
+):
+    """Marks an endpoint as cacheable; only takes effect on routers using `CachedRoute`.
+
+    `tags` receives the request and the decoded response body and doubles as the
+    Surrogate-Key header, `when` decides per request whether the cache is
+    consulted at all. `version` returns the entity version from a version-only
+    query; without it the ETag is a hash of the body.
+    """
+    def decorator(fn):
+        fn.__response_cache__ = CachePolicy(ttl, tags, when, vary_auth, version, cache_control)
+        return fn
+    return decorator
+
+
+class CachedRoute(APIRoute):
+    """Serves cached bodies and 304s before dependencies run.
+
+    A plain cache hit never opens a DB session; a conditional request on a
+    versioned route costs one version-only query and never loads or serializes
+    the entity. Bodies are also cached per negotiated Content-Encoding, so a hot
+    response is compressed once rather than on every request. On `vary_auth`
+    routes a bearer token is verified (token cache first) before anything is
+    served from the cache; one that fails bypasses the cache.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        policy: Optional[CachePolicy] = getattr(self.endpoint, "__response_cache__", None)
+        if policy is None:
+            return handler
+        compression = policy_for(self.endpoint)
+
+        def respond(entry: CachedResponse, headers: dict, status: str) -> Response:
+            headers = {**headers, "ETag": entry.etag, "Surrogate-Key": " ".join(entry.tags), "X-Cache": status}
+            if entry.encoding:
+                headers["Content-Encoding"] = entry.encoding
+            if compression.enabled:
+                add_vary(headers)
+            return Response(content=entry.body, media_type="application/json", headers=headers)
+
+        async def encoded(key: str, entry: CachedResponse, encoding: Optional[str], generation: int) -> CachedResponse:
+            if encoding is None or len(entry.body) < compression.min_size:
+                return entry
+            variant = CachedResponse(
+                compress_body(entry.body, encoding, compression.level_for(encoding)),
+                entry.etag,
+                entry.tags,
+                encoding,
+                len(entry.body)
+            )
+            if response_cache.is_current(variant.tags, generation):
+                await response_cache.set(f"{key}:{encoding}", variant, policy.ttl)
+            return variant
+
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET" or (policy.when and not policy.when(request)):
+                return await handler(request)
+            if policy.vary_auth and request.headers.get("authorization") and verify_request_token(request) is None:
+                # İsabet ve 304 bağımlılıklardan önce döner; süresi dolmuş ya da geçersiz
+                # token önbellekten yanıt almasın, route'un kendi kimlik kontrolü karar versin.
+                return await handler(request)
+
+            scope = response_cache.scope_for(request, policy.vary_auth)
+            headers = policy.headers_for(scope)
+            if_none_match = request.headers.get("if-none-match")
+            encoding = negotiate(request.headers.get("accept-encoding")) if compression.enabled else None
+
+            async def version_etag() -> Optional[str]:
+                version = await policy.version(request)
+                return weak_etag(version, scope) if version else None
+
+            etag = None
+            if policy.version and if_none_match:
+                etag = await version_etag()
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag, headers)
+
+            key = response_cache.key_for(request, scope)
+            generation = response_cache.generation
+            if encoding:
+                variant = await response_cache.get(f"{key}:{encoding}", etag)
+                if variant is not None:
+                    if etag_matches(if_none_match, variant.etag):
+                        return not_modified(variant.etag, headers)
+                    compression_stats.record(encoding, variant.size, len(variant.body), 0.0, "cached")
+                    return respond(variant, headers, "HIT")
+
+            entry = await response_cache.get(key, etag)
+            if entry is not None:
+                if etag_matches(if_none_match, entry.etag):
+                    return not_modified(entry.etag, headers)
+                return respond(await encoded(key, entry, encoding, generation), headers, "HIT")
+
+            if policy.version and etag is None:
+                # Sürüm gövdeden önce okunur; araya giren bir yazma en fazla gereksiz bir 200'e yol açar.
+                etag = await version_etag()
+            response = await handler(request)
+            if response.status_code != 200 or response.media_type != "application/json":
+                return response
+
+            body = bytes(response.body)
+            entry = CachedResponse(
+                body,
+                etag or body_etag(body),
+                policy.tags(request, json.loads(body)) if policy.tags else []
+            )
+            if response_cache.is_current(entry.tags, generation):
+                await response_cache.set(key, entry, policy.ttl)
+            if etag_matches(if_none_match, entry.etag):
+                return not_modified(entry.etag, headers)
+
+            variant = await encoded(key, entry, encoding, generation)
+            if variant is not entry:
+                return respond(variant, headers, "MISS")
+            # Sıkıştırılmadıysa handler'ın yanıtı (arka plan görevleriyle birlikte) korunur.
+            response.headers.update({**headers, "ETag": entry.etag, "Surrogate-Key": " ".join(entry.tags), "X-Cache": "MISS"})
+            if compression.enabled:
+                response.headers.add_vary_header("Accept-Encoding")
+            return response
+
+        return cached_handler
@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from utils.config import FEED_CACHE_USERS, FEED_CACHE_ENTRIES, FEED_CACHE_TTL
+
+FeedKey = Tuple[datetime, UUID]
+
+
+class _Timeline:
+    __slots__ = ("keys", "complete", "expires_at")
+
+    def __init__(self, keys: List[FeedKey], complete: bool, expires_at: float):
+        # En yeniden en eskiye sıralı (created_at, post_id) anahtarları.
+        self.keys = keys
+        self.complete = complete
+        self.expires_at = expires_at
+
+
+class TimelineCache:
+    """Per-user materialized home feed: the newest feed keys of recently active users.
+
+    Filled from the database on a first-page miss and kept current by pushing
+    new posts into the timelines of cached followers. A TTL bounds staleness
+    for posts created by other worker processes.
+    """
+
+    def __init__(self, max_users: int, max_entries: int, ttl: float):
+        self.max_users = max_users
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._timelines: "OrderedDict[UUID, _Timeline]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, user_id: UUID) -> Optional[_Timeline]:
+        timeline = self._timelines.get(user_id)
+        if timeline is None:
+            return None
+        if time.monotonic() >= timeline.expires_at:
+            del self._timelines[user_id]
+            return None
+        self._timelines.move_to_end(user_id)
+        return timeline
+
+    def page(self, user_id: UUID, limit: int, before: Optional[FeedKey] = None) -> Optional[List[FeedKey]]:
+        """Up to `limit` keys older than `before`, or None if the cache cannot answer."""
+        timeline = self._get(user_id)
+        if timeline is None:
+            self.misses += 1
+            return None
+
+        keys = timeline.keys
+        if before is not None:
+            keys = [k for k in keys if k < before]
+        if len(keys) < limit and not timeline.complete:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return keys[:limit]
+
+    def store(self, user_id: UUID, keys: List[FeedKey], complete: bool):
+        if self.max_users <= 0:
+            return
+        self._timelines[user_id] = _Timeline(
+            keys[:self.max_entries],
+            complete and len(keys) <= self.max_entries,
+            time.monotonic() + self.ttl
+        )
+        self._timelines.move_to_end(user_id)
+        while len(self._timelines) > self.max_users:
+            self._timelines.popitem(last=False)
+
+    def push(self, user_ids: Iterable[UUID], key: FeedKey):
+        for user_id in user_ids:
+            timeline = self._timelines.get(user_id)
+            if timeline is None or key in timeline.keys:
+                continue
+            # Yeni postlar neredeyse her zaman en başa düşer.
+            keys = timeline.keys
+            i = 0
+            while i < len(keys) and keys[i] > key:
+                i += 1
+            keys.insert(i, key)
+            if len(keys) > self.max_entries:
+                del keys[self.max_entries:]
+                timeline.complete = False
+
+    def invalidate(self, user_id: UUID):
+        self._timelines.pop(user_id, None)
+
+    def user_ids(self) -> List[UUID]:
+        return list(self._timelines)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "users": len(self._timelines),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+timeline_cache = TimelineCache(
+    max_users=FEED_CACHE_USERS,
+    max_entries=FEED_CACHE_ENTRIES,
+    ttl=FEED_CACHE_TTL
+)
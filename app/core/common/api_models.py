@@ -6,4 +6,5 @@ T = TypeVar("T")
 class APIResponse(BaseModel, Generic[T]):
     success: bool = True
     message: Optional[str] = None
-    data: Optional[T] = None
\ No newline at end of file
+    data: Optional[T] = None
+    next_cursor: Optional[str] = None
@@ -1,9 +1,22 @@
-from typing import Generic, TypeVar, Type, Optional, List, Union, Dict
+from typing import AsyncIterator, Generic, Iterator, TypeVar, Type, Optional, List, Sequence, Union, Dict, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+
+from core.common.cursor import encode_cursor, decode_keyset_cursor
+from database.database import UNIT_OF_WORK
 
 ModelType = TypeVar("ModelType")
 
+# Postgres/asyncpg bir ifadede en fazla bu kadar bind parametresi kabul eder.
+MAX_BIND_PARAMS = 32767
+
+
+def chunked(items: List, params_per_item: int) -> Iterator[List]:
+    """Splits multi-row INSERT values so each statement stays under MAX_BIND_PARAMS."""
+    size = max(MAX_BIND_PARAMS // max(params_per_item, 1), 1)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class BaseRepository(Generic[ModelType]):
     model: Type[ModelType]
@@ -11,6 +24,13 @@ class BaseRepository(Generic[ModelType]):
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _save(self):
+        """İstek kapsamındaki oturumda yalnızca flush; arka plan işlerinde commit."""
+        if self.db.info.get(UNIT_OF_WORK):
+            await self.db.flush()
+        else:
+            await self.db.commit()
+
     async def get(self, id) -> Optional[ModelType]:
         q = select(self.model).where(self.model.id == id)
         res = await self.db.execute(q)
@@ -29,22 +49,21 @@ class BaseRepository(Generic[ModelType]):
         else:
             obj = data
 
+        # Sunucu varsayılanları INSERT ... RETURNING ile gelir, refresh gerekmez.
         self.db.add(obj)
-        await self.db.commit()
-        await self.db.refresh(obj)
+        await self._save()
         return obj
 
     async def update(self, obj: ModelType, data: dict) -> ModelType:
         for key, value in data.items():
             setattr(obj, key, value)
 
-        await self.db.commit()
-        await self.db.refresh(obj)
+        await self._save()
         return obj
 
     async def delete(self, obj: ModelType) -> bool:
         await self.db.delete(obj)
-        await self.db.commit()
+        await self._save()
         return True
     
     async def list(self, size: int, offset: int) -> List[ModelType]:
@@ -56,3 +75,24 @@ class BaseRepository(Generic[ModelType]):
         q = select(self.model).where(*criteria).offset(offset).limit(size)
         res = await self.db.execute(q)
         return res.scalars().all()
+
+    async def stream_columns(self, columns: List[str], batch_size: int) -> AsyncIterator[Sequence]:
+        """Server-side cursor üzerinden `batch_size`'lık satır grupları; tüm tablo belleğe alınmaz."""
+        q = select(*(getattr(self.model, c) for c in columns)).execution_options(yield_per=batch_size)
+        result = await self.db.stream(q)
+        async for rows in result.partitions():
+            yield rows
+
+    def _keyset(self, q, size: int, cursor: Optional[str]):
+        # (created_at, id) üzerinden azalan sıralı keyset; bir fazla satır sonraki sayfanın varlığını gösterir.
+        if cursor:
+            created_at, id = decode_keyset_cursor(cursor)
+            q = q.where(tuple_(self.model.created_at, self.model.id) < tuple_(created_at, id))
+        return q.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(size + 1)
+
+    def _page(self, rows, size: int) -> Tuple[List, Optional[str]]:
+        if len(rows) <= size:
+            return list(rows), None
+        rows = rows[:size]
+        last = rows[-1]
+        return list(rows), encode_cursor(last.created_at, last.id)
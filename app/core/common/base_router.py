@@ -1,5 +1,31 @@
-from fastapi import APIRouter
+import functools
+import inspect
+from fastapi import APIRouter, Response
+from core.common.serialization import APIJSONResponse
+
+def _fast_path(endpoint, status_code):
+    # Handler'ın zaten kurduğu modeli response_model ile yeniden doğrulatmadan doğrudan byte'a çevir.
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return APIJSONResponse(result, status_code=status_code or 200)
+    return wrapper
 
 class BaseRouter(APIRouter):
-    def __init__(self, prefix: str, tags: list):
-        super().__init__(prefix=prefix, tags=tags)
\ No newline at end of file
+    """APIRouter whose routes return `APIJSONResponse` directly.
+
+    `response_model` still drives the OpenAPI schema, but since handlers return
+    a Response, FastAPI skips validating and re-serializing the result.
+    """
+
+    def __init__(self, prefix: str, tags: list, **kwargs):
+        super().__init__(prefix=prefix, tags=tags, **kwargs)
+
+    def add_api_route(self, path: str, endpoint, **kwargs):
+        kwargs.setdefault("response_class", APIJSONResponse)
+        super().add_api_route(path, _fast_path(endpoint, kwargs.get("status_code")), **kwargs)
\ No newline at end of file
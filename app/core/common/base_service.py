@@ -1,3 +1,4 @@
+from enum import Enum
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.common.api_models import APIResponse
@@ -13,12 +14,16 @@ class BaseService:
             await self.db.rollback()
             raise HTTPException(status_code=500, detail="Database commit failed")
 
-    def success(self, message: str, data=None):
+    def success(self, message: str | Enum, data=None, next_cursor: str | None = None):
         return APIResponse(
             success=True,
-            message=message,
-            data=data
+            message=message.value if isinstance(message, Enum) else message,
+            data=data,
+            next_cursor=next_cursor
         )
 
-    def error(self, message: str | None = None, status_code: int = status.HTTP_400_BAD_REQUEST):
-        raise HTTPException(status_code=status_code, detail=message)
+    def error(self, message: str | Enum | None = None, status_code: int = status.HTTP_400_BAD_REQUEST):
+        raise HTTPException(
+            status_code=status_code,
+            detail=message.value if isinstance(message, Enum) else message
+        )
@@ -0,0 +1,253 @@
+import gzip
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from utils.config import COMPRESSION_ENABLED, COMPRESSION_ENCODINGS, COMPRESSION_LEVEL, COMPRESSION_MIN_SIZE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "text/"
+)
+
+
+class Codec(ABC):
+    name: str
+    default_level: int
+
+    @abstractmethod
+    def compress(self, data: bytes, level: int) -> bytes:
+        ...
+
+    @abstractmethod
+    def compressor(self, level: int):
+        """Returns an object with `compress(chunk)` and `flush()` for streamed bodies."""
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+    default_level = 6
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        # mtime=0: aynı gövde her zaman aynı byte'lara sıkışır.
+        return gzip.compress(data, compresslevel=level, mtime=0)
+
+    def compressor(self, level: int):
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class _BrotliStream:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class BrotliCodec(Codec):
+    name = "br"
+    default_level = 4
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        return brotli.compress(data, quality=level)
+
+    def compressor(self, level: int):
+        return _BrotliStream(level)
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+    default_level = 3
+
+    # ZstdCompressor eşzamanlı kullanımda güvenli değil; her gövde/akış kendi bağlamını kurar.
+    def compress(self, data: bytes, level: int) -> bytes:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    def compressor(self, level: int):
+        return zstandard.ZstdCompressor(level=level).compressobj()
+
+
+def _available_codecs() -> Dict[str, Codec]:
+    known = {"gzip": GzipCodec}
+    if brotli is not None:
+        known["br"] = BrotliCodec
+    if zstandard is not None:
+        known["zstd"] = ZstdCodec
+    return {name: known[name]() for name in COMPRESSION_ENCODINGS if name in known}
+
+
+# Sunucu tercih sırası korunur (dict ekleme sırası).
+CODECS = _available_codecs()
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Picks the codec with the highest client q-value; ties go to server preference."""
+    if not accept_encoding or not CODECS:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for name in CODECS:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def add_vary(headers: Dict[str, str], value: str = "Accept-Encoding") -> Dict[str, str]:
+    vary = headers.get("Vary")
+    headers["Vary"] = f"{vary}, {value}" if vary else value
+    return headers
+
+
+class CompressionPolicy:
+    def __init__(self, min_size: int, level: Optional[int], enabled: bool):
+        self.min_size = min_size
+        self.level = level
+        self.enabled = enabled
+
+    def level_for(self, encoding: str) -> int:
+        return self.level or CODECS[encoding].default_level
+
+
+DEFAULT_POLICY = CompressionPolicy(COMPRESSION_MIN_SIZE, COMPRESSION_LEVEL, COMPRESSION_ENABLED)
+
+
+def compress(min_size: Optional[int] = None, level: Optional[int] = None, enabled: bool = True):
+    """Overrides the global threshold and level for one endpoint.
+
+    `level` is 1-9 and is passed to whichever codec is negotiated; `enabled=False`
+    sends the route uncompressed.
+    """
+    def decorator(fn):
+        fn.__compression__ = CompressionPolicy(
+            COMPRESSION_MIN_SIZE if min_size is None else min_size,
+            COMPRESSION_LEVEL if level is None else level,
+            enabled and COMPRESSION_ENABLED
+        )
+        return fn
+    return decorator
+
+
+def policy_for(endpoint) -> CompressionPolicy:
+    return getattr(endpoint, "__compression__", DEFAULT_POLICY)
+
+
+class CompressionStats:
+    """CPU time spent against bytes saved, per encoding.
+
+    `cpu_time` is thread CPU time, so it excludes time the loop spent elsewhere;
+    precompressed cache hits save bytes without any CPU cost.
+    """
+
+    def __init__(self):
+        self.encodings: Dict[str, Dict[str, float]] = {}
+        self.skipped_small = 0
+        self.skipped_identity = 0
+
+    def _bucket(self, encoding: str) -> Dict[str, float]:
+        if encoding not in self.encodings:
+            self.encodings[encoding] = {
+                "responses": 0,
+                "streamed": 0,
+                "cached": 0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "cpu_time": 0.0
+            }
+        return self.encodings[encoding]
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_time: float, kind: Optional[str] = None):
+        bucket = self._bucket(encoding)
+        bucket["responses"] += 1
+        if kind:
+            bucket[kind] += 1
+        bucket["bytes_in"] += bytes_in
+        bucket["bytes_out"] += bytes_out
+        bucket["cpu_time"] += cpu_time
+
+    def stats(self) -> dict:
+        encodings = {}
+        for name, b in self.encodings.items():
+            saved = b["bytes_in"] - b["bytes_out"]
+            encodings[name] = {
+                **b,
+                "bytes_saved": saved,
+                "ratio": b["bytes_out"] / b["bytes_in"] if b["bytes_in"] else 1.0,
+                "cpu_ms_per_mib_saved": b["cpu_time"] * 1000 / (saved / 1048576) if saved > 0 else 0.0
+            }
+        return {
+            "available": list(CODECS),
+            "min_size": DEFAULT_POLICY.min_size,
+            "skipped_small": self.skipped_small,
+            "skipped_identity": self.skipped_identity,
+            "encodings": encodings
+        }
+
+
+compression_stats = CompressionStats()
+
+
+def compress_body(body: bytes, encoding: str, level: int) -> bytes:
+    started = time.thread_time()
+    out = CODECS[encoding].compress(body, level)
+    compression_stats.record(encoding, len(body), len(out), time.thread_time() - started)
+    return out
+
+
+class StreamCompressor:
+    """Compresses a streamed body chunk by chunk; stats are recorded on `finish()`."""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        self._compressor = CODECS[encoding].compressor(level)
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_time = 0.0
+
+    def _run(self, fn, *args) -> bytes:
+        started = time.thread_time()
+        out = fn(*args)
+        self._cpu_time += time.thread_time() - started
+        self._bytes_out += len(out)
+        return out
+
+    def compress(self, chunk: bytes) -> bytes:
+        self._bytes_in += len(chunk)
+        return self._run(self._compressor.compress, chunk)
+
+    def finish(self) -> bytes:
+        out = self._run(self._compressor.flush)
+        compression_stats.record(self.encoding, self._bytes_in, self._bytes_out, self._cpu_time, "streamed")
+        return out
@@ -0,0 +1,66 @@
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from utils.config import JWT_SECRET_KEY
+
+_CURSOR_KEY = hashlib.sha256(b"cursor:" + JWT_SECRET_KEY.encode()).digest()
+_SIG_SIZE = 16
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_CURSOR_KEY, payload, hashlib.sha256).digest()[:_SIG_SIZE]
+
+
+def encode_cursor(*values) -> str:
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else str(v) for v in values],
+        separators=(",", ":")
+    ).encode()
+    return base64.urlsafe_b64encode(payload + _sign(payload)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload, sig = raw[:-_SIG_SIZE], raw[-_SIG_SIZE:]
+        if not hmac.compare_digest(sig, _sign(payload)):
+            raise ValueError("bad signature")
+        values = json.loads(payload)
+        if not isinstance(values, list):
+            raise ValueError("bad payload")
+        return values
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    values = decode_cursor(cursor)
+    try:
+        created_at, id = values
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def decode_id_cursor(cursor: str) -> UUID:
+    values = decode_cursor(cursor)
+    try:
+        (id,) = values
+        return UUID(id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
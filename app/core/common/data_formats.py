@@ -0,0 +1,188 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import IO, Any, AsyncIterator, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+# CSV'de liste alanları (ör. tags) bu ayraçla tek hücrede taşınır.
+CSV_LIST_SEPARATOR = ";"
+
+MAX_LINE_BYTES = 1 << 20
+LINE_TOO_LONG = f"Line longer than {MAX_LINE_BYTES} bytes"
+
+
+class Record(NamedTuple):
+    line: int
+    data: Optional[dict]
+    error: Optional[str]
+
+
+def detect_format(content_type: Optional[str], explicit: Optional[str] = None) -> Optional[str]:
+    if explicit:
+        return explicit if explicit in FORMATS else None
+    media = (content_type or "").split(";")[0].strip().lower()
+    if media in ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/json"):
+        return "ndjson"
+    if media in ("text/csv", "application/csv"):
+        return "csv"
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int = MAX_LINE_BYTES) -> AsyncIterator[Optional[str]]:
+    """Splits a byte stream into lines without holding more than one partial line.
+
+    A line longer than `max_line_bytes` is dropped up to its newline and yielded
+    as None, so parsers can report it as a failed row and carry on.
+    """
+    pending = bytearray()
+    skipping = False
+    async for chunk in chunks:
+        pending += chunk
+        start = 0
+        while True:
+            end = pending.find(b"\n", start)
+            if end < 0:
+                break
+            if skipping:
+                # Uzun satırın kalanı; satır zaten None olarak bildirildi.
+                skipping = False
+            elif end - start > max_line_bytes:
+                yield None
+            else:
+                yield pending[start:end].decode("utf-8", errors="replace").rstrip("\r")
+            start = end + 1
+        del pending[:start]
+        if len(pending) > max_line_bytes:
+            if not skipping:
+                yield None
+                skipping = True
+            pending.clear()
+    if pending and not skipping:
+        yield pending.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def iter_ndjson(lines: AsyncIterator[Optional[str]]) -> AsyncIterator[Record]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if line is None:
+            yield Record(number, None, LINE_TOO_LONG)
+            continue
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield Record(number, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield Record(number, None, "Expected a JSON object")
+            continue
+        yield Record(number, data, None)
+
+
+async def iter_csv(lines: AsyncIterator[Optional[str]], list_fields: Iterable[str] = ()) -> AsyncIterator[Record]:
+    """Header satırından sonra her satır bir kayıt; tırnaklı alanlar satır atlayamaz."""
+    list_fields = set(list_fields)
+    header: Optional[List[str]] = None
+    number = 0
+    async for line in lines:
+        number += 1
+        if line is None:
+            yield Record(number, None, LINE_TOO_LONG)
+            continue
+        if not line.strip():
+            continue
+        try:
+            values = next(csv.reader([line]))
+        except csv.Error as e:
+            yield Record(number, None, f"Invalid CSV: {e}")
+            continue
+
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        if len(values) != len(header):
+            yield Record(number, None, f"Expected {len(header)} columns, got {len(values)}")
+            continue
+
+        data = dict(zip(header, values))
+        for field in list_fields & data.keys():
+            data[field] = [v for v in data[field].split(CSV_LIST_SEPARATOR) if v.strip()]
+        yield Record(number, data, None)
+
+
+def iter_records(chunks: AsyncIterator[bytes], fmt: str, list_fields: Iterable[str] = ()) -> AsyncIterator[Record]:
+    lines = iter_lines(chunks)
+    if fmt == "csv":
+        return iter_csv(lines, list_fields)
+    return iter_ndjson(lines)
+
+
+async def batched(items: AsyncIterator[T], size: int) -> AsyncIterator[List[T]]:
+    batch: List[T] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def iter_file_chunks(path: str, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def iter_text_file(f: IO[str], chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Streams a (spooled) text file and closes it once exhausted."""
+    try:
+        while chunk := f.read(chunk_size):
+            yield chunk
+    finally:
+        f.close()
+
+
+def _csv_value(value: Any):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return CSV_LIST_SEPARATOR.join(str(v) for v in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_value(value: Any):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def format_header(fmt: str, columns: List[str]) -> str:
+    if fmt != "csv":
+        return ""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(columns)
+    return buf.getvalue()
+
+
+def format_rows(fmt: str, columns: List[str], rows: Sequence[Sequence[Any]]) -> str:
+    """Renders a batch of rows as one output chunk."""
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        return buf.getvalue()
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_value, ensure_ascii=False) + "\n"
+        for row in rows
+    )
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from utils.logger import logger
+
+
+class PeriodicTask:
+    def __init__(self, name: str, interval: float, fn: Callable[[], Awaitable[None]]):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.fn()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(content: Any) -> bytes:
+    """Serializes without validating: models via their own serializer, plain data via the fastest encoder."""
+    if isinstance(content, BaseModel):
+        return type(content).__pydantic_serializer__.to_json(content)
+    if orjson is not None and isinstance(content, (dict, list)):
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # orjson'un tanımadığı tipler için pydantic'in encoder'ı.
+            pass
+    return to_json(content)
+
+
+class APIJSONResponse(JSONResponse):
+    """JSONResponse that writes already-built content straight to bytes."""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
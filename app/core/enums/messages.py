@@ -22,6 +22,9 @@ class UserMessages(Enum):
     GET_ALL_USERS = "Users fetched successfully."
     USER_UPDATED = "User updated successfully."
     USER_DELETED = "User deleted successfully."
+    GET_FOLLOWERS = "Followers fetched successfully."
+    GET_FOLLOWED_USERS = "Followed users fetched successfully."
+    GET_FOLLOWED_TAGS = "Followed tags fetched successfully."
     USER_FOLLOWED = "User followed successfully."
     USER_UNFOLLOWED = "User unfollowed successfully."
     TAG_FOLLOWED = "Tag followed successfully."
@@ -30,3 +33,30 @@ class UserMessages(Enum):
     NOT_FOLLOWING = "Not following."
     USER_NOT_FOUND = "User not found."
     TAG_NOT_FOUND = "Tag not found."
+
+class PostMessages(Enum):
+    GET_POST = "Post fetched successfully."
+    GET_ALL_POSTS = "Posts fetched successfully."
+    GET_FEED = "Feed fetched successfully."
+    POST_CREATED = "Post created successfully."
+    POST_UPDATED = "Post updated successfully."
+    POST_DELETED = "Post deleted successfully."
+    POST_UPVOTED = "Post upvoted successfully."
+    POST_NOT_FOUND = "Post not found."
+    NOT_POST_OWNER = "You are not the owner of this post."
+
+class ImportMessages(Enum):
+    UNSUPPORTED_FORMAT = "Unsupported import format, use NDJSON or CSV."
+    USER_EXISTS = "Username or email already exists."
+    CREATOR_NOT_FOUND = "Creator not found."
+    INVALID_TAG = "Tag must be 1-50 characters."
+    HASH_FAILED = "Password could not be hashed."
+    BATCH_FAILED = "Batch could not be written."
+
+class ExportMessages(Enum):
+    UNKNOWN_COLUMNS = "Unknown or non-exportable columns."
+
+class CommentMessages(Enum):
+    GET_COMMENTS = "Comments fetched successfully."
+    GET_REPLIES = "Replies fetched successfully."
+    COMMENT_NOT_FOUND = "Comment not found."
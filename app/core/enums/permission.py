@@ -1,7 +1,20 @@
 from enum import Enum
+from typing import Iterable
 
 class UserRole(Enum):
     DEFAULT = 1
     STUDENT = 2
     TEACHER = 3
-    ADMIN = 4
\ No newline at end of file
+    ADMIN = 4
+
+    @property
+    def mask(self) -> int:
+        return 1 << self.value
+
+ROLE_MASKS = {role.name: role.mask for role in UserRole}
+
+def roles_to_mask(roles: Iterable[str]) -> int:
+    mask = 0
+    for role in roles:
+        mask |= ROLE_MASKS.get(role, 0)
+    return mask
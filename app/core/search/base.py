@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.common.cursor import encode_cursor, decode_cursor
+
+
+def encode_offset_cursor(offset: int) -> str:
+    return encode_cursor("offset", offset)
+
+
+def decode_offset_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    values = decode_cursor(cursor)
+    if len(values) != 2 or values[0] != "offset" or not values[1].isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return int(values[1])
+
+
+class SearchBackend(ABC):
+    """Finds post ids for a text query and/or a set of tags that must all match.
+
+    Results are ordered by relevance when a text query is given, otherwise by
+    recency; the caller hydrates the returned ids.
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        tags: List[str],
+        size: int,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[UUID], Optional[str]]:
+        ...
+
+    @abstractmethod
+    async def index_post(self, db: AsyncSession, post, tags: List[str]):
+        ...
+
+    @abstractmethod
+    async def remove_post(self, db: AsyncSession, post_id: UUID):
+        ...
@@ -0,0 +1,21 @@
+from core.search.base import SearchBackend
+from utils.config import SEARCH_BACKEND
+
+_backend: SearchBackend | None = None
+
+
+def get_search_backend() -> SearchBackend:
+    global _backend
+    if _backend is None:
+        if SEARCH_BACKEND == "memory":
+            from core.search.memory import MemorySearchBackend
+            _backend = MemorySearchBackend()
+        else:
+            from core.search.postgres import PostgresSearchBackend
+            _backend = PostgresSearchBackend()
+    return _backend
+
+
+def set_search_backend(backend: SearchBackend):
+    global _backend
+    _backend = backend
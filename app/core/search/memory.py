@@ -0,0 +1,104 @@
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.search.base import SearchBackend, encode_offset_cursor, decode_offset_cursor
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class MemorySearchBackend(SearchBackend):
+    """In-process inverted index with the same weighting as Postgres (title > content).
+
+    Intended for tests and local development; nothing is persisted.
+    """
+
+    TITLE_WEIGHT = 1.0
+    CONTENT_WEIGHT = 0.4
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[UUID, float]] = defaultdict(dict)
+        self._tags: Dict[str, Set[UUID]] = defaultdict(set)
+        self._docs: Dict[UUID, Tuple[datetime, Set[str], Set[str]]] = {}
+
+    def _unindex(self, post_id: UUID):
+        doc = self._docs.pop(post_id, None)
+        if doc is None:
+            return
+        _, terms, tags = doc
+        for term in terms:
+            postings = self._postings[term]
+            postings.pop(post_id, None)
+            if not postings:
+                del self._postings[term]
+        for tag in tags:
+            ids = self._tags[tag]
+            ids.discard(post_id)
+            if not ids:
+                del self._tags[tag]
+
+    async def index_post(self, db: AsyncSession, post, tags: List[str]):
+        self._unindex(post.id)
+
+        weights: Dict[str, float] = defaultdict(float)
+        for term in tokenize(post.title):
+            weights[term] += self.TITLE_WEIGHT
+        for term in tokenize(post.content):
+            weights[term] += self.CONTENT_WEIGHT
+
+        for term, weight in weights.items():
+            self._postings[term][post.id] = weight
+        for tag in tags:
+            self._tags[tag].add(post.id)
+
+        created_at = post.created_at or datetime.now(timezone.utc)
+        self._docs[post.id] = (created_at, set(weights), set(tags))
+
+    async def remove_post(self, db: AsyncSession, post_id: UUID):
+        self._unindex(post_id)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        tags: List[str],
+        size: int,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[UUID], Optional[str]]:
+        terms = set(tokenize(text))
+        # Yalnızca noktalama gibi terimsiz bir sorgu Postgres'te de hiçbir şeyle eşleşmez;
+        # boş metin ancak etiket filtresiyle anlamlıdır.
+        if not terms and (text.strip() or not tags):
+            return [], None
+
+        candidates: Optional[Set[UUID]] = None
+        for tag in tags:
+            ids = self._tags.get(tag, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+
+        scores: Dict[UUID, float] = defaultdict(float)
+        for term in terms:
+            postings = self._postings.get(term, {})
+            candidates = set(postings) if candidates is None else candidates & postings.keys()
+            for post_id in candidates:
+                scores[post_id] += postings.get(post_id, 0.0)
+
+        ordered = sorted(
+            candidates,
+            key=lambda i: (scores.get(i, 0.0), self._docs[i][0], i),
+            reverse=True
+        )
+
+        position = offset or decode_offset_cursor(cursor)
+        page = ordered[position:position + size]
+        next_cursor = encode_offset_cursor(position + size) if len(ordered) > position + size else None
+        return page, next_cursor
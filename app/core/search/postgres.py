@@ -0,0 +1,39 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.search.base import SearchBackend, encode_offset_cursor, decode_offset_cursor
+from repositories.post_repository import PostRepository
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Uses the generated `posts.search_vector` column (GIN) and `post_tags`."""
+
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        tags: List[str],
+        size: int,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[UUID], Optional[str]]:
+        repo = PostRepository(db)
+
+        if not text:
+            return await repo.filter_ids(tags, size, cursor)
+
+        # Relevans sırası keyset'e uygun değil; konum imzalı cursor içinde taşınır.
+        position = offset or decode_offset_cursor(cursor)
+        ids = await repo.search_ids(text, tags, size + 1, position)
+        if len(ids) <= size:
+            return ids, None
+        return ids[:size], encode_offset_cursor(position + size)
+
+    async def index_post(self, db: AsyncSession, post, tags: List[str]):
+        # search_vector Postgres tarafından hesaplanır, post_tags yazma sırasında güncellenir.
+        return None
+
+    async def remove_post(self, db: AsyncSession, post_id: UUID):
+        return None
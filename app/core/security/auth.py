@@ -1,28 +1,70 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from validators.auth_models import JwtPayload
 from core.security.crypto import verify_jwt
+from core.security.token_cache import token_cache
 from core.enums.permission import UserRole
 
 bearer_scheme = HTTPBearer()
+optional_bearer_scheme = HTTPBearer(auto_error=False)
+
+def verify_token(token: str) -> JwtPayload:
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = verify_jwt(token)
+        token_cache.put(token, payload)
+    return payload
+
+def verify_request_token(request: Request) -> JwtPayload | None:
+    """Claims of the request's bearer token, or None if it is missing or does not verify.
+
+    For code that runs before route dependencies (e.g. the response cache).
+    """
+    payload = getattr(request.state, "claims", None)
+    if payload is not None:
+        return payload
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = verify_token(token)
+    except HTTPException:
+        return None
+    request.state.claims = payload
+    return payload
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
 ) -> JwtPayload:
-    return verify_jwt(credentials.credentials)
-    
+    # İstek başına tek çözümleme; diğer bağımlılıklar request.state.claims'i paylaşır.
+    payload = getattr(request.state, "claims", None)
+    if payload is not None:
+        return payload
+
+    payload = verify_token(credentials.credentials)
+    request.state.claims = payload
+    return payload
+
+async def get_optional_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_bearer_scheme)
+) -> JwtPayload | None:
+    if credentials is None:
+        return None
+    return await get_current_user(request, credentials)
+
 def required_roles(*required: UserRole):
-    async def wrapper(
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
-    ):
-        payload = verify_jwt(credentials.credentials)
-        user_roles = set(payload.roles)
-        required_roles = set(r.name for r in required)
-    
-        if not (user_roles & required_roles):
+    required_mask = 0
+    for role in required:
+        required_mask |= role.mask
+
+    async def wrapper(_claims: JwtPayload = Depends(get_current_user)) -> JwtPayload:
+        if not (_claims.role_mask & required_mask):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You do not have permission for this operation."
             )
-    return Depends(wrapper)
\ No newline at end of file
+        return _claims
+    return Depends(wrapper)
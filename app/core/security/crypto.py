@@ -1,18 +1,27 @@
 import datetime
+import hashlib
 from uuid import UUID
 from bcrypt import hashpw, gensalt, checkpw
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
 
 from validators.auth_models import JwtPayload
-from utils.config import JWT_ALGORITHM, JWT_SECRET_KEY
+from core.enums.permission import roles_to_mask
+from utils.config import JWT_ALGORITHM, JWT_SECRET_KEY, BCRYPT_ROUNDS
 
-def hash_pwd(pwd: str) -> str:
-    return hashpw(pwd.encode(), gensalt()).decode()
+def hash_pwd(pwd: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    return hashpw(pwd.encode(), gensalt(rounds)).decode()
+
+def get_pwd_rounds(hash: str) -> int:
+    # bcrypt hash formatı: $2b$<cost>$<salt+digest>
+    return int(hash.split("$")[2])
 
 def verify_pwd(pwd: str, hash: str) -> bool:
     return checkpw(pwd.encode(), hash.encode())
 
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def create_jwt(data: JwtPayload) -> str:
     to_encode = data.model_dump()
     to_encode["user_id"] = str(to_encode["user_id"])
@@ -22,10 +31,14 @@ def create_jwt(data: JwtPayload) -> str:
 def verify_jwt(token: str) -> JwtPayload:
     try:
         res = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        role_mask = res.get("role_mask")
+        if role_mask is None:
+            role_mask = roles_to_mask(res["roles"])
         return JwtPayload(
             user_id=UUID(res["user_id"]),
             username=res["username"],
             roles=res["roles"],
+            role_mask=role_mask,
             iat=res["iat"],
             exp=res["exp"],
             jti=UUID(res["jti"])
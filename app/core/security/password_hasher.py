@@ -0,0 +1,128 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from core.security.crypto import hash_pwd, verify_pwd, get_pwd_rounds
+from utils.config import (
+    BCRYPT_ROUNDS,
+    PWD_HASH_EXECUTOR,
+    PWD_HASH_WORKERS,
+    PWD_HASH_QUEUE_SIZE,
+    PWD_HASH_ADMISSION_TIMEOUT
+)
+
+
+def _timed(fn, *args):
+    # Worker tarafında çalışır; kuyrukta bekleme süresini ölçebilmek için başlangıç zamanını da döner.
+    return time.time(), fn(*args)
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded worker pool so it never blocks the event loop."""
+
+    def __init__(
+        self,
+        rounds: int,
+        executor: str,
+        workers: int,
+        queue_size: int,
+        admission_timeout: float
+    ):
+        self.rounds = rounds
+        self.executor_kind = executor
+        self.workers = workers
+        self.queue_size = queue_size
+        self.admission_timeout = admission_timeout
+
+        self._executor: Executor | None = None
+        self._slots = asyncio.Semaphore(workers + queue_size)
+        self._waiting = 0
+        self._in_flight = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="pwd-hash"
+                )
+        return self._executor
+
+    async def _run(self, fn, *args):
+        submitted = time.time()
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.admission_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Password hashing queue is full, try again later.",
+                headers={"Retry-After": "1"}
+            )
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(self._get_executor(), _timed, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+        waited = max(started - submitted, 0.0)
+        self.completed += 1
+        self.wait_time_total += waited
+        self.wait_time_max = max(self.wait_time_max, waited)
+        return result
+
+    async def hash(self, pwd: str) -> str:
+        return await self._run(hash_pwd, pwd, self.rounds)
+
+    async def verify(self, pwd: str, hash: str) -> bool:
+        return await self._run(verify_pwd, pwd, hash)
+
+    def needs_rehash(self, hash: str) -> bool:
+        return get_pwd_rounds(hash) != self.rounds
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting + max(self._in_flight - self.workers, 0)
+
+    def stats(self) -> dict:
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_time_avg": self.wait_time_total / self.completed if self.completed else 0.0,
+            "wait_time_max": self.wait_time_max
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    rounds=BCRYPT_ROUNDS,
+    executor=PWD_HASH_EXECUTOR,
+    workers=PWD_HASH_WORKERS,
+    queue_size=PWD_HASH_QUEUE_SIZE,
+    admission_timeout=PWD_HASH_ADMISSION_TIMEOUT
+)
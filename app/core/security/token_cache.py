@@ -0,0 +1,98 @@
+import hashlib
+import heapq
+import time
+from collections import OrderedDict
+
+from validators.auth_models import JwtPayload
+from utils.config import JWT_CACHE_SIZE
+
+
+class TokenCache:
+    """Bounded LRU of already verified access tokens, keyed by token digest.
+
+    Entries never outlive the token: a lookup at or after `exp` is a miss and
+    expired entries are dropped from a min-heap on every insert.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, JwtPayload]] = OrderedDict()
+        self._expiry: list[tuple[float, bytes]] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> JwtPayload | None:
+        if self.max_size <= 0:
+            return None
+
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        exp, payload = entry
+        if time.time() >= exp:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: JwtPayload):
+        if self.max_size <= 0:
+            return
+
+        now = time.time()
+        self._purge_expired(now)
+
+        exp = payload.exp.timestamp()
+        if now >= exp:
+            return
+
+        key = self._digest(token)
+        self._entries[key] = (exp, payload)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._expiry, (exp, key))
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        # LRU ile düşen kayıtlar heap'te kalır; heap'in sınırsız büyümesini engelle.
+        if len(self._expiry) > 2 * self.max_size:
+            self._expiry = [(e, k) for k, (e, _) in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def _purge_expired(self, now: float):
+        while self._expiry and self._expiry[0][0] <= now:
+            exp, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == exp:
+                del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+        self._expiry.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+token_cache = TokenCache(max_size=JWT_CACHE_SIZE)
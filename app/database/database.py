@@ -1,17 +1,52 @@
+from urllib.parse import urlparse
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from utils.config import DATABASE_URL, is_dev
+from core.security.token_cache import token_cache
+from database import diagnostics
+from database.instrumentation import instrument_engine
+from database.pool import MonitoredQueuePool
+from database.replicas import Replica, ReplicaRouter
+from utils.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_CACHE_SIZE,
+    REPLICA_DATABASE_URLS,
+    REPLICA_STICKY_SECONDS,
+    REPLICA_MAX_LAG,
+    DB_DIAGNOSTICS,
+    is_dev
+)
 
 ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
 Base = declarative_base()
 
-engine: AsyncEngine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    # echo=is_dev(),
-    echo=False,
-    future=True
-)
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        # echo=is_dev(),
+        echo=False,
+        future=True,
+        poolclass=MonitoredQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={
+            # asyncpg'nin kendi önbelleği ve SQLAlchemy adaptörünün hazır ifade önbelleği.
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE
+        }
+    )
+
+engine: AsyncEngine = _create_engine(ASYNC_DATABASE_URL)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -19,6 +54,75 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
-async def get_db():
+replica_router = ReplicaRouter(
+    replicas=[
+        Replica(
+            name=f"{urlparse(url).hostname}:{urlparse(url).port or 5432}",
+            engine=_create_engine(url.replace("postgresql://", "postgresql+asyncpg://"))
+        )
+        for url in REPLICA_DATABASE_URLS
+    ],
+    sticky_seconds=REPLICA_STICKY_SECONDS,
+    max_lag=REPLICA_MAX_LAG
+)
+
+instrument_engine(engine, "primary")
+for _replica in replica_router.replicas:
+    instrument_engine(_replica.engine, _replica.name)
+
+if DB_DIAGNOSTICS:
+    diagnostics.install(engine, "primary")
+    for _replica in replica_router.replicas:
+        diagnostics.install(_replica.engine, _replica.name)
+
+_READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# session.info anahtarı: repository'ler commit yerine flush eder, istek tek commit ile biter.
+UNIT_OF_WORK = "unit_of_work"
+
+def _request_user_id(request: Request):
+    claims = getattr(request.state, "claims", None)
+    if claims is not None:
+        return claims.user_id
+    # Route kimlik doğrulamıyorsa, daha önce doğrulanmış token önbellekte olabilir.
+    auth = request.headers.get("authorization", "")
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        cached = token_cache.get(token)
+        return cached.user_id if cached else None
+    return None
+
+async def get_db(request: Request):
+    writes = bool(replica_router.replicas) and request.method not in _READ_METHODS
+    if writes:
+        # yield sonrası temizlik yanıt gönderildikten sonra çalışır; işaret orada
+        # konursa istemcinin hemen ardından gelen GET'i gecikmeli replikaya gidebilir.
+        # Kimlik bağımlılıkları route'larda get_db'den önce çözülür.
+        replica_router.mark_write(_request_user_id(request))
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        session.info[UNIT_OF_WORK] = True
+        try:
+            yield session
+            # Servis zaten commit ettiyse no-op; açık kalan işlemi kapatmak ROLLBACK ile aynı maliyette.
+            if session.in_transaction():
+                await session.commit()
+        finally:
+            if writes:
+                # Uzun süren yazmalarda pencere yazmanın bittiği andan yeniden başlar.
+                replica_router.mark_write(_request_user_id(request))
+
+async def get_read_db(request: Request):
+    """Read-only session: a healthy replica, or the primary right after the same user wrote."""
+    replica = replica_router.pick(_request_user_id(request)) if replica_router.replicas else None
+    if replica is None:
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+
+    async with replica.session_factory() as session:
+        try:
+            yield session
+        except DBAPIError as e:
+            if e.connection_invalidated:
+                replica_router.mark_down(replica)
+            raise
@@ -0,0 +1,159 @@
+"""
+İsteğe bağlı sorgu tanılama: yavaş sorgu logu, N+1 tespiti ve testler için sorgu bütçesi.
+
+DB_DIAGNOSTICS=true ile birincil ve replika engine'lere bağlanır. Sorgular,
+MetricsMiddleware'in açtığı istek bağlamından route şablonunu alır; istek
+dışındaki (arka plan) sorgular route'suz loglanır.
+
+Testlerde (bkz. tests/test_post_queries.py):
+
+    from database.diagnostics import query_budget
+
+    with query_budget(3, max_repeats=1):
+        await PostService(db).get_all_posts(50, 0, [], "", viewer_id=viewer_id)
+
+Bir istemciyle route üzerinden çağrıldığında `route="/api/v1/Post"` yalnızca o
+route'un ifadelerini sayar.
+"""
+import re
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from database.instrumentation import current_stats
+from utils.config import DB_N_PLUS_ONE_THRESHOLD, DB_SLOW_QUERY_MS
+from utils.logger import logger
+from utils.metrics import registry
+
+slow_queries = registry.counter("db_slow_queries", "Statements slower than DB_SLOW_QUERY_MS", ("route",))
+repeated_queries = registry.counter(
+    "db_repeated_statements",
+    "Requests that ran one normalized statement more than DB_N_PLUS_ONE_THRESHOLD times",
+    ("route",)
+)
+
+_START_KEY = "diagnostics_started_at"
+_installed = weakref.WeakSet()
+_MAX_LOGGED_CHARS = 500
+
+_IN_LIST_RE = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:::[\w\[\]]+)?(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?)(?:::[\w\[\]]+)?)*\s*\)")
+_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """Same shape, same key: placeholders, literals and IN-list lengths are erased."""
+    statement = _IN_LIST_RE.sub("(?)", statement)
+    statement = _PARAM_RE.sub("?", statement)
+    statement = _LITERAL_RE.sub("?", statement)
+    return _SPACE_RE.sub(" ", statement).strip()
+
+
+def _short(statement: str) -> str:
+    return statement if len(statement) <= _MAX_LOGGED_CHARS else statement[:_MAX_LOGGED_CHARS] + "..."
+
+
+class QueryBudget:
+    def __init__(self, max_queries: int, route: Optional[str], max_repeats: Optional[int]):
+        self.max_queries = max_queries
+        self.route = route
+        self.max_repeats = max_repeats
+        self.statements: Counter = Counter()
+
+    def record(self, route: Optional[str], statement: str):
+        if self.route is None or route == self.route:
+            self.statements[statement] += 1
+
+    def check(self):
+        total = sum(self.statements.values())
+        repeated = [
+            (s, n) for s, n in self.statements.items()
+            if self.max_repeats is not None and n > self.max_repeats
+        ]
+        if total <= self.max_queries and not repeated:
+            return
+        where = f" on {self.route}" if self.route else ""
+        lines = [f"{total} queries{where}, budget {self.max_queries}:"]
+        lines += [f"  {n:>4} x {_short(s)}" for s, n in self.statements.most_common()]
+        raise AssertionError("\n".join(lines))
+
+
+# Testler sıralı çalışır; bütçe, isteği başka bir iş parçacığında koşturan
+# istemcilerde de (TestClient) görülsün diye contextvar yerine modül düzeyinde.
+_budgets: List[QueryBudget] = []
+
+
+def install(engine: AsyncEngine, name: str):
+    """Hooks the diagnostics listeners onto `engine` once."""
+    sync_engine = engine.sync_engine
+    if sync_engine in _installed:
+        return
+    _installed.add(sync_engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info[_START_KEY].pop()) * 1000
+        stats = current_stats()
+        route = stats.route if stats is not None else None
+
+        if elapsed_ms >= DB_SLOW_QUERY_MS:
+            slow_queries.labels(route or "-").inc()
+            logger.warning("Slow query (%.1f ms) on %s [%s]: %s", elapsed_ms, route or "-", name, _short(statement))
+
+        normalized = normalize_statement(statement)
+        if stats is not None:
+            if stats.statements is None:
+                stats.statements = {}
+            count = stats.statements.get(normalized, 0) + 1
+            stats.statements[normalized] = count
+            # Eşik aşıldığında istek başına bir kez.
+            if count == DB_N_PLUS_ONE_THRESHOLD + 1:
+                repeated_queries.labels(route or "-").inc()
+                logger.warning(
+                    "Possible N+1 on %s: statement ran more than %d times: %s",
+                    route or "-", DB_N_PLUS_ONE_THRESHOLD, _short(normalized)
+                )
+        for budget in _budgets:
+            budget.record(route, normalized)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context):
+        conn = context.connection
+        if context.cursor is not None and conn is not None and conn.info.get(_START_KEY):
+            conn.info[_START_KEY].pop()
+
+
+@contextmanager
+def query_budget(max_queries: int, route: Optional[str] = None, max_repeats: Optional[int] = None) -> Iterator[QueryBudget]:
+    """Fails with AssertionError when the block runs more than `max_queries` statements.
+
+    With `route` only statements issued while serving that route template count;
+    `max_repeats` additionally caps how often one normalized statement may run.
+    Listeners are installed on demand, so DB_DIAGNOSTICS need not be set in tests.
+    """
+    # database.database bu modülü içe aktarır; döngüyü kırmak için burada.
+    from database.database import engine, replica_router
+
+    install(engine, "primary")
+    for replica in replica_router.replicas:
+        install(replica.engine, replica.name)
+
+    budget = QueryBudget(max_queries, route, max_repeats)
+    _budgets.append(budget)
+    try:
+        yield budget
+    finally:
+        _budgets.remove(budget)
+    budget.check()
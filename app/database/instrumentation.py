@@ -0,0 +1,77 @@
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from utils.metrics import registry
+
+db_queries = registry.counter("db_queries", "SQL statements executed", ("engine",))
+db_query_seconds = registry.histogram("db_query_seconds", "Time per SQL statement", ("engine",))
+
+_START_KEY = "query_started_at"
+
+
+class QueryStats:
+    """DB work attributed to one request; carried in a contextvar."""
+
+    __slots__ = ("scope", "queries", "time", "statements")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.queries = 0
+        self.time = 0.0
+        # Normalize edilmiş ifade -> sayı; yalnızca diagnostics açıkken doldurulur.
+        self.statements: Optional[Dict[str, int]] = None
+
+    @property
+    def route(self) -> Optional[str]:
+        if self.scope is None:
+            return None
+        # Router eşleşen route'u scope'a yazar; eşleşmeden önce ham yol kullanılır.
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path")
+
+
+# AsyncSession olay dinleyicileri çağıran görevin bağlamında (greenlet) çalışır;
+# nesne değiştirilebilir olduğu için alt görevlerin sorguları da aynı isteğe yazılır.
+_current: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def start_request(scope: Optional[dict] = None) -> QueryStats:
+    stats = QueryStats(scope)
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def instrument_engine(engine: AsyncEngine, name: str):
+    sync_engine = engine.sync_engine
+    queries = db_queries.labels(name)
+    durations = db_query_seconds.labels(name)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info[_START_KEY].pop()
+        elapsed = time.perf_counter() - started
+        queries.inc()
+        durations.observe(elapsed)
+        stats = _current.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.time += elapsed
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context):
+        # Hata alan ifade için after_cursor_execute gelmez; başlangıç zamanı yığında kalmasın.
+        conn = context.connection
+        if context.cursor is not None and conn is not None and conn.info.get(_START_KEY):
+            conn.info[_START_KEY].pop()
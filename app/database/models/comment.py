@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Table, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Table, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from database.database import Base
@@ -23,6 +23,10 @@ class Comment(Base):
     creator_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     post_id = Column(UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"))
 
+    __table_args__ = (
+        Index("ix_comments_post_created_at_id", "post_id", "created_at", "id"),
+    )
+
     creator = relationship("User", backref="comments")
     post = relationship("Post", backref="comments")
     replies = relationship(
@@ -42,6 +46,10 @@ class Reply(Base):
     creator_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     comment_id = Column(UUID(as_uuid=True), ForeignKey("comments.id", ondelete="CASCADE"))
 
+    __table_args__ = (
+        Index("ix_replies_comment_created_at_id", "comment_id", "created_at", "id"),
+    )
+
     creator = relationship("User", backref="replies")
     comments = relationship(
         "Comment",
@@ -1,16 +1,21 @@
 import uuid
 
-from sqlalchemy import Column, ForeignKey, String, DateTime, Table, Text, Integer, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, ForeignKey, String, DateTime, Table, Text, Integer, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from ..database import Base
 from database.models.user import user_upvoted_posts
+from utils.config import SEARCH_TEXT_CONFIG
+
+# Liste görünümlerinde içerik yerine gösterilen önizlemenin uzunluğu (karakter).
+EXCERPT_LENGTH = 280
 
 post_tags = Table(
     "post_tags",
     Base.metadata,
     Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True),
-    Column("post_id", UUID(as_uuid=True), ForeignKey("posts.id"), primary_key=True)
+    Column("post_id", UUID(as_uuid=True), ForeignKey("posts.id"), primary_key=True),
+    Index("ix_post_tags_post_id", "post_id")
 )
 
 post_comments = Table(
@@ -25,12 +30,29 @@ class Post(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(100), nullable=False)
-    content = Column(Text, nullable=False)
+    # Büyük kolonlar varsayılan olarak yüklenmez; erişim gizli bir sorgu yerine hata verir (undefer gerekir).
+    content = deferred(Column(Text, nullable=False), raiseload=True)
+    excerpt = Column(Text, Computed(f"left(content, {EXCERPT_LENGTH})", persisted=True))
     upvotes = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     creator_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
 
+    # Başlık içerikten daha ağır basar (A > B); Postgres kolonu kendisi güncel tutar.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(content, '')), 'B')",
+            persisted=True
+        )
+    ), raiseload=True)
+
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_creator_created_at_id", "creator_id", "created_at", "id"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     creator = relationship("User", back_populates="posts")
     tags = relationship(
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, ARRAY, Table, func 
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, ARRAY, Table, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,13 +19,15 @@ user_followed_users = Table(
     Base.metadata,
     Column("user_id", UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
     Column("creator_id", UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Index("ix_user_followed_users_creator_id", "creator_id", "user_id"),
 )
 
 user_followed_tags = Table(
     "user_followed_tags",
     Base.metadata,
-    Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id")),
-    Column("user_id", UUID(as_uuid=True), ForeignKey("users.id"))
+    Column("user_id", UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True),
+    Index("ix_user_followed_tags_tag_id", "tag_id", "user_id"),
 )
 
 class User(Base):
@@ -41,6 +43,18 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Takip ve post sayılarının denormalize kopyaları; yazma ile aynı transaction'da güncellenir.
+    followers_count = Column(Integer, nullable=False, default=0, server_default="0")
+    following_count = Column(Integer, nullable=False, default=0, server_default="0")
+    posts_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # UPDATE sonrası updated_at ayrı bir SELECT yerine RETURNING ile gelir.
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
     posts = relationship("Post", back_populates="creator")
 
     upvoted_posts = relationship(
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from utils.logger import logger
+
+# Birincil sunucuda NULL döner; replikada WAL tamamen uygulandıysa boşta olsa bile gecikme 0 sayılır.
+_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        self.healthy = True
+        self.lag: Optional[float] = None
+        self.failures = 0
+        self.sessions = 0
+
+
+class ReplicaRouter:
+    """Round-robins read sessions over healthy replicas.
+
+    A user who wrote within the last `sticky_seconds` reads from the primary so
+    they see their own writes; with no healthy replica every read goes there.
+
+    Sticky marks and replica health are per process: with several workers a
+    read served by another worker does not see this worker's marks.
+    """
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        sticky_seconds: float,
+        max_lag: float,
+        check_timeout: float = 2.0
+    ):
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self.max_lag = max_lag
+        self.check_timeout = check_timeout
+
+        self._next = 0
+        self._sticky: OrderedDict[Hashable, float] = OrderedDict()
+
+        self.primary_reads = 0
+        self.sticky_reads = 0
+
+    def mark_write(self, user_id: Hashable):
+        if not self.replicas or user_id is None:
+            return
+        now = time.monotonic()
+        self._sticky.pop(user_id, None)
+        self._sticky[user_id] = now + self.sticky_seconds
+        # Pencere sabit olduğundan en eski kayıtlar en önde; süresi dolanları baştan at.
+        while self._sticky:
+            key, until = next(iter(self._sticky.items()))
+            if until > now:
+                break
+            del self._sticky[key]
+
+    def is_sticky(self, user_id: Hashable) -> bool:
+        until = self._sticky.get(user_id)
+        return until is not None and until > time.monotonic()
+
+    def pick(self, user_id: Hashable = None) -> Optional[Replica]:
+        if not self.replicas:
+            return None
+        if user_id is not None and self.is_sticky(user_id):
+            self.sticky_reads += 1
+            return None
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                replica.sessions += 1
+                return replica
+        self.primary_reads += 1
+        return None
+
+    def mark_down(self, replica: Replica):
+        if replica.healthy:
+            logger.warning("Replica %s taken out of rotation", replica.name)
+        replica.healthy = False
+        replica.failures += 1
+
+    @staticmethod
+    async def _lag(replica: Replica) -> Optional[float]:
+        async with replica.engine.connect() as conn:
+            return (await conn.execute(_LAG_QUERY)).scalar()
+
+    async def _check(self, replica: Replica):
+        try:
+            lag = await asyncio.wait_for(self._lag(replica), self.check_timeout)
+        except Exception:
+            self.mark_down(replica)
+            return
+
+        replica.lag = float(lag) if lag is not None else 0.0
+        if replica.lag > self.max_lag:
+            self.mark_down(replica)
+            return
+        if not replica.healthy:
+            logger.info("Replica %s back in rotation", replica.name)
+        replica.healthy = True
+
+    async def check_health(self):
+        await asyncio.gather(*(self._check(r) for r in self.replicas))
+
+    async def dispose(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> dict:
+        return {
+            "sticky_users": len(self._sticky),
+            "sticky_reads": self.sticky_reads,
+            "primary_fallback_reads": self.primary_reads,
+            "replicas": [
+                {
+                    "name": r.name,
+                    "healthy": r.healthy,
+                    "lag": r.lag,
+                    "failures": r.failures,
+                    "sessions": r.sessions,
+                    "pool": r.engine.pool.stats()
+                }
+                for r in self.replicas
+            ]
+        }
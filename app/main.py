@@ -1,26 +1,63 @@
 import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI, HTTPException, Request, logger
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from database.init_db import init_db
 from utils.logger import setup_logging, logger
 from api.api_router import setup_routers
+from core.security.password_hasher import password_hasher
+from services.token_sweeper import token_sweeper
+from services.upvote_buffer import upvote_buffer
+from services.counter_reconciler import counter_reconciler
+from services.replica_monitor import replica_monitor
+from database.database import replica_router
+from middleware.compression import CompressionMiddleware
+from middleware.metrics import MetricsMiddleware
+from utils.config import COMPRESSION_ENABLED
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    token_sweeper.start()
+    upvote_buffer.start()
+    counter_reconciler.start()
+    replica_monitor.start()
+    yield
+    await replica_monitor.stop()
+    await replica_router.dispose()
+    await counter_reconciler.stop()
+    await upvote_buffer.stop()
+    await token_sweeper.stop()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title="GaziPass API",
     version="0.0.1",
     description="",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     return JSONResponse(
         status_code=exc.status_code,
-        content={"success": False, "message": str(exc.detail)}
+        content={"success": False, "message": str(exc.detail)},
+        headers=exc.headers
+    )
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    # Havuz dolu: 500 yerine istemcinin tekrar deneyebileceği 503.
+    logger.warning("DB pool timeout on %s %s", request.method, request.url)
+    return JSONResponse(
+        status_code=503,
+        content={"success": False, "message": "Service is busy, try again later."},
+        headers={"Retry-After": "1"}
     )
 
 @app.exception_handler(RequestValidationError)
@@ -39,6 +76,11 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
         content={"success": False, "message": "Internal Server Error"},
     )
 
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+# En dışta: gecikme sıkıştırmayı da kapsar.
+app.add_middleware(MetricsMiddleware)
+
 setup_routers(app)
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.common.compression import (
+    StreamCompressor,
+    compress_body,
+    compression_stats,
+    is_compressible,
+    negotiate,
+    policy_for
+)
+
+
+class CompressionMiddleware:
+    """Compresses responses with the best codec the client accepts.
+
+    Buffered bodies below the route's `min_size` go out as-is; streamed bodies
+    are compressed chunk by chunk. Responses that already carry a
+    Content-Encoding (e.g. precompressed cache hits) pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            compression_stats.skipped_identity += 1
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressionResponder(scope, send, encoding).send)
+
+
+class _CompressionResponder:
+    def __init__(self, scope: Scope, send: Send, encoding: str):
+        self.scope = scope
+        self.downstream = send
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[StreamCompressor] = None
+
+    def _eligible(self, headers: MutableHeaders, policy) -> bool:
+        return (
+            policy.enabled
+            and self.start["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and "no-transform" not in headers.get("cache-control", "")
+            and is_compressible(headers.get("content-type"))
+        )
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Gövdenin ilk parçası görülene kadar başlıklar bekletilir; karar boyuta göre verilir.
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send_start()
+            await self.downstream(message)
+            return
+
+        if self.stream is not None:
+            chunk = self.stream.compress(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if not more_body:
+                chunk += self.stream.finish()
+            await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start["headers"])
+        policy = policy_for(self.scope.get("endpoint"))
+
+        if not self._eligible(headers, policy):
+            self.passthrough = True
+            await self._send_start()
+            await self.downstream(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        level = policy.level_for(self.encoding)
+
+        if not more_body:
+            if len(body) < policy.min_size:
+                compression_stats.skipped_small += 1
+                self.passthrough = True
+                await self._send_start()
+                await self.downstream(message)
+                return
+            body = compress_body(body, self.encoding, level)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(body))
+            await self._send_start()
+            await self.downstream({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        # Akış: toplam boyut bilinmez, eşik uygulanmaz; Content-Length kaldırılır.
+        self.stream = StreamCompressor(self.encoding, level)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        await self._send_start()
+        await self.downstream({"type": "http.response.body", "body": self.stream.compress(body), "more_body": True})
+
+    async def _send_start(self):
+        if self.start is not None:
+            await self.downstream(self.start)
+            self.start = None
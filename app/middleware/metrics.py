@@ -0,0 +1,57 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from database.instrumentation import start_request
+from utils.metrics import COUNT_BUCKETS, registry
+
+requests_total = registry.counter("http_requests", "HTTP requests by route and status", ("method", "route", "status"))
+request_seconds = registry.histogram("http_request_seconds", "HTTP request latency", ("method", "route"))
+requests_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being served", ("method",))
+request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements per HTTP request",
+    ("method", "route"),
+    buckets=COUNT_BUCKETS
+)
+request_db_seconds = registry.histogram("http_request_db_seconds", "DB time per HTTP request", ("method", "route"))
+
+# Eşleşmeyen yollar (404) ham URL yerine tek etiket altında toplanır.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Records count, latency, in-flight requests and DB work per route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        in_flight = requests_in_flight.labels(method)
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        db = start_request(scope)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            # Router eşleşen route'u scope'a yazar; şablon (/Post/{post_id}) etiket sayısını sınırlı tutar.
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            requests_total.labels(method, route, str(status)).inc()
+            request_seconds.labels(method, route).observe(elapsed)
+            request_db_queries.labels(method, route).observe(db.queries)
+            request_db_seconds.labels(method, route).observe(db.time)
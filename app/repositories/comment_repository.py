@@ -1,6 +1,100 @@
-from database.models.comment import Comment
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_
+
+from database.models.comment import Comment, Reply
+from database.models.post import Post
+from database.models.user import User
 from core.common.base_repository import BaseRepository
 
 
 class CommentRepository(BaseRepository[Comment]):
-    model = Comment
\ No newline at end of file
+    model = Comment
+
+    async def fetch_comments_page(
+        self,
+        post_id: UUID,
+        size: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[dict]:
+        """Bir postun üst seviye yorumları, eskiden yeniye; ORM nesnesi yerine düz satırlar."""
+        q = (
+            select(
+                Comment.id,
+                Comment.content,
+                Comment.created_at,
+                Comment.updated_at,
+                User.username.label("creator")
+            )
+            .outerjoin(User, User.id == Comment.creator_id)
+            .where(Comment.post_id == post_id)
+        )
+        if after is not None:
+            q = q.where(tuple_(Comment.created_at, Comment.id) > tuple_(*after))
+        q = q.order_by(Comment.created_at, Comment.id).limit(size)
+        res = await self.db.execute(q)
+        return [dict(r) for r in res.mappings().all()]
+
+    async def fetch_replies_for(self, comment_ids: List[UUID], size: int) -> List[dict]:
+        """Her yorum için ilk `size` yanıt, tek sorguda (yorum başına row_number penceresi)."""
+        if not comment_ids:
+            return []
+        rn = func.row_number().over(
+            partition_by=Reply.comment_id,
+            order_by=(Reply.created_at, Reply.id)
+        ).label("rn")
+        ranked = (
+            select(
+                Reply.id,
+                Reply.comment_id,
+                Reply.content,
+                Reply.created_at,
+                Reply.updated_at,
+                User.username.label("creator"),
+                rn
+            )
+            .outerjoin(User, User.id == Reply.creator_id)
+            .where(Reply.comment_id.in_(comment_ids))
+            .subquery()
+        )
+        q = (
+            select(ranked)
+            .where(ranked.c.rn <= size)
+            .order_by(ranked.c.comment_id, ranked.c.rn)
+        )
+        res = await self.db.execute(q)
+        return [dict(r) for r in res.mappings().all()]
+
+    async def fetch_replies_page(
+        self,
+        comment_id: UUID,
+        size: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[dict]:
+        q = (
+            select(
+                Reply.id,
+                Reply.comment_id,
+                Reply.content,
+                Reply.created_at,
+                Reply.updated_at,
+                User.username.label("creator")
+            )
+            .outerjoin(User, User.id == Reply.creator_id)
+            .where(Reply.comment_id == comment_id)
+        )
+        if after is not None:
+            q = q.where(tuple_(Reply.created_at, Reply.id) > tuple_(*after))
+        q = q.order_by(Reply.created_at, Reply.id).limit(size)
+        res = await self.db.execute(q)
+        return [dict(r) for r in res.mappings().all()]
+
+    async def exists(self, id: UUID) -> bool:
+        res = await self.db.execute(select(Comment.id).where(Comment.id == id))
+        return res.scalar_one_or_none() is not None
+
+    async def post_exists(self, post_id: UUID) -> bool:
+        res = await self.db.execute(select(Post.id).where(Post.id == post_id))
+        return res.scalar_one_or_none() is not None
@@ -1,6 +1,246 @@
-from core.common.base_repository import BaseRepository
-from database.models.post import Post
+import heapq
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, delete, func, insert, select, true, tuple_
+from sqlalchemy.orm import joinedload, raiseload, selectinload, undefer
+
+from core.common.base_repository import BaseRepository, chunked
+from database.models.post import Post, post_tags, post_comments
+from database.models.tag import Tag
+from database.models.user import User, user_upvoted_posts, user_followed_users, user_followed_tags
+from utils.config import SEARCH_TEXT_CONFIG
 
 
 class PostRepository(BaseRepository[Post]):
-    model = Post
\ No newline at end of file
+    model = Post
+
+    def _tag_filter(self, tags: List[str]):
+        # Tüm etiketleri taşıyan postlar: post_tags üzerinde kesişim.
+        tags = list(set(tags))
+        return self.model.id.in_(
+            select(post_tags.c.post_id)
+            .join(Tag, Tag.id == post_tags.c.tag_id)
+            .where(Tag.tag.in_(tags))
+            .group_by(post_tags.c.post_id)
+            .having(func.count(post_tags.c.tag_id) == len(tags))
+        )
+
+    async def search_ids(self, text: str, tags: List[str], size: int, offset: int) -> List[UUID]:
+        tsquery = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, text)
+        rank = func.ts_rank_cd(self.model.search_vector, tsquery)
+
+        q = select(self.model.id).where(self.model.search_vector.op("@@")(tsquery))
+        if tags:
+            q = q.where(self._tag_filter(tags))
+        q = (
+            q.order_by(rank.desc(), self.model.created_at.desc(), self.model.id.desc())
+            .offset(offset)
+            .limit(size)
+        )
+        res = await self.db.execute(q)
+        return list(res.scalars().all())
+
+    async def filter_ids(self, tags: List[str], size: int, cursor: Optional[str]) -> Tuple[List[UUID], Optional[str]]:
+        q = select(self.model.id, self.model.created_at)
+        if tags:
+            q = q.where(self._tag_filter(tags))
+        res = await self.db.execute(self._keyset(q, size, cursor))
+        rows, next_cursor = self._page(res.all(), size)
+        return [r.id for r in rows], next_cursor
+
+    def _read_options(self):
+        # Sayfa boyutundan bağımsız sabit sorgu sayısı: post+creator tek JOIN, tags tek IN sorgusu.
+        # Diğer lazy ilişkiler AsyncSession altında sessizce sorgu atmak yerine hata verir.
+        return (
+            joinedload(self.model.creator).load_only(
+                User.id, User.username, User.first_name, User.last_name
+            ),
+            selectinload(self.model.tags),
+            raiseload("*")
+        )
+
+    async def get_with_relations(self, id: UUID) -> Optional[Post]:
+        q = (
+            select(self.model)
+            .options(*self._read_options(), undefer(self.model.content))
+            .where(self.model.id == id)
+            .execution_options(populate_existing=True)
+        )
+        res = await self.db.execute(q)
+        return res.scalar_one_or_none()
+
+    def _summary_query(self):
+        # Liste görünümü: içerik yerine excerpt, creator aynı SELECT'te; ORM nesnesi ve identity map yok.
+        return (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.excerpt,
+                self.model.upvotes,
+                self.model.creator_id,
+                self.model.created_at,
+                User.username.label("creator_username"),
+                User.first_name.label("creator_first_name"),
+                User.last_name.label("creator_last_name")
+            )
+            .outerjoin(User, User.id == self.model.creator_id)
+        )
+
+    async def get_summaries(self, ids: List[UUID]) -> List[Row]:
+        if not ids:
+            return []
+        res = await self.db.execute(self._summary_query().where(self.model.id.in_(ids)))
+        by_id = {r.id: r for r in res.all()}
+        return [by_id[i] for i in ids if i in by_id]
+
+    async def list_summaries(self, size: int, offset: int) -> List[Row]:
+        q = (
+            self._summary_query()
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .offset(offset)
+            .limit(size)
+        )
+        res = await self.db.execute(q)
+        return list(res.all())
+
+    async def list_summaries_page(self, size: int, cursor: Optional[str] = None) -> Tuple[List[Row], Optional[str]]:
+        res = await self.db.execute(self._keyset(self._summary_query(), size, cursor))
+        return self._page(res.all(), size)
+
+    async def fetch_tags_for(self, ids: List[UUID]) -> Dict[UUID, List[str]]:
+        """Sayfadaki postların etiketleri tek sorguda, alfabetik."""
+        if not ids:
+            return {}
+        q = (
+            select(post_tags.c.post_id, Tag.tag)
+            .join(Tag, Tag.id == post_tags.c.tag_id)
+            .where(post_tags.c.post_id.in_(ids))
+            .order_by(Tag.tag)
+        )
+        tags: Dict[UUID, List[str]] = {}
+        for post_id, tag in (await self.db.execute(q)).all():
+            tags.setdefault(post_id, []).append(tag)
+        return tags
+
+    async def get_version(self, post_id: UUID):
+        # ETag için yalnızca sürüm kolonları; içerik ve ilişkiler yüklenmez.
+        q = (
+            select(
+                func.coalesce(self.model.updated_at, self.model.created_at),
+                self.model.upvotes,
+                func.coalesce(User.updated_at, User.created_at)
+            )
+            .outerjoin(User, User.id == self.model.creator_id)
+            .where(self.model.id == post_id)
+        )
+        res = await self.db.execute(q)
+        return res.first()
+
+    async def get_upvotes(self, post_id: UUID) -> Optional[int]:
+        res = await self.db.execute(select(self.model.upvotes).where(self.model.id == post_id))
+        return res.scalar_one_or_none()
+
+    async def fetch_upvoted_ids(self, user_id: Optional[UUID], ids: List[UUID]) -> Set[UUID]:
+        if user_id is None or not ids:
+            return set()
+        q = (
+            select(user_upvoted_posts.c.post_id)
+            .where(
+                user_upvoted_posts.c.user_id == user_id,
+                user_upvoted_posts.c.post_id.in_(ids)
+            )
+        )
+        res = await self.db.execute(q)
+        return set(res.scalars().all())
+
+    def _feed_order(self, q, created_at, id, size: int, before: Optional[Tuple[datetime, UUID]]):
+        if before is not None:
+            q = q.where(tuple_(created_at, id) < tuple_(*before))
+        return q.order_by(created_at.desc(), id.desc()).limit(size)
+
+    async def feed_keys(
+        self,
+        user_id: UUID,
+        size: int,
+        before: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Tuple[datetime, UUID]]:
+        """Newest `size` (created_at, id) keys from followed users and followed tags."""
+        followed = (
+            select(user_followed_users.c.creator_id)
+            .where(user_followed_users.c.user_id == user_id)
+            .subquery()
+        )
+        # Her takip edilen kullanıcı için (creator_id, created_at, id) indeksi üzerinde sınırlı tarama.
+        per_creator = self._feed_order(
+            select(self.model.created_at, self.model.id)
+            .where(self.model.creator_id == followed.c.creator_id),
+            self.model.created_at, self.model.id, size, before
+        ).lateral()
+        creators_q = self._feed_order(
+            select(per_creator.c.created_at, per_creator.c.id)
+            .select_from(followed.join(per_creator, true())),
+            per_creator.c.created_at, per_creator.c.id, size, None
+        )
+
+        tags_q = self._feed_order(
+            select(self.model.created_at, self.model.id)
+            .where(self.model.id.in_(
+                select(post_tags.c.post_id)
+                .where(post_tags.c.tag_id.in_(
+                    select(user_followed_tags.c.tag_id)
+                    .where(user_followed_tags.c.user_id == user_id)
+                ))
+            )),
+            self.model.created_at, self.model.id, size, before
+        )
+
+        creators = [tuple(r) for r in (await self.db.execute(creators_q)).all()]
+        tags = [tuple(r) for r in (await self.db.execute(tags_q)).all()]
+
+        keys: List[Tuple[datetime, UUID]] = []
+        seen: Set[UUID] = set()
+        for created_at, id in heapq.merge(creators, tags, reverse=True):
+            if id in seen:
+                continue
+            seen.add(id)
+            keys.append((created_at, id))
+            if len(keys) == size:
+                break
+        return keys
+
+    async def add_with_tags(self, post: Post, tag_ids: List[UUID]) -> Post:
+        """Postu ve etiket bağlantılarını yazar, commit etmez."""
+        self.db.add(post)
+        await self.db.flush()
+        await self.set_tags(post.id, tag_ids)
+        return post
+
+    async def bulk_insert(self, rows: List[dict], tag_links: List[dict]):
+        """Postları parametre sınırına göre bölünmüş çok satırlı INSERT'lerle, post_tags'i executemany ile yazar; commit etmez."""
+        if rows:
+            for chunk in chunked(rows, len(rows[0])):
+                await self.db.execute(insert(self.model).values(chunk))
+        if tag_links:
+            await self.db.execute(insert(post_tags), tag_links)
+
+    async def set_tags(self, post_id: UUID, tag_ids: List[UUID]):
+        await self.db.execute(delete(post_tags).where(post_tags.c.post_id == post_id))
+        if tag_ids:
+            await self.db.execute(
+                insert(post_tags),
+                [{"post_id": post_id, "tag_id": tag_id} for tag_id in tag_ids]
+            )
+
+    async def delete_by_id(self, post_id: UUID) -> Optional[UUID]:
+        """İlişkili satırlarla birlikte postu siler, commit etmez; silinen postun creator_id'sini döner."""
+        await self.db.execute(delete(post_tags).where(post_tags.c.post_id == post_id))
+        await self.db.execute(delete(post_comments).where(post_comments.c.post_id == post_id))
+        await self.db.execute(delete(user_upvoted_posts).where(user_upvoted_posts.c.post_id == post_id))
+        res = await self.db.execute(
+            delete(self.model)
+            .where(self.model.id == post_id)
+            .returning(self.model.creator_id)
+        )
+        return res.scalar_one_or_none()
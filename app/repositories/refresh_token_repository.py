@@ -1,15 +1,30 @@
 from datetime import datetime, timezone
-from sqlalchemy import select, update, delete
+from sqlalchemy import or_, select, update, delete
 
 from database.models.refresh_token import RefreshToken
 from database.models.user import User
 from core.common.base_repository import BaseRepository
+from core.security.crypto import hash_token
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
     model = RefreshToken
 
     async def get_by_token(self, token: str):
-        return await self.get_by(token=token)
+        return await self.get_by(token_hash=hash_token(token))
+
+    async def get_active_by_token(self, user_id: str, token: str) -> RefreshToken | None:
+        """Kullanıcıya ait, revoke edilmemiş ve süresi dolmamış token."""
+        q = (
+            select(self.model)
+            .where(
+                self.model.token_hash == hash_token(token),
+                self.model.user_id == user_id,
+                self.model.revoked_at.is_(None),
+                self.model.expires_at > datetime.now(timezone.utc)
+            )
+        )
+        res = await self.db.execute(q)
+        return res.scalar_one_or_none()
 
     async def get_active_by_user(self, user_id: str) -> RefreshToken | None:
         """Kullanıcının aktif olan (revoked olmayan) son refresh token'ı"""
@@ -23,15 +38,17 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         return res.scalar_one_or_none()
 
     async def create_token(self, user: User, token: str, expires_at: datetime) -> RefreshToken:
-        """Yeni refresh token oluşturur ve varsa eskiyi revoke eder."""
-        existing = await self.get_active_by_user(user.id)
-        if existing:
-            await self.revoke(existing.token)
+        """Aktif tokenları revoke eder ve yenisini aynı transaction içinde oluşturur."""
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.user_id == user.id, self.model.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
 
         new_token = RefreshToken(
-            token=token,
+            token_hash=hash_token(token),
             expires_at=expires_at,
-            user=user
+            user_id=user.id
         )
 
         return await self.create(new_token)
@@ -40,16 +57,37 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         """Token'ı revoke eder."""
         q = (
             update(self.model)
-            .where(self.model.token == token)
+            .where(self.model.token_hash == hash_token(token))
             .values(revoked_at=datetime.now(timezone.utc))
         )
         await self.db.execute(q)
-        await self.db.commit()
+        await self._save()
         return True
 
-    async def delete_expired(self) -> int:
-        """Süresi dolmuş tokenları siler."""
-        q = delete(self.model).where(self.model.expires_at < datetime.now(timezone.utc))
+    async def revoke_by_user(self, user_id: str) -> int:
+        """Kullanıcının tüm aktif tokenlarını revoke eder."""
+        q = (
+            update(self.model)
+            .where(self.model.user_id == user_id, self.model.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        result = await self.db.execute(q)
+        await self._save()
+        return result.rowcount
+
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """Süresi dolmuş veya revoke edilmiş tokenlardan en fazla batch_size kadarını siler."""
+        ids = (
+            select(self.model.id)
+            .where(or_(
+                self.model.expires_at < datetime.now(timezone.utc),
+                self.model.revoked_at.is_not(None)
+            ))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        q = delete(self.model).where(self.model.id.in_(ids))
         result = await self.db.execute(q)
-        await self.db.commit()
+        await self._save()
         return result.rowcount
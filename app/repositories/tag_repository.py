@@ -1,6 +1,41 @@
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
 from database.models.tag import Tag
-from core.common.base_repository import BaseRepository
+from core.common.base_repository import BaseRepository, chunked
 
 
 class TagRepository(BaseRepository[Tag]):
-    model = Tag
\ No newline at end of file
+    model = Tag
+
+    async def get_id_by_tag(self, tag: str):
+        res = await self.db.execute(select(self.model.id).where(self.model.tag == tag))
+        return res.scalar_one_or_none()
+
+    async def create_missing(self, names: List[str]) -> List[str]:
+        """Inserts the tags that do not exist yet and returns only those."""
+        created: List[str] = []
+        for chunk in chunked(names, 1):
+            res = await self.db.execute(
+                insert(self.model)
+                .values([{"tag": name} for name in chunk])
+                .on_conflict_do_nothing(index_elements=[self.model.tag])
+                .returning(self.model.tag)
+            )
+            created.extend(res.scalars().all())
+        return created
+
+    async def get_or_create_ids(self, names: List[str]) -> Dict[str, UUID]:
+        if not names:
+            return {}
+        await self.create_missing(names)
+        ids: Dict[str, UUID] = {}
+        for chunk in chunked(names, 1):
+            res = await self.db.execute(
+                select(self.model.tag, self.model.id).where(self.model.tag.in_(chunk))
+            )
+            ids.update(res.all())
+        return ids
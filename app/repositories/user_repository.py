@@ -1,72 +1,274 @@
-from sqlalchemy import delete, select, insert
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from sqlalchemy import Integer, Row, case, column, delete, func, or_, select, union, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
 from database.models.user import User
-from core.common.base_repository import BaseRepository
+from database.models.tag import Tag
+from database.models.post import Post
+from core.common.base_repository import BaseRepository, chunked
 from database.models.user import user_followed_tags, user_followed_users
 
 
 class UserRepository(BaseRepository[User]):
     model = User
 
-    async def fetch_followers_ids(self, id):
-        stmt = (
+    async def filter_feed_subscribers(self, creator_id, tag_ids, user_ids):
+        """user_ids içinden creator'ı ya da etiketlerden birini takip edenler."""
+        if not user_ids:
+            return []
+        stmt = union(
             select(user_followed_users.c.user_id)
-            .where(user_followed_users.c.creator_id == id)
+            .where(
+                user_followed_users.c.creator_id == creator_id,
+                user_followed_users.c.user_id.in_(user_ids)
+            ),
+            select(user_followed_tags.c.user_id)
+            .where(
+                user_followed_tags.c.tag_id.in_(tag_ids),
+                user_followed_tags.c.user_id.in_(user_ids)
+            )
         )
         res = await self.db.execute(stmt)
         return res.scalars().all()
 
-    async def fetch_followed_users_ids(self, id):
+    async def _fetch_user_page(self, join_column, owner_column, id, size: int, after=None):
         stmt = (
-            select(user_followed_users.c.creator_id)
-            .where(user_followed_users.c.user_id == id)
+            select(User.id, User.username, User.first_name, User.last_name)
+            .join(join_column.table, join_column == User.id)
+            .where(owner_column == id)
+        )
+        if after is not None:
+            stmt = stmt.where(join_column > after)
+        res = await self.db.execute(stmt.order_by(join_column).limit(size))
+        return res.all()
+
+    async def fetch_followers_page(self, id, size: int, after=None):
+        return await self._fetch_user_page(
+            user_followed_users.c.user_id, user_followed_users.c.creator_id, id, size, after
         )
-        res = await self.db.execute(stmt)
-        return res.scalars().all()
 
-    async def fetch_followed_tags_ids(self, id):
+    async def fetch_followed_users_page(self, id, size: int, after=None):
+        return await self._fetch_user_page(
+            user_followed_users.c.creator_id, user_followed_users.c.user_id, id, size, after
+        )
+
+    async def fetch_followed_tags_page(self, id, size: int, after=None):
         stmt = (
-            select(user_followed_tags.c.tag_id)
+            select(Tag.id, Tag.tag)
+            .join(user_followed_tags, user_followed_tags.c.tag_id == Tag.id)
             .where(user_followed_tags.c.user_id == id)
         )
-        res = await self.db.execute(stmt)
-        return res.scalars().all()
+        if after is not None:
+            stmt = stmt.where(user_followed_tags.c.tag_id > after)
+        res = await self.db.execute(stmt.order_by(user_followed_tags.c.tag_id).limit(size))
+        return res.all()
     
-    async def append_followers(self, id, target_id):
+    def _list_query(self):
+        # Liste görünümü için yalnızca yanıt kolonları; hashed_password ve ORM durumu yüklenmez.
+        return select(
+            User.id,
+            User.username,
+            User.email,
+            User.first_name,
+            User.last_name,
+            User.roles,
+            User.followers_count,
+            User.following_count,
+            User.posts_count,
+            User.created_at
+        )
+
+    async def list_rows(self, size: int, offset: int) -> List[Row]:
+        q = (
+            self._list_query()
+            .order_by(User.created_at.desc(), User.id.desc())
+            .offset(offset)
+            .limit(size)
+        )
+        res = await self.db.execute(q)
+        return list(res.all())
+
+    async def list_rows_page(self, size: int, cursor: Optional[str] = None) -> Tuple[List[Row], Optional[str]]:
+        res = await self.db.execute(self._keyset(self._list_query(), size, cursor))
+        return self._page(res.all(), size)
+
+    async def get_version(self, username: str):
+        res = await self.db.execute(
+            select(func.coalesce(User.updated_at, User.created_at)).where(User.username == username)
+        )
+        return res.scalar_one_or_none()
+
+    async def exists_by_email_or_username(self, email: str, username: str) -> bool:
+        res = await self.db.execute(
+            select(User.id).where(or_(User.email == email, User.username == username)).limit(1)
+        )
+        return res.first() is not None
+
+    async def get_id_by_username(self, username: str):
+        res = await self.db.execute(select(User.id).where(User.username == username))
+        return res.scalar_one_or_none()
+
+    async def _adjust_follow_counts(self, id, target_id, delta: int):
+        # Takip eden ve edilen sayaçları tek UPDATE ile.
+        stmt = (
+            update(User)
+            .where(User.id.in_([id, target_id]))
+            .values(
+                following_count=case(
+                    (User.id == id, User.following_count + delta),
+                    else_=User.following_count
+                ),
+                followers_count=case(
+                    (User.id == target_id, User.followers_count + delta),
+                    else_=User.followers_count
+                )
+            )
+        )
+        await self.db.execute(stmt)
+
+    async def adjust_posts_count(self, id, delta: int):
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(posts_count=User.posts_count + delta)
+        )
+        await self.db.execute(stmt)
+
+    async def adjust_posts_counts(self, deltas: Dict[UUID, int]):
+        if not deltas:
+            return
+        rows = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            name="deltas"
+        ).data(list(deltas.items()))
+        await self.db.execute(
+            update(User)
+            .where(User.id == rows.c.id)
+            .values(posts_count=User.posts_count + rows.c.delta)
+        )
+
+    async def get_ids_by_usernames(self, usernames: List[str]) -> Dict[str, UUID]:
+        if not usernames:
+            return {}
+        res = await self.db.execute(select(User.username, User.id).where(User.username.in_(usernames)))
+        return {username: id for username, id in res.all()}
+
+    async def bulk_insert(self, rows: List[dict]) -> Set[str]:
+        """Çok satırlı INSERT; var olan kullanıcı adı/e-posta atlanır. Eklenen kullanıcı adlarını döner."""
+        inserted: Set[str] = set()
+        if not rows:
+            return inserted
+        for chunk in chunked(rows, len(rows[0])):
+            res = await self.db.execute(
+                insert(User)
+                .values(chunk)
+                .on_conflict_do_nothing()
+                .returning(User.username)
+            )
+            inserted.update(res.scalars().all())
+        return inserted
+
+    async def append_followers(self, id, target_id) -> bool:
         stmt = (
             insert(user_followed_users)
             .values(
                 user_id = id,
                 creator_id = target_id
             )
+            .on_conflict_do_nothing()
+            .returning(user_followed_users.c.creator_id)
         )
-        await self.db.execute(stmt)
+        res = await self.db.execute(stmt)
+        changed = res.first() is not None
+        if changed:
+            await self._adjust_follow_counts(id, target_id, 1)
+        return changed
     
-    async def pop_followers(self, id, target_id):
+    async def pop_followers(self, id, target_id) -> bool:
         stmt = (
             delete(user_followed_users)
             .where(
                 user_followed_users.c.user_id == id,
                 user_followed_users.c.creator_id == target_id
             )
+            .returning(user_followed_users.c.creator_id)
         )
-        await self.db.execute(stmt)
+        res = await self.db.execute(stmt)
+        changed = res.first() is not None
+        if changed:
+            await self._adjust_follow_counts(id, target_id, -1)
+        return changed
     
-    async def append_followed_tags(self, id, target_id):
+    async def append_followed_tags(self, id, target_id) -> bool:
         stmt = (
-            insert(user_followed_users)
+            insert(user_followed_tags)
             .values(
                 user_id = id,
                 tag_id = target_id
             )
+            .on_conflict_do_nothing()
+            .returning(user_followed_tags.c.tag_id)
         )
-        await self.db.execute(stmt)
+        res = await self.db.execute(stmt)
+        return res.first() is not None
     
-    async def pop_followed_tags(self, id, target_id):
+    async def pop_followed_tags(self, id, target_id) -> bool:
         stmt = (
-            delete(user_followed_users)
+            delete(user_followed_tags)
             .where(
-                user_followed_users.c.user_id == id,
-                user_followed_users.c.tag_id == target_id
+                user_followed_tags.c.user_id == id,
+                user_followed_tags.c.tag_id == target_id
+            )
+            .returning(user_followed_tags.c.tag_id)
+        )
+        res = await self.db.execute(stmt)
+        return res.first() is not None
+
+    async def reconcile_counters(self, size: int, after=None):
+        """Bir batch kullanıcının sayaçlarını kaynak tablolardan yeniden hesaplar; son id'yi ve düzeltilen satır sayısını döner."""
+        q = select(User.id).order_by(User.id).limit(size)
+        if after is not None:
+            q = q.where(User.id > after)
+        ids = (await self.db.execute(q)).scalars().all()
+        if not ids:
+            return None, 0
+
+        followers = (
+            select(func.count())
+            .select_from(user_followed_users)
+            .where(user_followed_users.c.creator_id == User.id)
+            .scalar_subquery()
+        )
+        following = (
+            select(func.count())
+            .select_from(user_followed_users)
+            .where(user_followed_users.c.user_id == User.id)
+            .scalar_subquery()
+        )
+        posts = (
+            select(func.count())
+            .select_from(Post)
+            .where(Post.creator_id == User.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(User)
+            .where(
+                User.id.in_(ids),
+                or_(
+                    User.followers_count != followers,
+                    User.following_count != following,
+                    User.posts_count != posts
+                )
             )
+            .values(
+                followers_count=followers,
+                following_count=following,
+                posts_count=posts
+            )
+            .execution_options(synchronize_session=False)
         )
-        await self.db.execute(stmt)
\ No newline at end of file
+        res = await self.db.execute(stmt)
+        await self._save()
+        return ids[-1], res.rowcount
@@ -3,7 +3,10 @@ import os
 from datetime import datetime, timedelta, timezone
 import uuid
 
+from sqlalchemy.exc import IntegrityError
+
 from core.enums.messages import AuthMessages
+from core.enums.permission import roles_to_mask
 from validators.auth_models import (
     JwtPayload,
     RegisterRequest,
@@ -14,7 +17,8 @@ from validators.auth_models import (
     RefreshResponse
 )
 from core.common.api_models import APIResponse
-from core.security.crypto import create_jwt, verify_pwd, hash_pwd
+from core.security.crypto import create_jwt
+from core.security.password_hasher import password_hasher
 
 from core.common.base_service import BaseService
 from repositories.user_repository import UserRepository
@@ -28,6 +32,18 @@ class AuthService(BaseService):
     def _generate_refresh_token(self) -> str:
         return base64.b64encode(os.urandom(32)).decode("utf-8")
 
+    def _build_access_payload(self, user) -> JwtPayload:
+        now = datetime.now(timezone.utc)
+        return JwtPayload(
+            user_id=user.id,
+            username=user.username,
+            roles=user.roles,
+            role_mask=roles_to_mask(user.roles),
+            iat=now,
+            exp=now + timedelta(hours=1),
+            jti=uuid.uuid4()
+        )
+
     def _generate_access_token(self, data: JwtPayload, timedelta: timedelta | None = None ) -> str:
         if timedelta:
             data.exp = data.exp + timedelta 
@@ -37,16 +53,21 @@ class AuthService(BaseService):
         user_repo = self.user_repo(self.db)
         token_repo = self.token_repo(self.db)
 
-        if await user_repo.get_by(email = req.email) or await user_repo.get_by(username = req.username):
+        if await user_repo.exists_by_email_or_username(req.email, req.username):
             self.error(AuthMessages.EMAIL_EXISTS)
 
-        new_user = await user_repo.create(
-            username=req.username,
-            email=req.email,
-            hashed_password=hash_pwd(req.password),
-            first_name=req.first_name,
-            last_name=req.last_name
-        )
+        try:
+            new_user = await user_repo.create(dict(
+                username=req.username,
+                email=req.email,
+                hashed_password=await password_hasher.hash(req.password),
+                first_name=req.first_name,
+                last_name=req.last_name
+            ))
+        except IntegrityError:
+            # Kontrol ile INSERT arasında aynı e-posta/kullanıcı adıyla kayıt olunmuş.
+            await self.db.rollback()
+            self.error(AuthMessages.EMAIL_EXISTS)
 
         refresh_token = self._generate_refresh_token()
         expires_at = datetime.now(timezone.utc) + timedelta(days=7)
@@ -56,18 +77,10 @@ class AuthService(BaseService):
             token=refresh_token,
             expires_at=expires_at
         )
-
-        access_uuid = uuid.uuid4()
+        await self.commit()
 
         access_token = self._generate_access_token(
-            JwtPayload(
-                user_id=new_user.id,
-                username=new_user.username,
-                roles=new_user.roles,
-                iat=datetime.now(timezone.utc),
-                exp=datetime.now(timezone.utc) + timedelta(hours=1),
-                jti= access_uuid
-            )
+            self._build_access_payload(new_user)
         )
 
         return self.success(
@@ -83,20 +96,16 @@ class AuthService(BaseService):
         if not user:
             self.error(AuthMessages.USER_NOT_FOUND)
 
-        if not verify_pwd(req.password, user.hashed_password):
+        if not await password_hasher.verify(req.password, user.hashed_password):
             self.error(AuthMessages.WRONG_INFORMATION)
 
-        access_uuid = uuid.uuid4()
+        if password_hasher.needs_rehash(user.hashed_password):
+            await user_repo.update(user, {
+                "hashed_password": await password_hasher.hash(req.password)
+            })
 
         access_token = self._generate_access_token(
-            JwtPayload(
-                user_id=user.id,
-                username=user.username,
-                roles=user.roles,
-                iat=datetime.now(timezone.utc),
-                exp=datetime.now(timezone.utc) + timedelta(hours=1),
-                jti=access_uuid
-            )
+            self._build_access_payload(user)
         )
         refresh_token = self._generate_refresh_token()
 
@@ -106,6 +115,7 @@ class AuthService(BaseService):
             token=refresh_token,
             expires_at=expires_at
         )
+        await self.commit()
 
         return self.success(
             AuthMessages.USER_LOGINED,
@@ -133,11 +143,9 @@ class AuthService(BaseService):
     async def logout(self, user_id: str) -> APIResponse[bool]:
         token_repo = self.token_repo(self.db)
 
-        token = await token_repo.get_active_by_user(user_id)
-        if not token:
+        if not await token_repo.revoke_by_user(user_id):
             self.error(AuthMessages.TOKEN_NOT_FOUND, 404)
-
-        await token_repo.revoke(token.token)
+        await self.commit()
 
         return self.success(AuthMessages.SUCCESSFULLY_LOGOUT, True)
 
@@ -145,27 +153,15 @@ class AuthService(BaseService):
         user_repo = self.user_repo(self.db)
         token_repo = self.token_repo(self.db)
 
-        db_token = await token_repo.get_by(
-            user_id = user_id,
-            token = req.refresh_token
-        )
+        db_token = await token_repo.get_active_by_token(user_id, req.refresh_token)
 
         if not db_token:
             self.error(AuthMessages.TOKEN_NOT_FOUND, 404)
 
         user = await user_repo.get(db_token.user_id)
 
-        access_uuid = uuid.uuid4()
-
         new_access_token = self._generate_access_token(
-            JwtPayload(
-                user_id=user.id,
-                username=user.username,
-                roles=user.roles,
-                iat=datetime.now(timezone.utc),
-                exp=datetime.now(timezone.utc) + timedelta(hours=1),
-                jti=access_uuid
-            )
+            self._build_access_payload(user)
         )
 
         return self.success(
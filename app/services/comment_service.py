@@ -0,0 +1,84 @@
+from typing import List, Optional
+from uuid import UUID
+
+from core.common.api_models import APIResponse
+from core.common.base_service import BaseService
+from core.common.cursor import encode_cursor, decode_keyset_cursor
+from core.enums.messages import CommentMessages, PostMessages
+from repositories.comment_repository import CommentRepository
+
+
+class CommentService(BaseService):
+    comment_repo = CommentRepository
+
+    @staticmethod
+    def _serialize(row: dict) -> dict:
+        # Satırlar doğrudan yanıt sözlüğüne dönüşür; ORM/Pydantic nesnesi oluşturulmaz.
+        updated_at = row["updated_at"]
+        return {
+            "id": row["id"],
+            "content": row["content"],
+            "creator": row["creator"],
+            "created_at": row["created_at"].isoformat(),
+            "updated_at": updated_at.isoformat() if updated_at else None
+        }
+
+    @staticmethod
+    def _page(rows: List[dict], size: int):
+        if len(rows) <= size:
+            return rows, None
+        rows = rows[:size]
+        return rows, encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    async def get_thread(
+        self,
+        post_id: UUID,
+        size: int,
+        reply_size: int,
+        cursor: Optional[str] = None
+    ) -> APIResponse[List[dict]]:
+        repo = self.comment_repo(self.db)
+        after = decode_keyset_cursor(cursor) if cursor else None
+
+        comments, next_cursor = self._page(
+            await repo.fetch_comments_page(post_id, size + 1, after), size
+        )
+        if not comments and after is None and not await repo.post_exists(post_id):
+            self.error(PostMessages.POST_NOT_FOUND, 404)
+
+        replies = await repo.fetch_replies_for([c["id"] for c in comments], reply_size + 1)
+
+        by_comment = {}
+        for reply in replies:
+            by_comment.setdefault(reply["comment_id"], []).append(reply)
+
+        thread = []
+        for comment in comments:
+            page, replies_cursor = self._page(by_comment.get(comment["id"], []), reply_size)
+            item = self._serialize(comment)
+            item["replies"] = [self._serialize(r) for r in page]
+            item["replies_next_cursor"] = replies_cursor
+            thread.append(item)
+
+        return self.success(CommentMessages.GET_COMMENTS, thread, next_cursor)
+
+    async def get_replies(
+        self,
+        comment_id: UUID,
+        size: int,
+        cursor: Optional[str] = None
+    ) -> APIResponse[List[dict]]:
+        repo = self.comment_repo(self.db)
+        after = decode_keyset_cursor(cursor) if cursor else None
+
+        rows, next_cursor = self._page(
+            await repo.fetch_replies_page(comment_id, size + 1, after), size
+        )
+        if not rows and after is None and not await repo.exists(comment_id):
+            self.error(CommentMessages.COMMENT_NOT_FOUND, 404)
+
+        return self.success(
+            CommentMessages.GET_REPLIES,
+            [self._serialize(r) for r in rows],
+            next_cursor
+        )
@@ -0,0 +1,31 @@
+import asyncio
+
+from core.common.periodic_task import PeriodicTask
+from database.database import AsyncSessionLocal
+from repositories.user_repository import UserRepository
+from utils.config import COUNTER_RECONCILE_INTERVAL, COUNTER_RECONCILE_BATCH
+from utils.logger import logger
+
+
+async def reconcile_user_counters() -> int:
+    fixed = 0
+    after = None
+    async with AsyncSessionLocal() as db:
+        repo = UserRepository(db)
+        while True:
+            after, changed = await repo.reconcile_counters(COUNTER_RECONCILE_BATCH, after)
+            fixed += changed
+            if after is None:
+                break
+            await asyncio.sleep(0)
+
+    if fixed:
+        logger.warning("Counter reconciliation corrected %d users", fixed)
+    return fixed
+
+
+counter_reconciler = PeriodicTask(
+    name="user-counter-reconciler",
+    interval=COUNTER_RECONCILE_INTERVAL,
+    fn=reconcile_user_counters
+)
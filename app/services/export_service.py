@@ -0,0 +1,61 @@
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from core.common.base_service import BaseService
+from core.common.data_formats import format_header, format_rows
+from core.enums.messages import ExportMessages
+from database.database import AsyncSessionLocal, replica_router
+from repositories.post_repository import PostRepository
+from repositories.user_repository import UserRepository
+from utils.config import EXPORT_BATCH_SIZE
+from validators.admin_models import ExportKind
+
+
+class ExportService(BaseService):
+    user_repo = UserRepository
+    post_repo = PostRepository
+
+    # Dışa aktarılabilecek kolonlar; hashed_password bilerek yok.
+    COLUMNS: Dict[ExportKind, Tuple[str, ...]] = {
+        ExportKind.USERS: (
+            "id", "username", "email", "first_name", "last_name", "roles",
+            "followers_count", "following_count", "posts_count", "created_at", "updated_at"
+        ),
+        ExportKind.POSTS: (
+            "id", "title", "content", "upvotes", "creator_id", "created_at", "updated_at"
+        )
+    }
+
+    @classmethod
+    def resolve_columns(cls, kind: ExportKind, requested: Optional[str]) -> List[str]:
+        allowed = cls.COLUMNS[kind]
+        if not requested:
+            return list(allowed)
+        columns = list(dict.fromkeys(c.strip() for c in requested.split(",") if c.strip()))
+        if not columns or any(c not in allowed for c in columns):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ExportMessages.UNKNOWN_COLUMNS.value)
+        return columns
+
+    async def stream(self, kind: ExportKind, fmt: str, columns: List[str]) -> AsyncIterator[str]:
+        # Tüm export tek bir REPEATABLE READ anlık görüntüsünden okunur.
+        await self.db.connection(execution_options={
+            "isolation_level": "REPEATABLE READ",
+            "postgresql_readonly": True
+        })
+        repo = (self.user_repo if kind == ExportKind.USERS else self.post_repo)(self.db)
+
+        header = format_header(fmt, columns)
+        if header:
+            yield header
+        async for rows in repo.stream_columns(columns, EXPORT_BATCH_SIZE):
+            yield format_rows(fmt, columns, rows)
+
+
+async def stream_export(kind: ExportKind, fmt: str, columns: List[str]) -> AsyncIterator[str]:
+    """Owns its session: StreamingResponse keeps iterating after request dependencies are closed."""
+    replica = replica_router.pick() if replica_router.replicas else None
+    session_factory = replica.session_factory if replica else AsyncSessionLocal
+    async with session_factory() as db:
+        async for chunk in ExportService(db).stream(kind, fmt, columns):
+            yield chunk
@@ -0,0 +1,225 @@
+import asyncio
+import json
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from typing import IO, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.common.base_service import BaseService
+from core.common.data_formats import Record, batched, detect_format, iter_records
+from core.enums.messages import ImportMessages
+from core.enums.permission import UserRole
+from core.cache.response_cache import response_cache
+from core.search.factory import get_search_backend
+from core.security.password_hasher import password_hasher
+from database.models.post import Post
+from repositories.post_repository import PostRepository
+from repositories.tag_repository import TagRepository
+from repositories.user_repository import UserRepository
+from utils.config import IMPORT_BATCH_SIZE
+from validators.auth_models import RegisterRequest
+from validators.admin_models import ImportKind, ImportPostRow, ImportTagRow
+
+
+class ImportReport:
+    """Writes one NDJSON line per failed row; the last line is the summary."""
+
+    def __init__(self, out: IO[str]):
+        self.out = out
+        self.processed = 0
+        self.created = 0
+        self.failed = 0
+
+    def fail(self, line: int, errors: List[str]):
+        self.failed += 1
+        self.out.write(json.dumps({"line": line, "errors": errors}, ensure_ascii=False) + "\n")
+
+    def finish(self) -> dict:
+        totals = {"processed": self.processed, "created": self.created, "failed": self.failed}
+        self.out.write(json.dumps({"summary": totals}) + "\n")
+        return totals
+
+
+class ImportService(BaseService):
+    user_repo = UserRepository
+    post_repo = PostRepository
+    tag_repo = TagRepository
+
+    @staticmethod
+    def _validate(model: Type[BaseModel], batch: List[Record], report: ImportReport) -> List[Tuple[int, BaseModel]]:
+        valid = []
+        for record in batch:
+            report.processed += 1
+            if record.error:
+                report.fail(record.line, [record.error])
+                continue
+            try:
+                valid.append((record.line, model.model_validate(record.data)))
+            except ValidationError as e:
+                report.fail(record.line, [
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+                ])
+        return valid
+
+    async def _write(self, lines: List[int], report: ImportReport, write) -> bool:
+        # Batch tek transaction; hata olursa batch'in tüm satırları raporlanır, import devam eder.
+        try:
+            await write()
+            await self.db.commit()
+            return True
+        except SQLAlchemyError:
+            await self.db.rollback()
+            for line in lines:
+                report.fail(line, [ImportMessages.BATCH_FAILED.value])
+            return False
+
+    async def _import_users(self, batch: List[Record], report: ImportReport):
+        valid = self._validate(RegisterRequest, batch, report)
+
+        # Etkileşimli girişler için hasher kuyruğunun tamamını doldurma.
+        slots = asyncio.Semaphore(max(password_hasher.workers, 1))
+
+        async def hash_pwd(pwd: str) -> str:
+            async with slots:
+                return await password_hasher.hash(pwd)
+
+        hashes = await asyncio.gather(*(hash_pwd(req.password) for _, req in valid), return_exceptions=True)
+
+        rows, lines = [], {}
+        seen = set()
+        for (line, req), hashed in zip(valid, hashes):
+            if isinstance(hashed, BaseException):
+                report.fail(line, [ImportMessages.HASH_FAILED.value])
+                continue
+            keys = (("u", req.username), ("e", req.email.lower()))
+            if any(k in seen for k in keys):
+                report.fail(line, [ImportMessages.USER_EXISTS.value])
+                continue
+            seen.update(keys)
+            rows.append({
+                "id": uuid.uuid4(),
+                "username": req.username,
+                "email": req.email,
+                "hashed_password": hashed,
+                "first_name": req.first_name,
+                "last_name": req.last_name,
+                "roles": [UserRole.DEFAULT.name]
+            })
+            lines[req.username] = line
+
+        inserted = set()
+
+        async def write():
+            inserted.update(await self.user_repo(self.db).bulk_insert(rows))
+
+        if await self._write(list(lines.values()), report, write):
+            for username, line in lines.items():
+                if username in inserted:
+                    report.created += 1
+                else:
+                    report.fail(line, [ImportMessages.USER_EXISTS.value])
+
+    async def _import_tags(self, batch: List[Record], report: ImportReport):
+        valid = self._validate(ImportTagRow, batch, report)
+        names = {}
+        for line, row in valid:
+            name = row.tag.strip().lower()
+            if not name:
+                report.fail(line, [ImportMessages.INVALID_TAG.value])
+                continue
+            names.setdefault(name, line)
+
+        created: List[str] = []
+
+        async def write():
+            # Zaten var olan etiketler hata değildir ama oluşturulmuş da sayılmaz.
+            created[:] = await self.tag_repo(self.db).create_missing(list(names))
+
+        if await self._write(list(names.values()), report, write):
+            report.created += len(created)
+
+    async def _import_posts(self, batch: List[Record], report: ImportReport):
+        valid = self._validate(ImportPostRow, batch, report)
+        creators = await self.user_repo(self.db).get_ids_by_usernames(list({row.creator for _, row in valid}))
+
+        pending: List[Tuple[int, ImportPostRow, List[str]]] = []
+        for line, row in valid:
+            if row.creator not in creators:
+                report.fail(line, [ImportMessages.CREATOR_NOT_FOUND.value])
+                continue
+            tags = list(dict.fromkeys(t.strip().lower() for t in row.tags if t.strip()))
+            if any(len(t) > 50 for t in tags):
+                report.fail(line, [ImportMessages.INVALID_TAG.value])
+                continue
+            pending.append((line, row, tags))
+
+        now = datetime.now(timezone.utc)
+        posts: List[Tuple[Post, List[str]]] = []
+        deltas: Dict[uuid.UUID, int] = {}
+
+        async def write():
+            tag_ids = await self.tag_repo(self.db).get_or_create_ids(
+                list(dict.fromkeys(t for _, _, tags in pending for t in tags))
+            )
+            rows, links = [], []
+            for _, row, tags in pending:
+                post = Post(
+                    id=uuid.uuid4(),
+                    title=row.title,
+                    content=row.content,
+                    creator_id=creators[row.creator],
+                    created_at=now
+                )
+                rows.append({
+                    "id": post.id,
+                    "title": post.title,
+                    "content": post.content,
+                    "creator_id": post.creator_id,
+                    "created_at": post.created_at
+                })
+                links.extend({"post_id": post.id, "tag_id": tag_ids[t]} for t in tags)
+                deltas[post.creator_id] = deltas.get(post.creator_id, 0) + 1
+                posts.append((post, tags))
+            await self.post_repo(self.db).bulk_insert(rows, links)
+            await self.user_repo(self.db).adjust_posts_counts(deltas)
+
+        if not await self._write([line for line, _, _ in pending], report, write):
+            return
+
+        report.created += len(posts)
+        search = get_search_backend()
+        for post, tags in posts:
+            await search.index_post(self.db, post, tags)
+        await response_cache.invalidate("posts", *{f"user:{row.creator}" for _, row, _ in pending})
+
+    async def import_records(self, kind: ImportKind, records: AsyncIterator[Record], out: IO[str]) -> dict:
+        handler = {
+            ImportKind.USERS: self._import_users,
+            ImportKind.TAGS: self._import_tags,
+            ImportKind.POSTS: self._import_posts
+        }[kind]
+
+        report = ImportReport(out)
+        async for batch in batched(records, IMPORT_BATCH_SIZE):
+            await handler(batch, report)
+        return report.finish()
+
+    async def import_stream(
+        self,
+        kind: ImportKind,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str],
+        fmt: Optional[str] = None
+    ) -> IO[str]:
+        """Imports a streamed body; the returned report spills to disk past 1 MiB."""
+        fmt = detect_format(content_type, fmt)
+        if fmt is None:
+            self.error(ImportMessages.UNSUPPORTED_FORMAT, 415)
+
+        out = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode="w+", encoding="utf-8")
+        await self.import_records(kind, iter_records(chunks, fmt, list_fields=("tags",)), out)
+        out.seek(0)
+        return out
@@ -1,6 +1,235 @@
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from repositories.post_repository import PostRepository
+from repositories.tag_repository import TagRepository
+from repositories.user_repository import UserRepository
+from core.cache.timeline_cache import timeline_cache
+from core.common.cursor import encode_cursor, decode_keyset_cursor
 from core.common.base_service import BaseService
+from core.common.api_models import APIResponse
+from core.enums.messages import PostMessages
+from core.enums.permission import UserRole
+from core.search.factory import get_search_backend
+from core.cache.response_cache import response_cache
+from services.upvote_buffer import upvote_buffer
+from database.models.post import Post
+from validators.auth_models import JwtPayload
+from utils.config import FEED_CACHE_ENTRIES
+from validators.post_models import PostRequest, PostResponse, PostSummaryResponse, UpvoteResponse
 
 
 class PostService(BaseService):
-    post_repo = PostRepository
\ No newline at end of file
+    post_repo = PostRepository
+    tag_repo = TagRepository
+    user_repo = UserRepository
+
+    @staticmethod
+    def _normalize_tags(tags: List[str]) -> List[str]:
+        return list(dict.fromkeys(t.strip().lower() for t in tags if t.strip()))
+
+    @staticmethod
+    def _serialize(post, upvoted: bool = False) -> dict:
+        # PostResponse ile aynı alanlar; liste sayfalarında model kurulmadan doğrudan serileştirilir.
+        creator = post.creator
+        return {
+            "id": post.id,
+            "title": post.title,
+            "content": post.content,
+            "upvotes": post.upvotes,
+            "creator_id": post.creator_id,
+            "creator": {
+                "username": creator.username,
+                "first_name": creator.first_name,
+                "last_name": creator.last_name
+            } if creator else None,
+            "tags": sorted(t.tag for t in post.tags),
+            "upvoted": upvoted,
+            "created_at": post.created_at.isoformat()
+        }
+
+    def _build_post_response(self, post, upvoted: bool = False) -> PostResponse:
+        return PostResponse(**self._serialize(post, upvoted))
+
+    @staticmethod
+    def _serialize_summary(row, tags: List[str], upvoted: bool = False) -> dict:
+        # PostSummaryResponse alanları; repository'nin kolon projeksiyonu satırlarından.
+        return {
+            "id": row.id,
+            "title": row.title,
+            "excerpt": row.excerpt,
+            "upvotes": row.upvotes,
+            "creator_id": row.creator_id,
+            "creator": {
+                "username": row.creator_username,
+                "first_name": row.creator_first_name,
+                "last_name": row.creator_last_name
+            } if row.creator_username is not None else None,
+            "tags": tags,
+            "upvoted": upvoted,
+            "created_at": row.created_at.isoformat()
+        }
+
+    async def _build_post_summaries(self, rows, viewer_id: Optional[UUID] = None) -> List[dict]:
+        repo = self.post_repo(self.db)
+        ids = [r.id for r in rows]
+        upvoted = await repo.fetch_upvoted_ids(viewer_id, ids)
+        tags = await repo.fetch_tags_for(ids)
+        return [self._serialize_summary(r, tags.get(r.id, []), r.id in upvoted) for r in rows]
+
+    async def _get_owned_post(self, post_id: UUID, claims: JwtPayload) -> Post:
+        post = await self.post_repo(self.db).get(post_id)
+        if not post:
+            self.error(PostMessages.POST_NOT_FOUND, 404)
+        if post.creator_id != claims.user_id and not (claims.role_mask & UserRole.ADMIN.mask):
+            self.error(PostMessages.NOT_POST_OWNER, 403)
+        return post
+
+    async def get_all_posts(
+        self,
+        size: int,
+        offset: int,
+        tags: List[str],
+        search: str,
+        cursor: Optional[str] = None,
+        viewer_id: Optional[UUID] = None
+    ) -> APIResponse[List[PostSummaryResponse]]:
+        repo = self.post_repo(self.db)
+        tags = self._normalize_tags(tags)
+        search = search.strip()
+        next_cursor = None
+
+        if search or tags:
+            ids, next_cursor = await get_search_backend().search(
+                self.db, search, tags, size, offset, cursor
+            )
+            rows = await repo.get_summaries(ids)
+        elif offset:
+            rows = await repo.list_summaries(size=size, offset=offset)
+        else:
+            rows, next_cursor = await repo.list_summaries_page(size=size, cursor=cursor)
+
+        posts = await self._build_post_summaries(rows, viewer_id)
+        return self.success(PostMessages.GET_ALL_POSTS, posts, next_cursor)
+
+    async def get_feed(self, claims: JwtPayload, size: int, cursor: Optional[str] = None) -> APIResponse[List[PostSummaryResponse]]:
+        repo = self.post_repo(self.db)
+        before = decode_keyset_cursor(cursor) if cursor else None
+
+        keys = timeline_cache.page(claims.user_id, size + 1, before)
+        if keys is None:
+            if before is None:
+                # İlk sayfada zaman çizelgesini önbelleğe alacak kadar anahtar çek.
+                keys = await repo.feed_keys(claims.user_id, FEED_CACHE_ENTRIES)
+                timeline_cache.store(claims.user_id, keys, complete=len(keys) < FEED_CACHE_ENTRIES)
+                keys = keys[:size + 1]
+            else:
+                keys = await repo.feed_keys(claims.user_id, size + 1, before)
+
+        next_cursor = None
+        if len(keys) > size:
+            keys = keys[:size]
+            next_cursor = encode_cursor(*keys[-1])
+
+        rows = await repo.get_summaries([id for _, id in keys])
+        posts = await self._build_post_summaries(rows, claims.user_id)
+        return self.success(PostMessages.GET_FEED, posts, next_cursor)
+
+    async def _fan_out(self, post, tag_ids: List[UUID]):
+        cached = timeline_cache.user_ids()
+        if not cached:
+            return
+        subscribers = await self.user_repo(self.db).filter_feed_subscribers(post.creator_id, tag_ids, cached)
+        timeline_cache.push(subscribers, (post.created_at, post.id))
+
+    async def get_post(self, post_id: UUID, viewer_id: Optional[UUID] = None) -> APIResponse[PostResponse]:
+        post = await self.post_repo(self.db).get_with_relations(post_id)
+        if not post:
+            self.error(PostMessages.POST_NOT_FOUND, 404)
+        upvoted = await self.post_repo(self.db).fetch_upvoted_ids(viewer_id, [post.id])
+        return self.success(PostMessages.GET_POST, self._build_post_response(post, post.id in upvoted))
+
+    async def get_post_version(self, post_id: UUID) -> Optional[str]:
+        row = await self.post_repo(self.db).get_version(post_id)
+        if row is None:
+            return None
+        # Yalnızca kalıcı kolonlar: bekleyen oylar süreç belleğinde olduğundan worker'lar
+        # arasında farklı sürüm üretir. Sayaç en fazla bir UPVOTE_FLUSH_INTERVAL geride kalır.
+        updated_at, upvotes, creator_updated_at = row
+        return f"{updated_at.isoformat()}:{upvotes}:{creator_updated_at}"
+
+    async def create_post(self, req: PostRequest, claims: JwtPayload) -> APIResponse[PostResponse]:
+        repo = self.post_repo(self.db)
+        tags = self._normalize_tags(req.tags)
+
+        tag_ids = await self.tag_repo(self.db).get_or_create_ids(tags)
+        post = await repo.add_with_tags(
+            Post(
+                title=req.title,
+                content=req.content,
+                creator_id=claims.user_id
+            ),
+            list(tag_ids.values())
+        )
+        await self.user_repo(self.db).adjust_posts_count(claims.user_id, 1)
+        await self.commit()
+
+        post = await repo.get_with_relations(post.id)
+        await get_search_backend().index_post(self.db, post, tags)
+        await self._fan_out(post, list(tag_ids.values()))
+        await response_cache.invalidate("posts", f"user:{claims.username}")
+        return self.success(PostMessages.POST_CREATED, self._build_post_response(post))
+
+    async def update_post(self, post_id: UUID, req: PostRequest, claims: JwtPayload) -> APIResponse[PostResponse]:
+        repo = self.post_repo(self.db)
+        post = await self._get_owned_post(post_id, claims)
+        tags = self._normalize_tags(req.tags)
+
+        tag_ids = await self.tag_repo(self.db).get_or_create_ids(tags)
+        await repo.set_tags(post.id, list(tag_ids.values()))
+        # Yalnızca etiketler değişse de sürüm (updated_at) ilerlesin.
+        post = await repo.update(post, {"title": req.title, "content": req.content, "updated_at": func.now()})
+        await self.commit()
+
+        await get_search_backend().index_post(self.db, post, tags)
+        post = await repo.get_with_relations(post.id)
+        await response_cache.invalidate(f"post:{post.id}")
+        upvoted = await repo.fetch_upvoted_ids(claims.user_id, [post.id])
+        return self.success(PostMessages.POST_UPDATED, self._build_post_response(post, post.id in upvoted))
+
+    async def delete_post(self, post_id: UUID, claims: JwtPayload) -> APIResponse[bool]:
+        post = await self._get_owned_post(post_id, claims)
+        creator_id = await self.post_repo(self.db).delete_by_id(post.id)
+        if creator_id:
+            await self.user_repo(self.db).adjust_posts_count(creator_id, -1)
+        await self.commit()
+
+        await get_search_backend().remove_post(self.db, post.id)
+        tags = ["posts", f"post:{post.id}"]
+        if creator_id == claims.user_id:
+            tags.append(f"user:{claims.username}")
+        await response_cache.invalidate(*tags)
+        return self.success(PostMessages.POST_DELETED, True)
+
+    async def upvote_post(self, post_id: UUID, user_id: UUID) -> APIResponse[UpvoteResponse]:
+        try:
+            upvoted = await upvote_buffer.upvote(self.db, post_id, user_id)
+        except IntegrityError:
+            await self.db.rollback()
+            self.error(PostMessages.POST_NOT_FOUND, 404)
+
+        upvotes = await self.post_repo(self.db).get_upvotes(post_id)
+        if upvotes is None:
+            self.error(PostMessages.POST_NOT_FOUND, 404)
+
+        if upvoted:
+            await response_cache.invalidate(f"post:{post_id}")
+        return self.success(
+            PostMessages.POST_UPVOTED,
+            UpvoteResponse(
+                post_id=post_id,
+                upvotes=upvotes + upvote_buffer.pending(post_id),
+                upvoted=upvoted
+            )
+        )
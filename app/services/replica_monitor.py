@@ -0,0 +1,11 @@
+from core.common.periodic_task import PeriodicTask
+from database.database import replica_router
+from utils.config import REPLICA_DATABASE_URLS, REPLICA_HEALTH_INTERVAL
+
+
+replica_monitor = PeriodicTask(
+    name="replica-health-check",
+    # Replika yoksa döngü hiç başlamaz.
+    interval=REPLICA_HEALTH_INTERVAL if REPLICA_DATABASE_URLS else 0,
+    fn=replica_router.check_health
+)
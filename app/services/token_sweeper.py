@@ -0,0 +1,31 @@
+import asyncio
+
+from core.common.periodic_task import PeriodicTask
+from database.database import AsyncSessionLocal
+from repositories.refresh_token_repository import RefreshTokenRepository
+from utils.config import REFRESH_TOKEN_SWEEP_INTERVAL, REFRESH_TOKEN_SWEEP_BATCH
+from utils.logger import logger
+
+
+async def sweep_refresh_tokens() -> int:
+    total = 0
+    async with AsyncSessionLocal() as db:
+        repo = RefreshTokenRepository(db)
+        while True:
+            deleted = await repo.delete_expired(REFRESH_TOKEN_SWEEP_BATCH)
+            total += deleted
+            if deleted < REFRESH_TOKEN_SWEEP_BATCH:
+                break
+            # Batch'ler arasında event loop'u diğer isteklere bırak.
+            await asyncio.sleep(0)
+
+    if total:
+        logger.info("Refresh token sweeper removed %d rows", total)
+    return total
+
+
+token_sweeper = PeriodicTask(
+    name="refresh-token-sweeper",
+    interval=REFRESH_TOKEN_SWEEP_INTERVAL,
+    fn=sweep_refresh_tokens
+)
@@ -0,0 +1,93 @@
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache.response_cache import response_cache
+from core.common.periodic_task import PeriodicTask
+from database.database import AsyncSessionLocal
+from database.models.post import Post
+from database.models.user import user_upvoted_posts
+from utils.config import UPVOTE_FLUSH_INTERVAL
+from utils.logger import logger
+
+
+class UpvoteBuffer:
+    """Coalesces `posts.upvotes` increments so a hot post is not updated once per vote.
+
+    The (user, post) row is written immediately and idempotently; the counter
+    delta is kept in memory and applied for all posts in one batched UPDATE.
+    Cacheable representations show the persisted count only, so they agree
+    across workers; cached responses of flushed posts are invalidated.
+    """
+
+    def __init__(self, flush_interval: float):
+        self._pending: Dict[UUID, int] = {}
+        self._flushing: Dict[UUID, int] = {}
+        self._task = PeriodicTask("upvote-flusher", flush_interval, self.flush)
+
+    async def upvote(self, db: AsyncSession, post_id: UUID, user_id: UUID) -> bool:
+        stmt = (
+            insert(user_upvoted_posts)
+            .values(user_id=user_id, post_id=post_id)
+            .on_conflict_do_nothing()
+            .returning(user_upvoted_posts.c.post_id)
+        )
+        res = await db.execute(stmt)
+        inserted = res.first() is not None
+        await db.commit()
+
+        if inserted:
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+        return inserted
+
+    def pending(self, post_id: UUID) -> int:
+        return self._pending.get(post_id, 0) + self._flushing.get(post_id, 0)
+
+    async def flush(self):
+        if not self._pending or self._flushing:
+            return
+
+        # Flush sürerken okunan sayılar düşmesin diye delta commit'e kadar _flushing'de görünür kalır.
+        self._flushing, self._pending = self._pending, {}
+        deltas = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            name="deltas"
+        ).data(list(self._flushing.items()))
+        stmt = (
+            update(Post)
+            .where(Post.id == deltas.c.id)
+            # Oy sayısı PostService sürümünde ayrıca yer alır; updated_at düzenlemeler içindir.
+            .values(upvotes=Post.upvotes + deltas.c.delta, updated_at=Post.updated_at)
+        )
+
+        flushed = list(self._flushing)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except BaseException as exc:
+            for post_id, delta in self._flushing.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + delta
+            if not isinstance(exc, Exception):
+                raise
+            logger.exception("Upvote flush failed, %d posts kept pending", len(self._flushing))
+            return
+        finally:
+            self._flushing = {}
+
+        # Önbellekteki gövdeler kalıcı sayıyı gösterir; yeni sayı yazılınca düşürülür.
+        await response_cache.invalidate(*(f"post:{post_id}" for post_id in flushed))
+
+    def start(self):
+        self._task.start()
+
+    async def stop(self):
+        await self._task.stop()
+        await self.flush()
+
+
+upvote_buffer = UpvoteBuffer(flush_interval=UPVOTE_FLUSH_INTERVAL)
@@ -1,11 +1,16 @@
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from repositories.tag_repository import TagRepository
 from repositories.post_repository import PostRepository
 from core.common.base_service import BaseService
 from core.enums.messages import UserMessages
 from repositories.user_repository import UserRepository
-from validators.user_models import UpdateUserRequest, UserResponse
+from validators.user_models import UpdateUserRequest, UserResponse, FollowUserResponse, FollowTagResponse
+from core.common.cursor import encode_cursor, decode_id_cursor
 from core.common.api_models import APIResponse
+from core.cache.timeline_cache import timeline_cache
+from core.cache.response_cache import response_cache
+from validators.auth_models import JwtPayload
 
 
 class UserService(BaseService):
@@ -13,30 +18,39 @@ class UserService(BaseService):
     post_repo = PostRepository
     tag_repo = TagRepository
 
-    async def _build_user_response_single(self, user):
-        return UserResponse(
-            username=user.username,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            roles=user.roles,
-            created_at=user.created_at.isoformat()
-        )
-    
-    async def _build_user_response(self, data):
-        if not isinstance(data, (list, tuple, set)):
-            return await self._build_user_response_single(data)
-        results = []
-        for u in data:
-            results.append(await self._build_user_response_single(u))
-        return results
-
-
-    async def get_all_users(self, size: int, offset: int) -> APIResponse[List[UserResponse]]:
+    @staticmethod
+    def _serialize(user) -> dict:
+        # UserResponse ile aynı alanlar; liste sayfalarında model kurulmadan doğrudan serileştirilir.
+        return {
+            "username": user.username,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "roles": user.roles,
+            "followers_count": user.followers_count,
+            "following_count": user.following_count,
+            "posts_count": user.posts_count,
+            "created_at": user.created_at.isoformat()
+        }
+
+    @staticmethod
+    def _serialize_follow(row) -> dict:
+        return {"username": row.username, "first_name": row.first_name, "last_name": row.last_name}
+
+    def _build_user_response(self, user) -> UserResponse:
+        return UserResponse(**self._serialize(user))
+
+
+    async def get_all_users(self, size: int, offset: int, cursor: Optional[str] = None) -> APIResponse[List[UserResponse]]:
         user_repo = self.user_repo(self.db)
-        rows = await user_repo.list(size=size, offset=offset)
-        users = await self._build_user_response([r for r in rows])
-        return self.success(UserMessages.GET_ALL_USERS, users)
+        next_cursor = None
+        if offset:
+            # Eski offset tabanlı sayfalama, geriye dönük uyumluluk için.
+            rows = await user_repo.list_rows(size=size, offset=offset)
+        else:
+            rows, next_cursor = await user_repo.list_rows_page(size=size, cursor=cursor)
+        users = [self._serialize(r) for r in rows]
+        return self.success(UserMessages.GET_ALL_USERS, users, next_cursor)
 
     async def get_user(self, username: str) -> APIResponse[UserResponse]:
         repo = self.user_repo(self.db)
@@ -45,140 +59,131 @@ class UserService(BaseService):
             self.error(UserMessages.USER_NOT_FOUND, 404)
         return self.success(
             UserMessages.GET_USER, 
-            await self._build_user_response(user)
+            self._build_user_response(user)
         )
 
+    async def get_user_version(self, username: str) -> Optional[str]:
+        version = await self.user_repo(self.db).get_version(username)
+        return version.isoformat() if version else None
+
     async def update_user(self, username: str, payload: UpdateUserRequest) -> APIResponse[UserResponse]:
         repo = self.user_repo(self.db)
         user = await repo.get_by(username=username)
         if not user:
             self.error(UserMessages.USER_NOT_FOUND, 404)
         updated = await repo.update(user, payload.dict(exclude_unset=True))
+        await self.commit()
+        await response_cache.invalidate(f"user:{username}")
         return self.success(
             UserMessages.USER_UPDATED,
-            await self._build_user_response(updated)
+            self._build_user_response(updated)
         )
     
-    async def get_followers(self, username: str):
+    async def _get_follow_page(self, username: str, fetch, size: int, cursor: Optional[str]):
         repo = self.user_repo(self.db)
 
-        user = await repo.get_by(username=username)
-        if not user:
+        user_id = await repo.get_id_by_username(username)
+        if not user_id:
             self.error(UserMessages.USER_NOT_FOUND, 404)
 
-        try:
-            return await repo.fetch_followers_ids(user.id)
-        except Exception as e:
-            self.error(str(e), 500)
+        after = decode_id_cursor(cursor) if cursor else None
+        rows = await fetch(repo, user_id, size + 1, after)
 
-    async def get_followed_users(self, username: str):
-        repo = self.user_repo(self.db)
+        next_cursor = encode_cursor(rows[size - 1].id) if len(rows) > size else None
+        return rows[:size], next_cursor
 
-        user = await repo.get_by(username=username)
-        if not user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
+    async def get_followers(self, username: str, size: int, cursor: Optional[str] = None) -> APIResponse[List[FollowUserResponse]]:
+        rows, next_cursor = await self._get_follow_page(
+            username, self.user_repo.fetch_followers_page, size, cursor
+        )
+        return self.success(
+            UserMessages.GET_FOLLOWERS,
+            [self._serialize_follow(r) for r in rows],
+            next_cursor
+        )
 
-        try:
-            return await repo.fetch_followed_users_ids(user.id)
-        except Exception as e:
-            self.error(str(e), 500)
+    async def get_followed_users(self, username: str, size: int, cursor: Optional[str] = None) -> APIResponse[List[FollowUserResponse]]:
+        rows, next_cursor = await self._get_follow_page(
+            username, self.user_repo.fetch_followed_users_page, size, cursor
+        )
+        return self.success(
+            UserMessages.GET_FOLLOWED_USERS,
+            [self._serialize_follow(r) for r in rows],
+            next_cursor
+        )
 
-    async def follow_user(self, username: str, current_user: str, target: str) -> APIResponse[bool]:
+    async def follow_user(self, target: str, claims: JwtPayload) -> APIResponse[bool]:
         repo = self.user_repo(self.db)
 
-        user = await repo.get_by(username=username)
-        if not user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
-
-        target_user = await repo.get_by(username=target)
-        if not target_user:
+        target_id = await repo.get_id_by_username(target)
+        if not target_id:
             self.error(UserMessages.USER_NOT_FOUND, 404)
-        
-        user_followerd_users = await repo.fetch_followed_users_ids(user.id)
-        if target_user.id in user_followerd_users:
-            self.error(UserMessages.ALREADY_FOLLOWING, 409)
 
-        try:
-            await repo.append_followers(user.id, target_user.id)
-            await self.db.commit()
-        except Exception as e:
-            self.error(str(e), 500)
+        changed = await repo.append_followers(claims.user_id, target_id)
+        await self.commit()
 
+        if not changed:
+            return self.success(UserMessages.ALREADY_FOLLOWING, False)
+        timeline_cache.invalidate(claims.user_id)
+        # Sayaçlar iki tarafta da değişir: hedefin takipçi, takip edenin takip sayısı.
+        await response_cache.invalidate(f"user:{target}", f"user:{claims.username}")
         return self.success(UserMessages.USER_FOLLOWED, True)
 
-    async def unfollow_user(self, username: str, current_user: str, target: str) -> APIResponse[bool]:
+    async def unfollow_user(self, target: str, claims: JwtPayload) -> APIResponse[bool]:
         repo = self.user_repo(self.db)
 
-        user = await repo.get_by(username=username)
-        if not user:
+        target_id = await repo.get_id_by_username(target)
+        if not target_id:
             self.error(UserMessages.USER_NOT_FOUND, 404)
 
-        target_user = await repo.get_by(username=target)
-        if not target_user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
-
-        user_followerd_users = await repo.fetch_followed_users_ids(user.id)
-        if target_user.id not in user_followerd_users:
-            self.error(UserMessages.NOT_FOLLOWING, 409)
-
-        try:
-            await repo.pop_followers(user.id, target_user.id)
-            await self.db.commit()
-        except Exception as e:
-            self.error(str(e), 500)
+        changed = await repo.pop_followers(claims.user_id, target_id)
+        await self.commit()
 
+        if not changed:
+            return self.success(UserMessages.NOT_FOLLOWING, False)
+        timeline_cache.invalidate(claims.user_id)
+        # Sayaçlar iki tarafta da değişir: hedefin takipçi, takip edenin takip sayısı.
+        await response_cache.invalidate(f"user:{target}", f"user:{claims.username}")
         return self.success(UserMessages.USER_UNFOLLOWED, True)
     
-    async def get_followed_tags(self, username: str):
-        repo = self.user_repo(self.db)
-
-        user = await repo.get_by(username=username)
-        if not user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
-
-        try:
-            return await repo.fetch_followed_tags_ids(user.id)
-        except Exception as e:
-            self.error(str(e), 500)
+    async def get_followed_tags(self, username: str, size: int, cursor: Optional[str] = None) -> APIResponse[List[FollowTagResponse]]:
+        rows, next_cursor = await self._get_follow_page(
+            username, self.user_repo.fetch_followed_tags_page, size, cursor
+        )
+        return self.success(
+            UserMessages.GET_FOLLOWED_TAGS,
+            [{"tag": r.tag} for r in rows],
+            next_cursor
+        )
 
-    async def follow_tag(self, username: str, current_user: str, tag: str) -> APIResponse[bool]:
+    async def follow_tag(self, user_id: UUID, tag: str) -> APIResponse[bool]:
         user_repo = self.user_repo(self.db)
         tag_repo = self.tag_repo(self.db)
 
-        user = await user_repo.get_by(username=username)
-        if not user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
-
-        target_tag = await tag_repo.get_by(tag=tag)
-        user_followed_tags = await user_repo.fetch_followed_tags_ids(user.id)
-        if target_tag.id in user_followed_tags:
-            self.error(UserMessages.ALREADY_FOLLOWING, 409)
+        tag_id = await tag_repo.get_id_by_tag(tag)
+        if not tag_id:
+            self.error(UserMessages.TAG_NOT_FOUND, 404)
 
-        try:
-            await user_repo.append_followed_tags(user.id, target_tag.id)
-            await self.db.commit()
-        except Exception as e:
-            self.error(str(e), 500)
+        changed = await user_repo.append_followed_tags(user_id, tag_id)
+        await self.commit()
 
+        if not changed:
+            return self.success(UserMessages.ALREADY_FOLLOWING, False)
+        timeline_cache.invalidate(user_id)
         return self.success(UserMessages.TAG_FOLLOWED, True)
 
-    async def unfollow_tag(self, username: str, current_user: str, tag: str) -> APIResponse[bool]:
+    async def unfollow_tag(self, user_id: UUID, tag: str) -> APIResponse[bool]:
         user_repo = self.user_repo(self.db)
         tag_repo = self.tag_repo(self.db)
 
-        user = await user_repo.get_by(username=username)
-        if not user:
-            self.error(UserMessages.USER_NOT_FOUND, 404)
-
-        target_tag = await tag_repo.get_by(tag=tag)
-        user_followed_tags = await user_repo.fetch_followed_tags_ids(user.id)
-        if target_tag.id not in user_followed_tags:
-            self.error(UserMessages.NOT_FOLLOWING, 409)
+        tag_id = await tag_repo.get_id_by_tag(tag)
+        if not tag_id:
+            self.error(UserMessages.TAG_NOT_FOUND, 404)
 
-        try:
-            await user_repo.pop_followed_tags(user.id, target_tag.id)
-            await self.db.commit()
-        except Exception as e:
-            self.error(str(e), 500)
+        changed = await user_repo.pop_followed_tags(user_id, tag_id)
+        await self.commit()
 
+        if not changed:
+            return self.success(UserMessages.NOT_FOLLOWING, False)
+        timeline_cache.invalidate(user_id)
         return self.success(UserMessages.TAG_UNFOLLOWED, True)
@@ -1,7 +1,8 @@
 import os
+import re
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 # .env yükle
@@ -54,6 +55,49 @@ def get_database_url() -> str:
     return db_url
 
 
+def get_db_pool_settings() -> Tuple[int, int, float, int, bool, int]:
+    """
+    DB_STATEMENT_CACHE_SIZE=0 → asyncpg hazır ifade önbelleği kapalı (pgbouncer transaction modu için)
+    """
+    pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    pre_ping = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    if pool_size < 1:
+        raise RuntimeError("DB_POOL_SIZE en az 1 olmalı.")
+    if max_overflow < -1:
+        raise RuntimeError("DB_MAX_OVERFLOW -1 (sınırsız) veya daha büyük olmalı.")
+    return pool_size, max_overflow, pool_timeout, pool_recycle, pre_ping, statement_cache_size
+
+
+def get_replica_settings() -> Tuple[List[str], float, float, float]:
+    """
+    REPLICA_DATABASE_URLS virgülle ayrılır; boşsa okumalar da birincil sunucuya gider.
+    Yazma sonrası birincile yapışma (REPLICA_STICKY_SECONDS) ve replika sağlığı
+    süreç başınadır; birden fazla worker arasında paylaşılmaz.
+    """
+    urls = [u.strip() for u in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if u.strip()]
+    sticky_seconds = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+    health_interval = float(os.getenv("REPLICA_HEALTH_INTERVAL", "10"))
+    max_lag = float(os.getenv("REPLICA_MAX_LAG", "30"))
+    return urls, sticky_seconds, health_interval, max_lag
+
+
+def get_db_diagnostics_settings() -> Tuple[bool, float, int]:
+    """
+    Varsayılan kapalı; DB_SLOW_QUERY_MS üstündeki ifadeler ve bir istekte
+    DB_N_PLUS_ONE_THRESHOLD kereden fazla çalışan aynı ifade loglanır.
+    """
+    enabled = os.getenv("DB_DIAGNOSTICS", "false").lower() in ("1", "true", "yes")
+    slow_query_ms = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+    repeat_threshold = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5"))
+    if repeat_threshold < 1:
+        raise RuntimeError("DB_N_PLUS_ONE_THRESHOLD en az 1 olmalı.")
+    return enabled, slow_query_ms, repeat_threshold
+
+
 # === JWT ===
 
 def get_jwt_settings() -> Tuple[str, str]:
@@ -63,6 +107,116 @@ def get_jwt_settings() -> Tuple[str, str]:
         raise RuntimeError("JWT_SECRET_KEY eksik.")
     return secret, alg
 
+def get_jwt_cache_size() -> int:
+    return int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+
+# === PASSWORD HASHING ===
+
+def get_pwd_hash_settings() -> Tuple[int, str, int, int, float]:
+    rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    executor = os.getenv("PWD_HASH_EXECUTOR", "thread").lower()
+    workers = int(os.getenv("PWD_HASH_WORKERS", str(os.cpu_count() or 1)))
+    queue_size = int(os.getenv("PWD_HASH_QUEUE_SIZE", "64"))
+    admission_timeout = float(os.getenv("PWD_HASH_ADMISSION_TIMEOUT", "2.0"))
+    if not 4 <= rounds <= 31:
+        raise RuntimeError("BCRYPT_ROUNDS 4 ile 31 arasında olmalı.")
+    if executor not in ("thread", "process"):
+        raise RuntimeError("PWD_HASH_EXECUTOR 'thread' veya 'process' olmalı.")
+    return rounds, executor, workers, queue_size, admission_timeout
+
+
+# === REFRESH TOKENS ===
+
+def get_refresh_token_sweep_settings() -> Tuple[float, int]:
+    interval = float(os.getenv("REFRESH_TOKEN_SWEEP_INTERVAL", "3600"))
+    batch_size = int(os.getenv("REFRESH_TOKEN_SWEEP_BATCH", "1000"))
+    return interval, batch_size
+
+
+# === SEARCH ===
+
+def get_search_settings() -> Tuple[str, str]:
+    backend = os.getenv("SEARCH_BACKEND", "postgres").lower()
+    text_config = os.getenv("SEARCH_TEXT_CONFIG", "simple")
+    if backend not in ("postgres", "memory"):
+        raise RuntimeError("SEARCH_BACKEND 'postgres' veya 'memory' olmalı.")
+    if not re.fullmatch(r"\w+", text_config):
+        raise RuntimeError("SEARCH_TEXT_CONFIG geçersiz.")
+    return backend, text_config
+
+
+# === UPVOTES ===
+
+def get_upvote_flush_interval() -> float:
+    # Milisaniye olarak okunur, saniye olarak döner.
+    return int(os.getenv("UPVOTE_FLUSH_INTERVAL_MS", "250")) / 1000
+
+
+# === FEED ===
+
+def get_feed_cache_settings() -> Tuple[int, int, float]:
+    max_users = int(os.getenv("FEED_CACHE_USERS", "10000"))
+    max_entries = int(os.getenv("FEED_CACHE_ENTRIES", "200"))
+    ttl = float(os.getenv("FEED_CACHE_TTL", "60"))
+    if max_entries <= 100:
+        raise RuntimeError("FEED_CACHE_ENTRIES en büyük sayfa boyutundan (100) büyük olmalı.")
+    return max_users, max_entries, ttl
+
+
+# === COUNTERS ===
+
+def get_counter_reconcile_settings() -> Tuple[float, int]:
+    interval = float(os.getenv("COUNTER_RECONCILE_INTERVAL", "3600"))
+    batch_size = int(os.getenv("COUNTER_RECONCILE_BATCH", "500"))
+    return interval, batch_size
+
+
+# === RESPONSE CACHE ===
+
+def get_response_cache_settings() -> Tuple[str, int, float, str]:
+    backend = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+    max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+    ttl = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+    redis_url = os.getenv("REDIS_URL", "")
+    if backend not in ("memory", "local-kv", "redis"):
+        raise RuntimeError("RESPONSE_CACHE_BACKEND 'memory', 'local-kv' veya 'redis' olmalı.")
+    if backend == "redis" and not redis_url:
+        raise RuntimeError("REDIS_URL eksik.")
+    return backend, max_entries, ttl, redis_url
+
+
+# === BULK IMPORT / EXPORT ===
+
+def get_import_batch_size() -> int:
+    batch_size = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+    if not 1 <= batch_size <= 2000:
+        # Transaction süresini ve bellek kullanımını sınırlar; INSERT'ler parametre
+        # sınırına (32767) göre repository'de ayrıca bölünür.
+        raise RuntimeError("IMPORT_BATCH_SIZE 1 ile 2000 arasında olmalı.")
+    return batch_size
+
+def get_export_batch_size() -> int:
+    return int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+
+# === COMPRESSION ===
+
+def get_compression_settings() -> Tuple[bool, List[str], int, Optional[int]]:
+    """
+    COMPRESSION_ENCODINGS sunucu tercih sırasıdır; kurulu olmayan kodlayıcılar atlanır.
+    COMPRESSION_LEVEL boşsa her kodlayıcı kendi varsayılanını kullanır (gzip 6, br 4, zstd 3).
+    """
+    enabled = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+    encodings = [e.strip().lower() for e in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if e.strip()]
+    min_size = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    level = os.getenv("COMPRESSION_LEVEL", "")
+    if set(encodings) - {"gzip", "br", "zstd"}:
+        raise RuntimeError("COMPRESSION_ENCODINGS yalnızca 'gzip', 'br' ve 'zstd' içerebilir.")
+    if level and not 1 <= int(level) <= 9:
+        raise RuntimeError("COMPRESSION_LEVEL 1 ile 9 arasında olmalı.")
+    return enabled, encodings, min_size, int(level) if level else None
+
 
 # === UVICORN ===
 
@@ -75,4 +229,18 @@ def get_uvicorn_bind() -> Tuple[str, int]:
 
 APP_ENV = get_app_env()
 DATABASE_URL = get_database_url()
-JWT_SECRET_KEY, JWT_ALGORITHM = get_jwt_settings()
\ No newline at end of file
+REPLICA_DATABASE_URLS, REPLICA_STICKY_SECONDS, REPLICA_HEALTH_INTERVAL, REPLICA_MAX_LAG = get_replica_settings()
+DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING, DB_STATEMENT_CACHE_SIZE = get_db_pool_settings()
+DB_DIAGNOSTICS, DB_SLOW_QUERY_MS, DB_N_PLUS_ONE_THRESHOLD = get_db_diagnostics_settings()
+JWT_SECRET_KEY, JWT_ALGORITHM = get_jwt_settings()
+JWT_CACHE_SIZE = get_jwt_cache_size()
+BCRYPT_ROUNDS, PWD_HASH_EXECUTOR, PWD_HASH_WORKERS, PWD_HASH_QUEUE_SIZE, PWD_HASH_ADMISSION_TIMEOUT = get_pwd_hash_settings()
+REFRESH_TOKEN_SWEEP_INTERVAL, REFRESH_TOKEN_SWEEP_BATCH = get_refresh_token_sweep_settings()
+SEARCH_BACKEND, SEARCH_TEXT_CONFIG = get_search_settings()
+UPVOTE_FLUSH_INTERVAL = get_upvote_flush_interval()
+FEED_CACHE_USERS, FEED_CACHE_ENTRIES, FEED_CACHE_TTL = get_feed_cache_settings()
+COUNTER_RECONCILE_INTERVAL, COUNTER_RECONCILE_BATCH = get_counter_reconcile_settings()
+IMPORT_BATCH_SIZE = get_import_batch_size()
+EXPORT_BATCH_SIZE = get_export_batch_size()
+RESPONSE_CACHE_BACKEND, RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL, REDIS_URL = get_response_cache_settings()
+COMPRESSION_ENABLED, COMPRESSION_ENCODINGS, COMPRESSION_MIN_SIZE, COMPRESSION_LEVEL = get_compression_settings()
\ No newline at end of file
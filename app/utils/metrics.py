@@ -0,0 +1,231 @@
+"""
+Prometheus metin formatında sayaç, gösterge ve histogramlar.
+
+Güncellemeler yalnızca event loop iş parçacığından yapılır; kilit yoktur ve
+bir gözlem birkaç liste/dict işleminden ibarettir. Etiket değerleri sınırlı
+kümelerden gelmelidir (route şablonu, metot, durum kodu), ham URL değil.
+"""
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+# Saniye cinsinden; API gecikmeleri için 1 ms - 10 s.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+
+    @abstractmethod
+    def _new_child(self):
+        ...
+
+    def labels(self, *values: str):
+        # Sıcak yolda tek dict araması; çocuk nesne ilk kullanımda kurulur.
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _labels_for(self, values: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        ...
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def samples(self) -> Iterable[Sample]:
+        for values, child in list(self._children.items()):
+            yield f"{self.name}_total", self._labels_for(values), child.value
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def samples(self) -> Iterable[Sample]:
+        for values, child in list(self._children.items()):
+            yield self.name, self._labels_for(values), child.value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # Son kova +Inf; kümülatif toplam yalnızca çıktı sırasında hesaplanır.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> Iterable[Sample]:
+        for values, child in list(self._children.items()):
+            labels = self._labels_for(values)
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, child.sum
+
+
+class CollectedMetric:
+    """A metric family produced on scrape, e.g. from an existing `stats()` dict."""
+
+    def __init__(self, name: str, help: str, kind: str = "untyped"):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.values: List[Tuple[Dict[str, str], float]] = []
+
+    def add(self, value: float, **labels: str) -> "CollectedMetric":
+        self.values.append((labels, value))
+        return self
+
+
+def stats_metrics(prefix: str, help: str, stats: dict, **labels: str) -> List[CollectedMetric]:
+    """One family per numeric entry of a `stats()` dict; strings and nested values are skipped."""
+    return [
+        CollectedMetric(f"{prefix}_{key}", f"{help}: {key}").add(value, **labels)
+        for key, value in stats.items()
+        if isinstance(value, (int, float))
+    ]
+
+
+class Registry:
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], Iterable[CollectedMetric]]] = []
+
+    def _name(self, name: str) -> str:
+        return f"{self.namespace}_{name}"
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(self._name(name), help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(self._name(name), help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._add(Histogram(self._name(name), help, labelnames, buckets))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn: Callable[[], Iterable[CollectedMetric]]):
+        """Registers a scrape-time callback; the registry namespace is prepended to its names."""
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        # Aynı isimli aileler (ör. replika başına) tek HELP/TYPE bloğu altında toplanır.
+        families: Dict[str, Tuple[str, str, List[Sample]]] = {}
+        for metric in self._metrics:
+            families[metric.name] = (metric.help, metric.kind, list(metric.samples()))
+        for collect in self._collectors:
+            for metric in collect():
+                name = self._name(metric.name)
+                family = families.setdefault(name, (metric.help, metric.kind, []))
+                family[2].extend((name, labels, value) for labels, value in metric.values)
+
+        lines = []
+        for name, (help, kind, samples) in families.items():
+            lines.append(f"# HELP {name} {_escape(help)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry("gazipass")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
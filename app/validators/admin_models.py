@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Annotated
+from pydantic import BaseModel, Field
+
+from validators.post_models import PostRequest
+
+class ImportKind(str, Enum):
+    USERS = "users"
+    TAGS = "tags"
+    POSTS = "posts"
+
+class ImportTagRow(BaseModel):
+    tag: Annotated[str, Field(min_length=1, max_length=50)]
+
+# Bir gönderinin etiket sayısı; içe aktarmada satır başına sınır.
+MAX_IMPORT_TAGS = 20
+
+class ImportPostRow(PostRequest):
+    creator: str
+    tags: Annotated[list[str], Field(max_length=MAX_IMPORT_TAGS)] = []
+
+class ExportKind(str, Enum):
+    USERS = "users"
+    POSTS = "posts"
@@ -36,6 +36,7 @@ class JwtPayload(BaseModel):
     user_id: UUID
     username: str
     roles: list[str] = Field(default_factory=lambda: [UserRole.DEFAULT.name])
+    role_mask: int = UserRole.DEFAULT.mask
     iat: datetime
     exp: datetime
     jti: UUID
\ No newline at end of file
@@ -1,7 +1,40 @@
-from typing import Annotated
+from typing import Annotated, List
+from uuid import UUID
 from pydantic import BaseModel, Field
 
 class PostRequest(BaseModel):
     title: Annotated[str, Field(min_length=3 ,max_length=100)]
     content: Annotated[str, Field(min_length=10)]
-    tags: list[str]
\ No newline at end of file
+    tags: list[str]
+
+class PostCreatorResponse(BaseModel):
+    username: str
+    first_name: str
+    last_name: str
+
+class PostResponse(BaseModel):
+    id: UUID
+    title: str
+    content: str
+    upvotes: int
+    creator_id: UUID
+    creator: PostCreatorResponse | None = None
+    tags: List[str] = []
+    upvoted: bool = False
+    created_at: str
+
+class PostSummaryResponse(BaseModel):
+    id: UUID
+    title: str
+    excerpt: str
+    upvotes: int
+    creator_id: UUID
+    creator: PostCreatorResponse | None = None
+    tags: List[str] = []
+    upvoted: bool = False
+    created_at: str
+
+class UpvoteResponse(BaseModel):
+    post_id: UUID
+    upvotes: int
+    upvoted: bool
@@ -7,10 +7,21 @@ class UserResponse(BaseModel):
     first_name: str
     last_name: str
     roles: List[str]
+    followers_count: int = 0
+    following_count: int = 0
+    posts_count: int = 0
     created_at: str
 
 class UpdateUserRequest(BaseModel):
     email: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    roles: Optional[List[str]] = []
\ No newline at end of file
+    roles: Optional[List[str]] = []
+
+class FollowUserResponse(BaseModel):
+    username: str
+    first_name: str
+    last_name: str
+
+class FollowTagResponse(BaseModel):
+    tag: str